@@ -0,0 +1,76 @@
+import time, importlib
+from typing import Any, Callable, cast
+
+class JSONCodec:
+    # The codecs tried when none is preferred, fastest first. "json" is the stdlib and always available.
+    ORDER = ["orjson", "msgspec", "json"]
+
+    def __init__(self, name: str, loads: Callable[[bytes | str], Any], dumps: Callable[[Any], bytes]) -> None:
+        # name (str): The library backing this codec.
+        self.name = name
+
+        # loads (Callable): Decodes JSON straight from bytes (or a str).
+        self.loads = loads
+
+        # dumps (Callable): Encodes an object into JSON bytes.
+        self.dumps = dumps
+
+    def load(self, path: str) -> Any:
+        with open(path, mode="rb") as f:
+            return self.loads(f.read())
+
+    def dump(self, path: str, obj: Any, body: bytes | None = None) -> None:
+        """Writes `body` as-is when the original response bytes are available, otherwise encodes `obj`."""
+        with open(path, mode="wb") as f:
+            f.write(body if body is not None else self.dumps(obj))
+
+    @staticmethod
+    def create(name: str) -> "JSONCodec | None":
+        try:
+            library = importlib.import_module(name)
+        except ImportError:
+            return None
+
+        match name:
+            case "orjson":
+                return JSONCodec(name, library.loads, library.dumps)
+            case "msgspec":
+                return JSONCodec(name, library.json.Decoder().decode, library.json.Encoder().encode)
+            case "json":
+                return JSONCodec(name, library.loads, lambda obj: library.dumps(obj).encode("utf-8"))
+            case _:
+                return None
+
+    @classmethod
+    def available(cls) -> list["JSONCodec"]:
+        return [codec for name in cls.ORDER if (codec := cls.create(name))]
+
+    @classmethod
+    def get(cls, preferred: str | None = None) -> "JSONCodec":
+        for name in ([preferred] if preferred else []) + cls.ORDER:
+            if codec := cls.create(name):
+                return codec
+
+        return cast(JSONCodec, cls.create("json"))
+
+    @classmethod
+    def benchmark(cls, payloads: dict[str, bytes], rounds: int | None = 20) -> list[tuple[str, str, float, float]]:
+        """Times every available codec over the given raw payloads. Returns (codec, payload, decode ms, encode ms) rows."""
+        rounds = rounds or 20
+        results = []
+
+        for codec in cls.available():
+            for payload_name, body in payloads.items():
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    obj = codec.loads(body)
+                decode_time = (time.perf_counter() - started) / rounds
+
+                started = time.perf_counter()
+                for _ in range(rounds):
+                    codec.dumps(obj)
+                encode_time = (time.perf_counter() - started) / rounds
+
+                results.append((codec.name, payload_name, decode_time * 1000, encode_time * 1000))
+
+        return results
@@ -1,12 +1,17 @@
 from __future__ import annotations
-import os, asyncio, json
+import os, asyncio, time, random, heapq, bisect, hashlib, zlib, pickle, tracemalloc, multiprocessing, threading, tempfile
 import urllib.parse
 import issutilities.actions as do
 import discord, discord.utils as utils
-from discord.ext import commands, tasks
+import numpy as np
+from discord.ext import commands
 from rapidfuzz import process as rfp
-from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Literal, cast
+from codec import JSONCodec
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from collections import deque
+from contextlib import aclosing, suppress
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, Iterator, Literal, cast
 
 if TYPE_CHECKING:
     import objects
@@ -14,7 +19,1954 @@ if TYPE_CHECKING:
 
 name = (os.path.basename(__file__)).replace(".py", "")
 
+class PlanetHistory:
+    # The amount of (timestamp, health) samples kept per planet. At one sample per 10s tick, this is a 30 minute window.
+    SIZE = 180
+
+    # The history kept inside a process pool worker when the liberation math is offloaded to one.
+    worker: PlanetHistory | None = None
+
+    def __init__(self, size: int | None = 0) -> None:
+        size = cast(int, size)
+
+        # Ring buffer of health samples, one row per planet id and one column per tick. Timestamps are shared by every planet.
+        self.health = np.full((size, self.SIZE), np.nan)
+        self.timestamps = np.full(self.SIZE, np.nan)
+        self.cursor: int = 0
+
+        # The owner of each planet as of the last sample.
+        self.owner = np.zeros(size, dtype=np.int16)
+
+    def record(self, timestamp: float, table: PlanetTable) -> None:
+        # The health resets when a planet changes hands, so older samples would skew the fit.
+        self.health[self.owner != table.owner] = np.nan
+        self.owner[:] = table.owner
+
+        self.timestamps[self.cursor] = timestamp
+        self.health[:, self.cursor] = np.where(table.has_status, table.health, np.nan)
+        self.cursor = (self.cursor + 1) % self.SIZE
+
+    @classmethod
+    def fit(cls, table: PlanetTable, now: datetime, record: bool) -> PlanetTable:
+        """Runs in a process pool worker. Only the flat table crosses the process boundary; the history stays in the worker."""
+        if cls.worker is None or cls.worker.owner.size != table.size:
+            cls.worker = cls(table.size)
+
+        if record:
+            cls.worker.record(now.timestamp(), table)
+
+        table.recalculate(cls.worker, now)
+
+        return table
+
+class PlanetTable:
+    # The least amount of samples a planet needs before a rate is fitted.
+    MIN_SAMPLES = 3
+
+    # The range of timestamps that can still be converted into a datetime.
+    MIN_TIMESTAMP = datetime.min.replace(tzinfo=timezone.utc).timestamp()
+    MAX_TIMESTAMP = datetime.max.replace(tzinfo=timezone.utc).timestamp()
+
+    def __init__(self, size: int | None = 0) -> None:
+        size = cast(int, size)
+
+        # Columns from the planet infos and statuses, indexed by planet id.
+        self.health = np.zeros(size)
+        self.max_health = np.ones(size)
+        self.regen = np.zeros(size)
+        self.players = np.zeros(size, dtype=np.int64)
+        self.owner = np.zeros(size, dtype=np.int16)
+        self.has_status = np.zeros(size, dtype=bool)
+
+        # Calculated columns, indexed by planet id.
+        self.liberation = np.zeros(size)
+        self.raw_rate = np.zeros(size)
+        self.net_rate = np.zeros(size)
+        self.rate = np.zeros(size)
+        self.estimated_liberation_timestamp = np.full(size, np.nan)
+
+    @property
+    def size(self) -> int:
+        return len(self.health)
+
+    def assign_calculated(self, other: PlanetTable) -> None:
+        self.liberation[:] = other.liberation
+        self.raw_rate[:] = other.raw_rate
+        self.net_rate[:] = other.net_rate
+        self.rate[:] = other.rate
+        self.estimated_liberation_timestamp[:] = other.estimated_liberation_timestamp
+
+    @classmethod
+    def from_planets(cls, planets: list[HD2.Objects.Planet]) -> PlanetTable:
+        table = cls(max((planet.id for planet in planets), default=-1) + 1)
+
+        ids = np.fromiter((planet.id for planet in planets), dtype=np.intp, count=len(planets))
+        table.max_health[ids] = np.fromiter((planet.max_health for planet in planets), dtype=np.float64, count=len(planets))
+
+        return table
+
+    def load(self, planet_statuses: list[HD2.Objects.PlanetStatus]) -> None:
+        count = len(planet_statuses)
+        ids = np.fromiter((planet_status.raw_planet for planet_status in planet_statuses), dtype=np.intp, count=count)
+
+        self.health[ids] = np.fromiter((planet_status.current_health for planet_status in planet_statuses), dtype=np.float64, count=count)
+        self.regen[ids] = np.fromiter((planet_status.regen_per_second for planet_status in planet_statuses), dtype=np.float64, count=count)
+        self.players[ids] = np.fromiter((planet_status.players for planet_status in planet_statuses), dtype=np.int64, count=count)
+        self.owner[ids] = np.fromiter((planet_status.raw_current_faction for planet_status in planet_statuses), dtype=np.int16, count=count)
+        self.has_status[:] = False
+        self.has_status[ids] = True
+
+        np.subtract(1, self.health / self.max_health, out=self.liberation)
+
+    def update_row(self, planet_status: HD2.Objects.PlanetStatus) -> None:
+        i = planet_status.raw_planet
+
+        self.health[i] = planet_status.current_health
+        self.regen[i] = planet_status.regen_per_second
+        self.players[i] = planet_status.players
+        self.owner[i] = planet_status.raw_current_faction
+        self.liberation[i] = 1 - (self.health[i] / self.max_health[i])
+
+    def recalculate(self, history: PlanetHistory, now: datetime) -> None:
+        now_timestamp = now.timestamp()
+
+        np.subtract(1, self.health / self.max_health, out=self.liberation)
+
+        # Least-squares slope of health over time for every planet at once, ignoring empty slots.
+        samples = ~np.isnan(history.health) & ~np.isnan(history.timestamps)
+        counts = samples.sum(axis=1)
+
+        times = np.where(samples, history.timestamps - now_timestamp, 0.0)
+        healths = np.where(samples, history.health, 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            time_offsets = np.where(samples, times - (times.sum(axis=1) / counts)[:, None], 0.0)
+            health_offsets = np.where(samples, healths - (healths.sum(axis=1) / counts)[:, None], 0.0)
+            slopes = (time_offsets * health_offsets).sum(axis=1) / (time_offsets * time_offsets).sum(axis=1)
+
+        slopes = np.where((counts >= self.MIN_SAMPLES) & np.isfinite(slopes), slopes, 0.0)
+
+        self.raw_rate[:] = (0.0 - slopes) * 3600.0
+        self.net_rate[:] = self.raw_rate / self.max_health
+        self.rate[:] = self.net_rate + (self.regen * 3600.0) / self.max_health
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            timestamps = now_timestamp + self.health / -slopes
+
+        feasible = (slopes < 0) & np.isfinite(timestamps) & (timestamps > self.MIN_TIMESTAMP) & (timestamps < self.MAX_TIMESTAMP)
+        self.estimated_liberation_timestamp[:] = np.where(feasible, timestamps, np.nan)
+
+class SupplyGraph:
+    def __init__(self, size: int | None = 0) -> None:
+        size = cast(int, size)
+
+        # Supply lines in CSR form: the neighbors of planet i are indices[indptr[i]:indptr[i + 1]], sorted by id.
+        # Waypoints are treated as undirected, since a supply line can be travelled both ways.
+        self.indptr = np.zeros(size + 1, dtype=np.intp)
+        self.indices = np.zeros(0, dtype=np.intp)
+
+        # The source planet of every entry in indices, for vectorized queries over all supply lines.
+        self.sources = np.zeros(0, dtype=np.intp)
+
+        # Plain list copies of indptr/indices. Indexing these is faster than numpy scalars in the BFS loop.
+        self.__indptr: list[int] = self.indptr.tolist()
+        self.__indices: list[int] = []
+
+    @property
+    def size(self) -> int:
+        return len(self.indptr) - 1
+
+    @classmethod
+    def from_planets(cls, planets: list[HD2.Objects.Planet], size: int) -> SupplyGraph:
+        graph = cls(size)
+
+        edges = np.array([(planet.id, planet_id) for planet in planets for planet_id in planet.raw_waypoints if 0 <= planet_id < size and planet_id != planet.id], dtype=np.intp).reshape(-1, 2)
+
+        # Every supply line is keyed as source * size + target in both directions. np.unique sorts the keys by source,
+        # then target, and drops duplicate supply lines.
+        keys = np.unique(np.concatenate([edges[:, 0] * size + edges[:, 1], edges[:, 1] * size + edges[:, 0]]))
+
+        graph.sources, graph.indices = np.divmod(keys, max(size, 1))
+        np.cumsum(np.bincount(graph.sources, minlength=size), out=graph.indptr[1:])
+
+        graph.__indptr = graph.indptr.tolist()
+        graph.__indices = graph.indices.tolist()
+
+        return graph
+
+    def neighbors(self, planet_id: int) -> np.ndarray:
+        if not 0 <= planet_id < self.size:
+            return np.zeros(0, dtype=np.intp)
+
+        return self.indices[self.indptr[planet_id]:self.indptr[planet_id + 1]]
+
+    def shortest_path(self, source: int, target: int) -> list[int] | None:
+        """Breadth-first search over the supply lines. Returns the planet ids from source to target, or None if unreachable."""
+        if not (0 <= source < self.size and 0 <= target < self.size):
+            return None
+
+        indptr, indices = self.__indptr, self.__indices
+        parents = [-1] * self.size
+        parents[source] = source
+        frontier = [source]
+
+        while frontier and parents[target] == -1:
+            next_frontier = []
+
+            for planet_id in frontier:
+                for neighbor in indices[indptr[planet_id]:indptr[planet_id + 1]]:
+                    if parents[neighbor] == -1:
+                        parents[neighbor] = planet_id
+                        next_frontier.append(neighbor)
+
+            frontier = next_frontier
+
+        if parents[target] == -1:
+            return None
+
+        path = [target]
+        while path[-1] != source:
+            path.append(parents[path[-1]])
+
+        return path[::-1]
+
+    def frontline(self, owner: np.ndarray, has_status: np.ndarray) -> np.ndarray:
+        """A mask of every planet with a supply line to a planet held by another faction."""
+        bordering = has_status[self.sources] & has_status[self.indices] & (owner[self.sources] != owner[self.indices])
+
+        return np.bincount(self.sources[bordering], minlength=self.size) > 0
+
+class TerritoryIndex:
+    def __init__(self) -> None:
+        # planets_by_faction (dict[int, dict[int, Planet]]): The planets each faction currently holds, keyed by planet id.
+        self.planets_by_faction: dict[int, dict[int, HD2.Objects.Planet]] = {}
+
+        # sectors_by_faction (dict[int, dict[str, Sector]]): The sectors each faction holds at least one planet in, keyed by sector name.
+        self.sectors_by_faction: dict[int, dict[str, HD2.Objects.Sector]] = {}
+
+        # owner_counts_by_sector (dict[str, dict[int, int]]): How many planets each faction holds in every sector.
+        self.owner_counts_by_sector: dict[str, dict[int, int]] = {}
+
+        # players_by_sector (dict[str, int]) / players_by_faction (dict[int, int]): Helldivers active on the planets of a sector or faction.
+        self.players_by_sector: dict[str, int] = {}
+        self.players_by_faction: dict[int, int] = {}
+
+        # The (owner, players) that each planet was last counted with.
+        self.counted: dict[int, tuple[int, int]] = {}
+
+    def build(self, planet_statuses: list[HD2.Objects.PlanetStatus]) -> None:
+        for group_by in [self.planets_by_faction, self.sectors_by_faction, self.owner_counts_by_sector, self.players_by_sector, self.players_by_faction, self.counted]:
+            group_by.clear()
+
+        for planet_status in planet_statuses:
+            self.update(planet_status)
+
+    def update(self, planet_status: HD2.Objects.PlanetStatus) -> HD2.Objects.Sector | None:
+        """Moves a planet between groups if its owner or player count changed. Returns its sector if the sector's set of owners changed."""
+        planet = planet_status.planet
+        counted = (planet_status.raw_current_faction, planet_status.players)
+
+        if (previous := self.counted.get(planet.id)) == counted:
+            return None
+
+        self.counted[planet.id] = counted
+
+        owners_changed = self.count(planet, *previous, -1) if previous else False
+        owners_changed = self.count(planet, *counted, 1) or owners_changed
+
+        return planet.sector if owners_changed else None
+
+    def count(self, planet: HD2.Objects.Planet, owner: int, players: int, sign: int) -> bool:
+        sector = planet.sector
+
+        owner_counts = self.owner_counts_by_sector.setdefault(sector.name, {})
+        owner_count = owner_counts.get(owner, 0) + sign
+
+        planets = self.planets_by_faction.setdefault(owner, {})
+        sectors = self.sectors_by_faction.setdefault(owner, {})
+
+        if sign > 0:
+            planets[planet.id] = planet
+        else:
+            planets.pop(planet.id, None)
+
+        if owner_count > 0:
+            owner_counts[owner] = owner_count
+            sectors[sector.name] = sector
+        else:
+            owner_counts.pop(owner, None)
+            sectors.pop(sector.name, None)
+
+        self.players_by_sector[sector.name] = self.players_by_sector.get(sector.name, 0) + sign * players
+        self.players_by_faction[owner] = self.players_by_faction.get(owner, 0) + sign * players
+
+        # Only the first planet in or the last planet out changes who holds the sector.
+        return owner_count == (1 if sign > 0 else 0)
+
+class LoopLag:
+    # How often the event loop is sampled, and how many samples are kept. 1200 samples at 50ms is the last minute.
+    INTERVAL = 0.05
+    SIZE = 1200
+
+    def __init__(self) -> None:
+        # lag (np.ndarray): How late every sleep woke up, in seconds.
+        self.lag = np.zeros(self.SIZE)
+
+        # during_refresh (np.ndarray): Whether a cache refresh started or was running while the sample was taken.
+        self.during_refresh = np.zeros(self.SIZE, dtype=bool)
+
+        self.count: int = 0
+        self.refreshes: int = 0
+        self.refreshing: bool = False
+
+        self.task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self.run())
+
+    def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+
+        while True:
+            refreshes = self.refreshes
+            before = loop.time()
+
+            await asyncio.sleep(self.INTERVAL)
+
+            i = self.count % self.SIZE
+            self.lag[i] = max(0.0, loop.time() - before - self.INTERVAL)
+            self.during_refresh[i] = self.refreshing or refreshes != self.refreshes
+            self.count += 1
+
+    def report(self) -> list[str]:
+        def describe(lag: np.ndarray) -> str:
+            if lag.size == 0:
+                return "`n/a`"
+
+            return f"`{lag.mean():.2f} ms` avg, `{np.percentile(lag, 99):.2f} ms` p99, `{lag.max():.2f} ms` max"
+
+        samples = min(self.count, self.SIZE)
+        lag = self.lag[:samples] * 1000
+        during_refresh = self.during_refresh[:samples]
+
+        return [
+            f"- **Loop Lag** (last `{samples * self.INTERVAL:.0f}s`): {describe(lag)}",
+            f" - **During Refreshes:** {describe(lag[during_refresh])}",
+            f" - **Otherwise:** {describe(lag[~during_refresh])}",
+        ]
+
+class PollJob:
+    def __init__(self, name: str, callback: Callable[[], Awaitable[bool]], interval: float, boost: bool | None = False) -> None:
+        # name (str): The value this job polls, matching its key in CacheBuffer.payloads.
+        self.name = name
+
+        # callback (Callable[[], Awaitable[bool]]): Fetches and stages the value. Returns whether it changed.
+        self.callback = callback
+
+        # base_interval (float): The interval while the value keeps changing. Overridden by GameClientConfiguration when mapped.
+        # default_interval (float): The interval this job was created with.
+        self.base_interval: float = interval
+        self.default_interval: float = interval
+
+        # interval (float): The interval that was used to schedule next_run, after backoff, event speed-up and jitter.
+        self.interval: float = interval
+
+        # boost (bool): Whether this job speeds up while events are active.
+        self.boost = bool(boost)
+
+        # next_run (float): The timestamp this job is due at.
+        self.next_run: float = 0.0
+
+        # last_run (float | None) / last_duration (float): When this job last ran and how long it took, in seconds.
+        self.last_run: float | None = None
+        self.last_duration: float = 0.0
+
+        # last_success (float): When this job last ran without raising (or when its warm-started dump was written).
+        self.last_success: float = 0.0
+
+        self.runs: int = 0
+        self.errors: int = 0
+
+        # failures (int): How many runs in a row raised. Only the first failure of a streak is reported.
+        self.failures: int = 0
+
+        # unchanged (int): How many runs in a row returned an unchanged value.
+        self.unchanged: int = 0
+
+class PollScheduler:
+    # Intervals are jittered by up to ±10%, grow 1.5x per unchanged run up to 4x, and halve for boosted jobs during events.
+    JITTER = 0.1
+    BACKOFF = 1.5
+    MAX_BACKOFF = 4.0
+    EVENT_SPEEDUP = 0.5
+
+    # A value is stale once its job has gone this many base intervals without a successful run.
+    STALE_AFTER = 3
+    MIN_INTERVAL = 5.0
+
+    # Jobs run independently. Ones that finish within this many seconds of each other share one refresh.
+    BATCH_WINDOW = 0.25
+
+    def __init__(
+        self,
+        on_batch: Callable[[bool], Awaitable[None]],
+        on_error: Callable[[PollJob, BaseException], Awaitable[None]],
+        on_scheduled: Callable[[PollJob], None],
+        events_active: Callable[[], bool],
+    ) -> None:
+        # jobs (dict[str, PollJob]): Every job, by name.
+        self.jobs: dict[str, PollJob] = {}
+
+        # queue (list[tuple[float, int, str]]): A heap of (next_run, tiebreaker, job name).
+        self.queue: list[tuple[float, int, str]] = []
+        self.__pushed: int = 0
+
+        # wake (asyncio.Event): Set when a job is brought forward, so run() doesn't sleep through it.
+        self.wake = asyncio.Event()
+
+        # running (dict[str, asyncio.Task]): The jobs currently running, by name. A slow job never holds up the others.
+        self.running: dict[str, asyncio.Task] = {}
+
+        # completed (list[PollJob]) / batch_changed (bool): The jobs finished since the last refresh, and whether any changed.
+        self.completed: list[PollJob] = []
+        self.batch_changed: bool = False
+        self.batch_task: asyncio.Task | None = None
+
+        # last_batch (list[str]) / last_batch_duration (float): The jobs that last shared a refresh and the longest of their runs, in seconds.
+        self.last_batch: list[str] = []
+        self.last_batch_duration: float = 0.0
+
+        # value_ids (dict[int, str]): Which job each GameClientConfiguration polling id32 configures.
+        self.value_ids: dict[int, str] = dict(HD2.Types.PollingValue)
+
+        self.on_batch = on_batch
+        self.on_error = on_error
+        self.on_scheduled = on_scheduled
+        self.events_active = events_active
+
+    def add(self, job: PollJob) -> None:
+        self.jobs[job.name] = job
+
+    def schedule(self, job: PollJob, next_run: float) -> None:
+        # Rescheduling a queued job leaves its old entry behind. run() skips entries that no longer match job.next_run.
+        job.next_run = next_run
+        self.__pushed += 1
+        heapq.heappush(self.queue, (next_run, self.__pushed, job.name))
+
+        # The new entry may be due before whatever run() is sleeping until.
+        self.wake.set()
+
+    def run_now(self, job: PollJob) -> None:
+        self.schedule(job, utils.utcnow().timestamp())
+
+    def configure(self, polling_configuration: list[HD2.Objects.PollingConfiguration]) -> None:
+        intervals = sorted({polling.interval for polling in polling_configuration if polling.interval > 0})
+        mapped = {job_name: polling.interval for polling in polling_configuration if (job_name := self.value_ids.get(polling.id_32)) and polling.interval > 0}
+
+        for job in self.jobs.values():
+            if job.name in mapped:
+                job.base_interval = mapped[job.name]
+            elif intervals:
+                # Unmapped jobs take the configured interval closest to their default (by ratio), so they follow the
+                # game client's fast and slow tiers instead of keeping their hardcoded defaults.
+                job.base_interval = min(intervals, key=lambda interval: abs(np.log(interval / job.default_interval)))
+            else:
+                job.base_interval = job.default_interval
+
+    def next_interval(self, job: PollJob, changed: bool) -> float:
+        job.unchanged = 0 if changed else job.unchanged + 1
+
+        interval = job.base_interval * min(self.BACKOFF ** job.unchanged, self.MAX_BACKOFF)
+
+        if job.boost and self.events_active():
+            interval *= self.EVENT_SPEEDUP
+
+        return max(interval, self.MIN_INTERVAL) * random.uniform(1 - self.JITTER, 1 + self.JITTER)
+
+    async def run_job(self, job: PollJob) -> bool:
+        started = time.perf_counter()
+        changed = False
+
+        try:
+            changed = await job.callback()
+            job.failures = 0
+            job.last_success = utils.utcnow().timestamp()
+        except Exception as exc:
+            job.errors += 1
+            job.failures += 1
+
+            if job.failures == 1:
+                await self.on_error(job, exc)
+
+        job.runs += 1
+        job.last_run = utils.utcnow().timestamp()
+        job.last_duration = time.perf_counter() - started
+        job.interval = self.next_interval(job, changed)
+
+        self.schedule(job, job.last_run + job.interval)
+        self.on_scheduled(job)
+
+        return changed
+
+    async def complete(self, job: PollJob) -> None:
+        self.batch_changed = await self.run_job(job) or self.batch_changed
+        self.completed.append(job)
+
+        if self.batch_task is None or self.batch_task.done():
+            self.batch_task = asyncio.create_task(self.flush_batch())
+
+    async def flush_batch(self) -> None:
+        # Jobs that finish while a refresh is running are picked up by the next pass instead of starting another one.
+        while self.completed:
+            await asyncio.sleep(self.BATCH_WINDOW)
+
+            batch, self.completed = self.completed, []
+            changed, self.batch_changed = self.batch_changed, False
+
+            self.last_batch = [job.name for job in batch]
+            self.last_batch_duration = max(job.last_duration for job in batch)
+
+            await self.on_batch(changed)
+
+    async def run(self) -> None:
+        try:
+            while self.queue or self.running:
+                delay = self.queue[0][0] - utils.utcnow().timestamp() if self.queue else None
+
+                if delay is None or delay > 0:
+                    self.wake.clear()
+
+                    try:
+                        await asyncio.wait_for(self.wake.wait(), delay)
+                    except TimeoutError:
+                        pass
+
+                    continue
+
+                # Every due job runs as a task of its own and is rescheduled as soon as it finishes. Failures are handled
+                # per job by run_job, so one failing or hanging endpoint doesn't affect the others.
+                now = utils.utcnow().timestamp()
+
+                while self.queue and self.queue[0][0] <= now:
+                    next_run, _, job_name = heapq.heappop(self.queue)
+
+                    # A job that is still running reschedules itself when it finishes.
+                    if next_run != (job := self.jobs[job_name]).next_run or job_name in self.running:
+                        continue
+
+                    task = self.running[job_name] = asyncio.create_task(self.complete(job))
+                    task.add_done_callback(lambda _, job_name=job_name: self.running.pop(job_name, None))
+        finally:
+            for task in [*self.running.values(), self.batch_task]:
+                if task:
+                    task.cancel()
+
+    def stale_since(self, job_names: list[str]) -> float | None:
+        """The oldest last success among the given jobs, if any of them has missed STALE_AFTER polls in a row.
+        Jobs that have never succeeded have nothing to report, and are skipped."""
+        now = utils.utcnow().timestamp()
+
+        stale = [
+            job.last_success for job_name in job_names
+            if (job := self.jobs.get(job_name)) and job.last_success > 0 and now - job.last_success > job.base_interval * self.STALE_AFTER
+        ]
+
+        return min(stale) if stale else None
+
+class CircuitBreaker:
+    # An endpoint's circuit opens after THRESHOLD failed fetches in a row. While open, fetches fail fast without a request.
+    # After the cooldown one trial request is let through, and the cooldown doubles every time the trial fails.
+    THRESHOLD = 3
+    COOLDOWN = 30.0
+    MAX_COOLDOWN = 600.0
+
+    def __init__(self) -> None:
+        # failures (dict[str, int]): Failed fetches in a row, per key.
+        self.failures: dict[str, int] = {}
+
+        # open_until (dict[str, float]): When each open circuit lets its next trial request through.
+        self.open_until: dict[str, float] = {}
+
+        # cooldowns (dict[str, float]): The current cooldown of each open circuit.
+        self.cooldowns: dict[str, float] = {}
+
+        # rejected (int): How many fetches failed fast because their circuit was open.
+        self.rejected: int = 0
+
+    def allow(self, key: str) -> bool:
+        if (open_until := self.open_until.get(key)) is None:
+            return True
+
+        if time.monotonic() < open_until:
+            self.rejected += 1
+            return False
+
+        # Half-open: this request is the trial. Until it finishes, nothing else is let through.
+        self.open_until[key] = time.monotonic() + self.cooldowns[key]
+        return True
+
+    def success(self, key: str) -> None:
+        self.failures.pop(key, None)
+        self.open_until.pop(key, None)
+        self.cooldowns.pop(key, None)
+
+    def failure(self, key: str) -> None:
+        self.failures[key] = self.failures.get(key, 0) + 1
+
+        if key in self.cooldowns:
+            self.cooldowns[key] = min(self.cooldowns[key] * 2, self.MAX_COOLDOWN)
+        elif self.failures[key] >= self.THRESHOLD:
+            self.cooldowns[key] = self.COOLDOWN
+        else:
+            return
+
+        self.open_until[key] = time.monotonic() + self.cooldowns[key]
+
+    def report(self) -> list[str]:
+        now = time.monotonic()
+
+        return [
+            f" - `{key}`: `{self.failures.get(key, 0)}` failures, retrying in `{max(open_until - now, 0):.0f}s`"
+            for key, open_until in self.open_until.items()
+        ]
+
+class WarEvents:
+    # Liberation milestones, as fractions. An event is published whenever a planet moves past one of them.
+    THRESHOLDS = [0.25, 0.5, 0.75, 0.9]
+
+    # The faction that liberation is measured against. Planets it holds are being defended, not liberated.
+    HUMAN = 1
+
+    class Event:
+        __slots__ = ("war_id", "version", "timestamp")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float) -> None:
+            # war_id (int | None): The war (season) the event happened in.
+            self.war_id: int | None = war_id
+
+            # version (int): The CacheBuffer version whose refresh produced the event.
+            self.version: int = version
+
+            # timestamp (float): When the refresh that noticed the change ran.
+            self.timestamp: float = timestamp
+
+        def __repr__(self) -> str:
+            slots = [slot for cls in reversed(type(self).__mro__) for slot in getattr(cls, "__slots__", ())]
+            return f"{type(self).__name__}({', '.join(f'{key}={getattr(self, key)!r}' for key in slots)})"
+
+    class PlanetFlipped(Event):
+        __slots__ = ("planet_id", "planet_name", "old_owner", "new_owner")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float, planet_id: int, planet_name: str, old_owner: str, new_owner: str) -> None:
+            super().__init__(war_id, version, timestamp)
+
+            # planet_id (int): The id of the planet that changed hands.
+            self.planet_id: int = planet_id
+
+            # planet_name (str): The name of the planet.
+            self.planet_name: str = planet_name
+
+            # old_owner (str): The name of the faction that lost the planet.
+            self.old_owner: str = old_owner
+
+            # new_owner (str): The name of the faction that now holds the planet.
+            self.new_owner: str = new_owner
+
+    class LiberationCrossed(Event):
+        __slots__ = ("planet_id", "planet_name", "owner", "threshold", "liberation")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float, planet_id: int, planet_name: str, owner: str, threshold: float, liberation: float) -> None:
+            super().__init__(war_id, version, timestamp)
+
+            # planet_id (int): The id of the planet being liberated.
+            self.planet_id: int = planet_id
+
+            # planet_name (str): The name of the planet.
+            self.planet_name: str = planet_name
+
+            # owner (str): The name of the faction holding the planet.
+            self.owner: str = owner
+
+            # threshold (float): The milestone that was crossed, as a fraction.
+            self.threshold: float = threshold
+
+            # liberation (float): The liberation of the planet now, as a fraction.
+            self.liberation: float = liberation
+
+    class CampaignStarted(Event):
+        __slots__ = ("campaign_id", "planet_id", "planet_name", "type")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float, campaign_id: int, planet_id: int, planet_name: str, type: str) -> None:
+            super().__init__(war_id, version, timestamp)
+
+            # campaign_id (int): The id of the new campaign.
+            self.campaign_id: int = campaign_id
+
+            # planet_id (int): The id of the planet the campaign is on.
+            self.planet_id: int = planet_id
+
+            # planet_name (str): The name of the planet.
+            self.planet_name: str = planet_name
+
+            # type (str): The campaign type.
+            self.type: str = type
+
+    class MajorOrderIssued(Event):
+        __slots__ = ("order_id", "title", "message", "expires_at")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float, order_id: int, title: str, message: str, expires_at: datetime) -> None:
+            super().__init__(war_id, version, timestamp)
+
+            # order_id (int): The id of the new major order.
+            self.order_id: int = order_id
+
+            # title (str): The title of the major order.
+            self.title: str = title
+
+            # message (str): The message content of the major order.
+            self.message: str = message
+
+            # expires_at (datetime): When the major order expires.
+            self.expires_at: datetime = expires_at
+
+    class MajorOrderExpired(Event):
+        __slots__ = ("order_id", "title")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float, order_id: int, title: str) -> None:
+            super().__init__(war_id, version, timestamp)
+
+            # order_id (int): The id of the major order that is no longer listed.
+            self.order_id: int = order_id
+
+            # title (str): The title of the major order.
+            self.title: str = title
+
+    class NewsPosted(Event):
+        __slots__ = ("post_id", "message")
+
+        def __init__(self, war_id: int | None, version: int, timestamp: float, post_id: int, message: str) -> None:
+            super().__init__(war_id, version, timestamp)
+
+            # post_id (int): The id of the news post.
+            self.post_id: int = post_id
+
+            # message (str): The message content of the post.
+            self.message: str = message
+
+    @classmethod
+    def diff(cls, old: Cache, new: Cache, war_id: int | None, version: int) -> list[WarEvents.Event]:
+        """Computes what changed between two published snapshots. Events only hold plain values, never cache objects,
+        since a snapshot is rebuilt in place two refreshes later."""
+        events: list[WarEvents.Event] = []
+
+        if not old.ready or not new.ready:
+            return events
+
+        now = time.time()
+
+        def planet_name(planet_id: int) -> str:
+            return planet.name if (planet := new.planets_by_id.get(planet_id)) else str(planet_id)
+
+        def faction_name(faction_id: int) -> str:
+            return HD2.Mappings.Factions.get(faction_id, HD2.Mappings.Factions[0])["name"]
+
+        old_table, new_table = old.planet_table, new.planet_table
+
+        # A new WarInfo can resize the table, in which case the planets can't be compared by id.
+        if old_table.size == new_table.size:
+            tracked = old_table.has_status & new_table.has_status
+
+            for planet_id in np.flatnonzero(tracked & (old_table.owner != new_table.owner)).tolist():
+                events.append(cls.PlanetFlipped(war_id, version, now, planet_id, planet_name(planet_id), faction_name(int(old_table.owner[planet_id])), faction_name(int(new_table.owner[planet_id]))))
+
+            liberating = tracked & (old_table.owner == new_table.owner) & (new_table.owner != cls.HUMAN)
+
+            for threshold in cls.THRESHOLDS:
+                for planet_id in np.flatnonzero(liberating & (old_table.liberation < threshold) & (new_table.liberation >= threshold)).tolist():
+                    events.append(cls.LiberationCrossed(war_id, version, now, planet_id, planet_name(planet_id), faction_name(int(new_table.owner[planet_id])), threshold, float(new_table.liberation[planet_id])))
+
+        for campaign_id, campaign in new.campaigns_by_id.items():
+            if campaign_id not in old.campaigns_by_id:
+                # Some campaign types depend on whether the planet is held by humans (a defense) or not (a liberation).
+                campaign_type = campaign.type.get(int(new_table.owner[campaign.raw_planet]) == cls.HUMAN, "Unknown") if type(campaign.type) == dict else campaign.type
+                events.append(cls.CampaignStarted(war_id, version, now, campaign_id, campaign.raw_planet, planet_name(campaign.raw_planet), campaign_type))
+
+        old_orders = {order.id: order for order in old.MajorOrders.orders}
+        new_orders = {order.id: order for order in new.MajorOrders.orders}
+
+        for order_id, order in new_orders.items():
+            if order_id not in old_orders:
+                events.append(cls.MajorOrderIssued(war_id, version, now, order_id, order.title, order.message, order.expires_at))
+
+        for order_id, order in old_orders.items():
+            if order_id not in new_orders:
+                events.append(cls.MajorOrderExpired(war_id, version, now, order_id, order.title))
+
+        # The news feed is optional, and the first one fetched is only a baseline.
+        if (old_news := getattr(old, "NewsFeed", None)) and (new_news := getattr(new, "NewsFeed", None)) and old_news is not new_news:
+            old_post_ids = {post.id for post in old_news.posts}
+
+            for post in new_news.posts:
+                if post.id not in old_post_ids:
+                    events.append(cls.NewsPosted(war_id, version, now, post.id, post.message))
+
+        return events
+
+class EventSubscription:
+    def __init__(self, bus: EventBus, kinds: tuple[type[WarEvents.Event], ...], predicate: Callable[[WarEvents.Event], bool] | None, size: int) -> None:
+        self.bus = bus
+
+        # kinds (tuple[type[Event], ...]): The event types delivered. Empty for every type.
+        self.kinds = kinds
+
+        # predicate (Callable | None): A further filter, run on the event loop for every matching event. Keep it cheap.
+        self.predicate = predicate
+
+        # queue (asyncio.Queue): Bounded, so a subscriber that falls behind loses its oldest events instead of holding anything up.
+        self.queue: asyncio.Queue[WarEvents.Event | None] = asyncio.Queue(size)
+
+        # dropped (int): The amount of events discarded because the queue was full.
+        self.dropped: int = 0
+
+        # task (asyncio.Task | None): The consumer started by EventBus.listen, if any.
+        self.task: asyncio.Task | None = None
+
+        self.closed: bool = False
+
+    def matches(self, event: WarEvents.Event) -> bool:
+        return (not self.kinds or isinstance(event, self.kinds)) and (self.predicate is None or self.predicate(event))
+
+    def offer(self, event: WarEvents.Event | None) -> bool:
+        dropped = False
+
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped += 1
+            dropped = True
+
+        self.queue.put_nowait(event)
+
+        return dropped
+
+    def close(self) -> None:
+        self.bus.unsubscribe(self)
+
+    def __aiter__(self) -> EventSubscription:
+        return self
+
+    async def __anext__(self) -> WarEvents.Event:
+        if self.closed and self.queue.empty():
+            raise StopAsyncIteration
+
+        # None is queued on close, so a waiting consumer wakes up and stops.
+        if (event := await self.queue.get()) is None:
+            raise StopAsyncIteration
+
+        return event
+
+class EventBus:
+    # How many undelivered events a subscriber can have before its oldest ones are dropped.
+    SIZE = 256
+
+    def __init__(self, on_error: Callable[[BaseException], Awaitable[None]]) -> None:
+        self.subscriptions: list[EventSubscription] = []
+
+        # on_error (Callable): Reports exceptions raised by listen callbacks and predicates.
+        self.on_error = on_error
+
+        self.published: int = 0
+        self.delivered: int = 0
+        self.dropped: int = 0
+
+    def subscribe(self, *kinds: type[WarEvents.Event], predicate: Callable[[WarEvents.Event], bool] | None = None, size: int | None = None) -> EventSubscription:
+        """Returns a subscription to `async for` over. Only events of the given types (all when none are given) that
+        pass the predicate are queued."""
+        subscription = EventSubscription(self, kinds, predicate, size or self.SIZE)
+        self.subscriptions.append(subscription)
+
+        return subscription
+
+    def listen(self, callback: Callable[[WarEvents.Event], Awaitable[Any]], *kinds: type[WarEvents.Event], predicate: Callable[[WarEvents.Event], bool] | None = None, size: int | None = None) -> EventSubscription:
+        """Like subscribe, but awaits the callback for every event in a task of its own."""
+        subscription = self.subscribe(*kinds, predicate=predicate, size=size)
+
+        async def consume() -> None:
+            async for event in subscription:
+                try:
+                    await callback(event)
+                except Exception as exc:
+                    await self.on_error(exc)
+
+        subscription.task = asyncio.create_task(consume())
+
+        return subscription
+
+    def unsubscribe(self, subscription: EventSubscription) -> None:
+        if subscription.closed:
+            return
+
+        subscription.closed = True
+        self.subscriptions.remove(subscription)
+        subscription.offer(None)
+
+        if subscription.task:
+            subscription.task.cancel()
+
+    def publish(self, events: list[WarEvents.Event]) -> None:
+        """Queues the events for every matching subscriber. Never awaits, so the refresh doesn't wait on anyone."""
+        if not events:
+            return
+
+        self.published += len(events)
+
+        for subscription in list(self.subscriptions):
+            for event in events:
+                try:
+                    if not subscription.matches(event):
+                        continue
+                except Exception as exc:
+                    asyncio.create_task(self.on_error(exc))
+                    continue
+
+                self.delivered += 1
+
+                if subscription.offer(event):
+                    self.dropped += 1
+
+    def close(self) -> None:
+        for subscription in list(self.subscriptions):
+            subscription.close()
+
+    def report(self) -> list[str]:
+        return [
+            f"- **Events:** `{self.published}` published, `{self.delivered}` delivered to `{len(self.subscriptions)}` subscribers, `{self.dropped}` dropped",
+        ]
+
+class RateLimitBucket:
+    # Added to every window, since the limit is enforced on Discord's end and sleeps can wake a little early.
+    MARGIN = 0.05
+
+    def __init__(self, limit: int, per: float) -> None:
+        # limit (int): How many requests the route allows per window.
+        self.limit = limit
+
+        # per (float): The length of the window, in seconds.
+        self.per = per
+
+        # granted (deque[float]): When the last `limit` requests were (or are scheduled to be) sent. Includes the ones
+        # still waiting, so requests queue up behind each other.
+        self.granted: deque[float] = deque(maxlen=limit)
+
+    def reserve(self) -> float:
+        """Schedules a request so that no window of `per` seconds ever holds more than `limit` of them.
+        Returns how long to wait before sending it, in seconds."""
+        now = time.monotonic()
+
+        send_at = now if len(self.granted) < self.limit else max(now, self.granted[0] + self.per + self.MARGIN)
+        self.granted.append(send_at)
+
+        return send_at - now
+
+    async def acquire(self) -> None:
+        if (delay := self.reserve()) > 0:
+            await asyncio.sleep(delay)
+
+class BroadcastTarget:
+    __slots__ = ("guild_id", "channel_id", "alerts", "webhook_url")
+
+    def __init__(self, guild_id: int, channel_id: int, alerts: list[str], webhook_url: str | None = None) -> None:
+        # guild_id (int): The guild that opted in.
+        self.guild_id: int = guild_id
+
+        # channel_id (int): The channel alerts are sent to.
+        self.channel_id: int = channel_id
+
+        # alerts (list[str]): The alert categories the guild wants, from Broadcaster.ALERTS.
+        self.alerts: list[str] = alerts
+
+        # webhook_url (str | None): A webhook in the channel, used instead of a channel send when set.
+        self.webhook_url: str | None = webhook_url
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"channel": self.channel_id, "alerts": self.alerts, "webhook": self.webhook_url}
+
+class DeliveryStats:
+    __slots__ = ("deliveries", "failures", "consecutive_failures", "total_latency", "last_latency", "max_latency", "last_error", "last_delivered")
+
+    def __init__(self) -> None:
+        self.deliveries: int = 0
+        self.failures: int = 0
+        self.consecutive_failures: int = 0
+
+        # Seconds from the refresh that produced the alerts to the send completing.
+        self.total_latency: float = 0.0
+        self.last_latency: float = 0.0
+        self.max_latency: float = 0.0
+
+        self.last_error: str | None = None
+        self.last_delivered: float | None = None
+
+    def success(self, latency: float) -> None:
+        self.deliveries += 1
+        self.consecutive_failures = 0
+        self.total_latency += latency
+        self.last_latency = latency
+        self.max_latency = max(self.max_latency, latency)
+        self.last_delivered = time.time()
+
+    def failure(self, error: BaseException) -> None:
+        self.failures += 1
+        self.consecutive_failures += 1
+        self.last_error = f"{type(error).__name__}: {error}"
+
+    def report(self) -> str:
+        average = self.total_latency / self.deliveries if self.deliveries else 0.0
+
+        return f"`{self.deliveries}` delivered (`{average:.2f}s` avg, `{self.max_latency:.2f}s` max latency), `{self.failures}` failed{f" • last error: `{self.last_error}`" if self.consecutive_failures else ""}"
+
+class Broadcaster:
+    # The alert categories a guild can opt into, and the events behind each. Sent in this order within a message.
+    ALERTS: dict[str, tuple[type[WarEvents.Event], ...]] = {
+        "orders": (WarEvents.MajorOrderIssued, WarEvents.MajorOrderExpired),
+        "news": (WarEvents.NewsPosted,),
+        "liberation": (WarEvents.PlanetFlipped, WarEvents.LiberationCrossed),
+    }
+
+    # Discord's per-route limits, as (requests, per seconds). Channel sends are bucketed by channel, webhooks by webhook.
+    ROUTE_LIMITS = {"channel": (5, 5.0), "webhook": (5, 2.0)}
+
+    # Kept under Discord's global limit of 50 requests per second, leaving room for commands.
+    GLOBAL_LIMIT = (40, 1.0)
+
+    # How many sends can be in flight at once.
+    CONCURRENCY = 16
+
+    def __init__(self, bot: objects.Bot, events: EventBus, path: str, codec: JSONCodec, on_error: Callable[[BaseException], Awaitable[None]]) -> None:
+        self.bot = bot
+        self.events = events
+        self.path = path
+        self.codec = codec
+        self.on_error = on_error
+
+        # targets (dict[int, BroadcastTarget]): The subscription table, one target per guild.
+        self.targets: dict[int, BroadcastTarget] = {}
+
+        # stats (dict[int, DeliveryStats]): Delivery latency and failures per channel.
+        self.stats: dict[int, DeliveryStats] = {}
+
+        self.buckets: dict[str, RateLimitBucket] = {}
+        self.global_bucket = RateLimitBucket(*self.GLOBAL_LIMIT)
+        self.semaphore = asyncio.Semaphore(self.CONCURRENCY)
+        self.webhooks: dict[str, discord.Webhook] = {}
+        self.save_lock = asyncio.Lock()
+
+        self.subscription: EventSubscription | None = None
+        self.task: asyncio.Task | None = None
+
+        self.batches: int = 0
+        self.rendered: int = 0
+        self.last_batch_duration: float = 0.0
+
+        if os.path.exists(self.path):
+            for guild_id, target in self.codec.load(self.path).items():
+                self.targets[int(guild_id)] = BroadcastTarget(int(guild_id), target["channel"], target["alerts"], target.get("webhook"))
+
+    def start(self) -> None:
+        self.subscription = self.events.subscribe(*[kind for kinds in self.ALERTS.values() for kind in kinds])
+        self.task = asyncio.create_task(self.run())
+
+    def stop(self) -> None:
+        if self.subscription:
+            self.subscription.close()
+
+        if self.task:
+            self.task.cancel()
+
+    async def save(self) -> None:
+        # Saves are serialized, so an older table can never replace a newer one. The file holds webhook tokens, so it is
+        # only readable by the bot (mkstemp creates it 0600) and ignored by git.
+        async with self.save_lock:
+            body = self.codec.dumps({str(guild_id): target.to_dict() for guild_id, target in self.targets.items()})
+
+            def write() -> None:
+                descriptor, temp_path = tempfile.mkstemp(dir=os.path.dirname(self.path), prefix=f"{os.path.basename(self.path)}.", suffix=".tmp")
+
+                try:
+                    with os.fdopen(descriptor, mode="wb") as f:
+                        f.write(body)
+
+                    os.replace(temp_path, self.path)
+                except BaseException:
+                    with suppress(OSError):
+                        os.remove(temp_path)
+
+                    raise
+
+            await asyncio.to_thread(write)
+
+    async def set_target(self, guild_id: int, target: BroadcastTarget | None) -> None:
+        if target is None:
+            self.targets.pop(guild_id, None)
+        else:
+            self.targets[guild_id] = target
+
+        await self.save()
+
+    async def run(self) -> None:
+        subscription = cast(EventSubscription, self.subscription)
+
+        # Everything one refresh published is already queued by the time the first event is read, so it goes out as one batch.
+        async for event in subscription:
+            batch = [event]
+            while not subscription.queue.empty() and (queued := subscription.queue.get_nowait()) is not None:
+                batch.append(queued)
+
+            try:
+                await self.broadcast(batch)
+            except Exception as exc:
+                await self.on_error(exc)
+
+    @staticmethod
+    def render(event: WarEvents.Event) -> str:
+        match event:
+            case WarEvents.MajorOrderIssued():
+                return f"## 📜 New Major Order: {event.title}\n{event.message}\n-# Expires {Converter.to_discord(event.expires_at)}"
+            case WarEvents.MajorOrderExpired():
+                return f"## 📜 Major Order Over: {event.title}"
+            case WarEvents.NewsPosted():
+                return f"## 📰 Dispatch\n{event.message}"
+            case WarEvents.PlanetFlipped():
+                return f"- 🚩 **{event.planet_name}** was {"liberated from the" if event.new_owner == "Human" else f"taken by the {event.new_owner}s from the"} {event.old_owner}s!"
+            case WarEvents.LiberationCrossed():
+                return f"- 🗺️ **{event.planet_name}** is `{event.threshold:.0%}` liberated from the {event.owner}s"
+            case _:
+                return ""
+
+    def compose(self, batch: list[WarEvents.Event]) -> dict[str, str]:
+        """Renders every event in the batch exactly once, grouped by alert category."""
+        rendered: dict[str, list[str]] = {alert: [] for alert in self.ALERTS}
+
+        for event in batch:
+            for alert, kinds in self.ALERTS.items():
+                if isinstance(event, kinds):
+                    rendered[alert].append(self.render(event))
+                    self.rendered += 1
+                    break
+
+        return {alert: "\n".join(lines) for alert, lines in rendered.items() if lines}
+
+    async def broadcast(self, batch: list[WarEvents.Event]) -> None:
+        started = time.perf_counter()
+        produced = min(event.timestamp for event in batch)
+        rendered = self.compose(batch)
+
+        # Every guild gets the categories it opted into, joined from the same rendered text.
+        messages: dict[BroadcastTarget, list[str]] = {}
+        for target in list(self.targets.values()):
+            if text := "\n".join(rendered[alert] for alert in self.ALERTS if alert in rendered and alert in target.alerts):
+                messages[target] = ["\n".join(chunk) for chunk in Utilities.chunk_text(text) if chunk]
+
+        if messages:
+            self.batches += 1
+            await asyncio.gather(*[self.deliver(target, chunks, produced) for target, chunks in messages.items()])
+
+        self.last_batch_duration = time.perf_counter() - started
+
+    def bucket(self, route: str) -> RateLimitBucket:
+        if (bucket := self.buckets.get(route)) is None:
+            bucket = self.buckets[route] = RateLimitBucket(*self.ROUTE_LIMITS[route.split(":")[0]])
+
+        return bucket
+
+    async def deliver(self, target: BroadcastTarget, chunks: list[str], produced: float) -> None:
+        stats = self.stats.setdefault(target.channel_id, DeliveryStats())
+
+        try:
+            for chunk in chunks:
+                await self.send(target, chunk)
+        except Exception as exc:
+            stats.failure(exc)
+        else:
+            stats.success(time.time() - produced)
+
+    async def send(self, target: BroadcastTarget, content: str) -> None:
+        webhook = None
+        if target.webhook_url:
+            if (webhook := self.webhooks.get(target.webhook_url)) is None:
+                webhook = self.webhooks[target.webhook_url] = discord.Webhook.from_url(target.webhook_url, client=self.bot)
+
+        # Waiting on the route happens before taking a slot, so one busy channel doesn't hold up the rest.
+        await self.bucket(f"webhook:{webhook.id}" if webhook else f"channel:{target.channel_id}").acquire()
+
+        async with self.semaphore:
+            await self.global_bucket.acquire()
+
+            if webhook is None:
+                await self.bot.get_partial_messageable(target.channel_id, guild_id=target.guild_id).send(content, allowed_mentions=discord.AllowedMentions.none())
+                return
+
+            try:
+                await webhook.send(content, allowed_mentions=discord.AllowedMentions.none())
+            except discord.NotFound:
+                # The webhook was deleted. Falls back to sending as the bot from now on.
+                self.webhooks.pop(cast(str, target.webhook_url), None)
+                target.webhook_url = None
+                await self.save()
+                raise
+
+    def report(self) -> list[str]:
+        failing = sum(1 for target in self.targets.values() if (stats := self.stats.get(target.channel_id)) and stats.consecutive_failures)
+
+        return [
+            f"- **Broadcasts:** `{len(self.targets)}` guilds, `{self.batches}` batches (last took `{self.last_batch_duration:.2f}s`), `{self.rendered}` alerts rendered, `{failing}` channels failing",
+        ]
+
+class SearchIndex:
+    # The least rapidfuzz score a fuzzy match needs, and how many recent queries are remembered.
+    SCORE_CUTOFF = 75
+    SIZE = 128
+
+    def __init__(self, names: list[str] | None = None) -> None:
+        names = names or []
+
+        # names (list[str]): The names as given. Results are always returned in this form.
+        self.names: list[str] = names
+
+        # normalized (list[str]): Casefolded names with collapsed whitespace, which queries are normalized to as well.
+        # The rapidfuzz passes run on these directly, so choices are only processed once per WarInfo.
+        self.normalized: list[str] = [self.normalize(name) for name in names]
+        self.exact: dict[str, int] = {}
+
+        # trie (dict): One nested dict per character. The None key of every node holds the indices of all names through it.
+        self.trie: dict[str | None, Any] = {}
+
+        for i, normalized_name in enumerate(self.normalized):
+            self.exact.setdefault(normalized_name, i)
+
+            node = self.trie
+            for char in normalized_name:
+                node = node.setdefault(char, {})
+                node.setdefault(None, []).append(i)
+
+        # recent (dict[str, tuple[list[int], bool]]): An LRU of recent normalized queries and their (indices, matched) results.
+        self.recent: dict[str, tuple[list[int], bool]] = {}
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        return " ".join(name.casefold().split())
+
+    def prefixed(self, query: str) -> list[int]:
+        node = self.trie
+
+        for char in query:
+            if (node := node.get(char)) is None:
+                return []
+
+        return node.get(None, [])
+
+    def lookup(self, query: str) -> tuple[list[int], bool]:
+        """Returns ([index of the match], True) on a hit, or (indices of up to 3 suggestions, False) on a miss."""
+        if (i := self.exact.get(query)) is not None:
+            return [i], True
+
+        # Names starting with the query outrank names that merely contain it.
+        if len(prefixed := self.prefixed(query)) == 1:
+            return prefixed, True
+        elif len(prefixed) > 1:
+            return [cast(tuple, rfp.extractOne(query, {i: self.normalized[i] for i in prefixed}, processor=None))[2]], True
+
+        substrings = {i: normalized_name for i, normalized_name in enumerate(self.normalized) if query in normalized_name}
+
+        if best_match := rfp.extractOne(query, substrings, processor=None, score_cutoff=self.SCORE_CUTOFF):
+            return [best_match[2]], True
+
+        if best_match := rfp.extractOne(query, self.normalized, processor=None, score_cutoff=self.SCORE_CUTOFF):
+            return [best_match[2]], True
+
+        suggestions = [match[2] for match in rfp.extract(query, substrings, processor=None, limit=3)]
+        suggestions.extend(match[2] for match in rfp.extract(query, self.normalized, processor=None, limit=3))
+
+        return list(dict.fromkeys(suggestions))[:3], False
+
+    def search(self, raw_query: str) -> tuple[str, bool]:
+        """Same contract as Utilities.auto_complete: (name, True) on a hit, (a message with suggestions, False) on a miss."""
+        query = self.normalize(raw_query)
+
+        if (result := self.recent.pop(query, None)) is None:
+            result = self.lookup(query)
+
+        self.recent[query] = result
+
+        if len(self.recent) > self.SIZE:
+            self.recent.pop(next(iter(self.recent)))
+
+        indices, matched = result
+
+        if matched:
+            return self.names[indices[0]], True
+
+        final = [self.names[i] for i in indices]
+        starter = " Did you mean:"
+
+        match len(final):
+            case 0:
+                help_str = " Check your spelling!"
+            case 1:
+                help_str = f"{starter} {final[0]}?"
+            case 2:
+                help_str = f"{starter} {final[0]} or {final[1]}?"
+            case _:
+                help_str = f"{starter} {", ".join(final[:-1])}, or {final[-1]}?"
+
+        return f"Your entry {raw_query.title()} did not match with anything.{help_str}", False
+
+class LeaderboardStream:
+    # The entries requested per page. At most two pages (the one being read and the one prefetched) are held at once.
+    PAGE_SIZE = 100
+
+    # The leaderboard's first page number.
+    FIRST_PAGE = 1
+
+    # How many players' last known ranks are remembered, to jump straight to their page next time.
+    SIZE = 256
+
+    # The most pages a search reads before giving up.
+    MAX_PAGES = 50
+
+    # The request timeout of one page, in seconds.
+    TIMEOUT = 20.0
+
+    def __init__(self, util: Utilities, endpoints: HD2.Endpoints, page_size: int | None = None) -> None:
+        self.util = util
+
+        # endpoints (Endpoints): Read on every fetch, since the leaderboard URL changes with the season.
+        self.endpoints = endpoints
+        self.page_size = page_size or self.PAGE_SIZE
+
+        # ranks (dict[str, int]): An LRU of normalized names and the rank they were last found at.
+        self.ranks: dict[str, int] = {}
+
+        # pages_fetched (int): How many pages were fetched, over every stream.
+        self.pages_fetched: int = 0
+
+    async def fetch_page(self, page_number: int) -> HD2.Schemas.Leaderboard:
+        endpoint = self.endpoints.Leaderboard
+        page_number_param, page_size_param = endpoint.get("params", ["PageNumber", "PageSize"])
+
+        res = await self.util.parse(self.endpoints.make_query_url(endpoint.get("main", ""), {page_number_param: page_number, page_size_param: self.page_size}), timeout=self.TIMEOUT)
+
+        if type(res) != dict:
+            raise ValueError(f"Invalid data type for payload (str): {res}")
+
+        self.pages_fetched += 1
+
+        return HD2.Schemas.Leaderboard(res)
+
+    async def pages(self, first_page: int | None = None, max_pages: int | None = None) -> AsyncIterator[HD2.Schemas.Leaderboard]:
+        """Yields the leaderboard page by page, fetching the next page while the current one is being read."""
+        page_number = self.FIRST_PAGE if first_page is None else first_page
+        next_page: asyncio.Task | None = asyncio.create_task(self.fetch_page(page_number))
+        yielded = 0
+
+        try:
+            while next_page is not None:
+                page = await next_page
+                next_page = None
+                yielded += 1
+
+                has_more = len(page.entries) == self.page_size and (page_number - self.FIRST_PAGE + 1) * self.page_size < page.total_records
+
+                if has_more and (max_pages is None or yielded < max_pages):
+                    page_number += 1
+                    next_page = asyncio.create_task(self.fetch_page(page_number))
+
+                yield page
+        finally:
+            # The caller stopped early. The prefetched page is no longer needed.
+            if next_page is not None:
+                next_page.cancel()
+
+    async def entries(self, first_page: int | None = None, max_pages: int | None = None) -> AsyncIterator[HD2.Objects.LeaderboardEntry]:
+        async with aclosing(self.pages(first_page, max_pages)) as pages:
+            async for page in pages:
+                for entry in page.entries:
+                    yield entry
+
+    async def find(self, name: str, max_pages: int | None = None) -> tuple[HD2.Objects.LeaderboardEntry | None, int]:
+        """Finds a player by name, stopping at the first page that has them. Returns the entry and how many pages were read."""
+        max_pages = max_pages or self.MAX_PAGES
+        query = SearchIndex.normalize(name)
+        pages_read = 0
+
+        # A player found before is looked for on the page they were last on first, since ranks rarely move far.
+        if (rank := self.ranks.pop(query, None)) is not None:
+            page = await self.fetch_page(self.FIRST_PAGE + (rank - 1) // self.page_size)
+            pages_read += 1
+
+            if (entry := page.by_name.get(query)) is not None:
+                self.ranks[query] = entry.rank
+                return entry, pages_read
+
+        # Closed as soon as the player is found, which cancels the prefetch of the next page.
+        async with aclosing(self.pages(max_pages=max_pages)) as pages:
+            async for page in pages:
+                pages_read += 1
+
+                if (entry := page.by_name.get(query)) is not None:
+                    self.ranks[query] = entry.rank
+
+                    while len(self.ranks) > self.SIZE:
+                        self.ranks.pop(next(iter(self.ranks)))
+
+                    return entry, pages_read
+
+        return None, pages_read
+
+class RenderCache:
+    # The most rendered messages kept at once.
+    SIZE = 16
+
+    def __init__(self) -> None:
+        # renders (dict[tuple[str, int], tuple[str, list[list[str]]]]): Rendered text and its message chunks, keyed by
+        # (render name, snapshot version). Ordered from least to most recently used.
+        self.renders: dict[tuple[str, int], tuple[str, list[list[str]]]] = {}
+
+        # version (int): The oldest snapshot version still cached. Set by invalidate.
+        self.version: int = 0
+
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def get(self, render_name: str, version: int, render: Callable[[], str]) -> tuple[str, list[list[str]]]:
+        key = (render_name, version)
+
+        if (rendered := self.renders.pop(key, None)) is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+
+            text = render()
+            rendered = (text, Utilities.chunk_text(text))
+
+        # A command still holding an older snapshot gets its render, but it isn't cached where it would evict current ones.
+        if version < self.version:
+            return rendered
+
+        self.renders[key] = rendered
+
+        while len(self.renders) > self.SIZE:
+            self.renders.pop(next(iter(self.renders)))
+
+        return rendered
+
+    def invalidate(self, version: int) -> None:
+        # Renders of older snapshots are only reusable by commands that pinned them, which is not worth keeping them for.
+        self.version = max(self.version, version)
+        self.renders = {key: rendered for key, rendered in self.renders.items() if key[1] >= self.version}
+
+class DumpWriter:
+    # How long a flush waits for more writes to coalesce with, in seconds.
+    DELAY = 0.5
+
+    def __init__(self, directory: str, codec: JSONCodec, on_error: Callable[[BaseException], Awaitable[None]], fsync_interval: float | None = 60.0) -> None:
+        # directory (str): Where the dumps are written.
+        self.directory = directory
+        self.codec = codec
+
+        # on_error (Callable[[BaseException], Awaitable[None]]): Reports a failed flush. Its dumps are retried on the next one.
+        self.on_error = on_error
+
+        # fsync_interval (float | None): The least time between two flushes that fsync, in seconds. 0 fsyncs every flush,
+        # and None never does, leaving it up to the OS. Replaced files are atomic either way, only durability changes.
+        self.fsync_interval = fsync_interval
+
+        # pending (dict[str, tuple[Any, bytes | None]]): The latest unwritten (data, body) per dump. Newer writes replace it.
+        self.pending: dict[str, tuple[Any, bytes | None]] = {}
+
+        self.wake = asyncio.Event()
+        self.task: asyncio.Task | None = None
+
+        # write_lock (threading.Lock): Held by the worker thread while it writes. Cancelling a flush doesn't stop its thread,
+        # so the next flush waits for it here instead of writing the same dumps alongside it.
+        self.write_lock = threading.Lock()
+
+        self.last_fsync: float = 0.0
+
+        # writes (int) / coalesced (int) / flushes (int): Files written, writes replaced before they were flushed, and flushes.
+        self.writes: int = 0
+        self.coalesced: int = 0
+        self.flushes: int = 0
+
+    def path(self, dump_name: str) -> str:
+        # Dumps are JSON unless their name says otherwise.
+        return os.path.join(self.directory, dump_name if os.path.splitext(dump_name)[1] else f"{dump_name}.json")
+
+    def put(self, dump_name: str, data: Any, body: bytes | None = None) -> None:
+        # The data is encoded on the worker thread later, so it must not be modified after it is put.
+        if dump_name in self.pending:
+            self.coalesced += 1
+
+        self.pending[dump_name] = (data, body)
+        self.wake.set()
+
+    def get(self, dump_name: str) -> Any:
+        # Unwritten dumps are read back from memory, so reads always see the latest write.
+        if (pending := self.pending.get(dump_name)) is not None:
+            return pending[0]
+
+        return self.codec.load(self.path(dump_name))
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self.task:
+            self.task.cancel()
+
+            with suppress(asyncio.CancelledError):
+                await self.task
+
+        # Whatever is left is written right away, and always fsynced.
+        await self.flush(True)
+
+    async def run(self) -> None:
+        while True:
+            await self.wake.wait()
+            await asyncio.sleep(self.DELAY)
+
+            try:
+                await self.flush()
+            except Exception as exc:
+                await self.on_error(exc)
+
+    async def flush(self, fsync: bool | None = False) -> None:
+        self.wake.clear()
+
+        if not self.pending:
+            return
+
+        batch, self.pending = self.pending, {}
+
+        now = time.monotonic()
+
+        if not fsync and self.fsync_interval is not None and now - self.last_fsync >= self.fsync_interval:
+            fsync = True
+
+        if fsync:
+            self.last_fsync = now
+
+        try:
+            await asyncio.to_thread(self.write, batch, bool(fsync))
+        except BaseException:
+            # Anything written since takes precedence over the failed batch.
+            self.pending = batch | self.pending
+            raise
+
+        self.writes += len(batch)
+        self.flushes += 1
+
+    def write(self, batch: dict[str, tuple[Any, bytes | None]], fsync: bool) -> None:
+        # Every dump is written to a temp file of its own and swapped in with os.replace, so a crash mid-write never
+        # leaves a truncated dump behind.
+        with self.write_lock:
+            for dump_name, (data, body) in batch.items():
+                path = self.path(dump_name)
+                descriptor, temp_path = tempfile.mkstemp(dir=self.directory, prefix=f"{os.path.basename(path)}.", suffix=".tmp")
+
+                try:
+                    with os.fdopen(descriptor, mode="wb") as f:
+                        f.write(body if body is not None else self.codec.dumps(data))
+
+                        if fsync:
+                            f.flush()
+                            os.fsync(f.fileno())
+
+                    os.replace(temp_path, path)
+                except BaseException:
+                    with suppress(OSError):
+                        os.remove(temp_path)
+
+                    raise
+
+            # The renames themselves are only durable once the directory is synced.
+            if fsync and hasattr(os, "O_DIRECTORY"):
+                directory = os.open(self.directory, os.O_RDONLY | os.O_DIRECTORY)
+
+                try:
+                    os.fsync(directory)
+                finally:
+                    os.close(directory)
+
+class HistoryArchive:
+    # The payloads that are archived.
+    PAYLOADS = ["WarStatus", "WarStats"]
+
+    # Records per segment. At a WarStatus and a WarStats record every 10s, a segment covers about an hour.
+    SEGMENT_SIZE = 720
+
+    # The zlib compression level of sealed segments.
+    LEVEL = 6
+
+    def __init__(self, directory: str, codec: JSONCodec, retention_days: float | None = 7.0, max_megabytes: float | None = 256.0) -> None:
+        # directory (str): Where the segments, the index and the journal are kept.
+        self.directory = directory
+        self.codec = codec
+
+        # retention (float | None) / max_bytes (int | None): The oldest segments are deleted once they are older than
+        # retention seconds, or once the sealed segments take up more than max_bytes. None disables either limit.
+        self.retention = retention_days * 86400 if retention_days else None
+        self.max_bytes = int(max_megabytes * 2**20) if max_megabytes else None
+
+        # index (list[list]): The [first timestamp, last timestamp, file name, records, bytes] of every sealed segment,
+        # oldest first. Seeking only decompresses the segments that cover the requested times.
+        self.index: list[list] = []
+
+        # state (dict[str, Any]): The latest archived value of every payload.
+        self.state: dict[str, Any] = {}
+
+        # journal (list[dict]): The records of the open segment. They are also appended to the journal file as they come
+        # in, and compressed into a segment once there are SEGMENT_SIZE of them.
+        self.journal: list[dict] = []
+
+        self.lock = asyncio.Lock()
+        self.loaded = False
+
+    # Records are {"t": timestamp, "d": delta}. The first record of a segment is a delta against nothing, so every segment
+    # can be replayed on its own. Deltas are JSON: a dict patches a dict (by key) or a list (by position, when the length
+    # didn't change), a one-item list replaces the value, and an empty list deletes a key.
+    @classmethod
+    def delta(cls, old: Any, new: Any) -> Any:
+        if type(old) == dict and type(new) == dict:
+            changes = {key: [] for key in old if key not in new}
+
+            for key, value in new.items():
+                if key not in old:
+                    changes[key] = [value]
+                elif old[key] != value:
+                    changes[key] = cls.delta(old[key], value)
+
+            return changes
+
+        if type(old) == list and type(new) == list and len(old) == len(new):
+            return {str(i): cls.delta(old_value, value) for i, (old_value, value) in enumerate(zip(old, new)) if old_value != value}
+
+        return [new]
+
+    @classmethod
+    def patch(cls, old: Any, delta: Any) -> Any:
+        if type(delta) == list:
+            return delta[0]
+
+        # Only the containers along a changed path are copied. Everything else is shared with the previous state.
+        if type(old) == list:
+            new_list = list(old)
+
+            for i, value in delta.items():
+                new_list[int(i)] = cls.patch(new_list[int(i)], value)
+
+            return new_list
+
+        new_dict = dict(old)
+
+        for key, value in delta.items():
+            if value == []:
+                new_dict.pop(key, None)
+            else:
+                new_dict[key] = cls.patch(new_dict.get(key), value)
+
+        return new_dict
+
+    def path(self, file_name: str) -> str:
+        return os.path.join(self.directory, file_name)
+
+    def write_atomic(self, file_name: str, body: bytes) -> None:
+        with open(temp_path := self.path(f"{file_name}.tmp"), mode="wb") as f:
+            f.write(body)
+
+        os.replace(temp_path, self.path(file_name))
+
+    def load(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+
+        if os.path.exists(self.path("index.json")):
+            self.index = self.codec.load(self.path("index.json"))
+
+        self.journal = []
+
+        if os.path.exists(self.path("journal.jsonl")):
+            with open(self.path("journal.jsonl"), mode="rb") as f:
+                for line in f:
+                    try:
+                        self.journal.append(self.codec.loads(line))
+                    except Exception:
+                        # A record cut off by a crash. Everything before it is still good.
+                        break
+
+        # A crash between sealing a segment and removing the journal leaves records that were already sealed.
+        if self.journal and self.index and self.journal[0]["t"] <= self.index[-1][1]:
+            self.journal = []
+            os.remove(self.path("journal.jsonl"))
+
+        self.state = {}
+
+        for record in self.journal:
+            self.state = self.patch(self.state, record["d"])
+
+        self.loaded = True
+
+    def append(self, timestamp: float, payload: str, data: Any) -> bool:
+        if not self.loaded:
+            self.load()
+
+        new_state = self.state | {payload: data}
+
+        if self.journal and new_state == self.state:
+            return False
+
+        record = {"t": timestamp, "d": self.delta(self.state if self.journal else {}, new_state)}
+
+        with open(self.path("journal.jsonl"), mode="ab") as f:
+            f.write(self.codec.dumps(record) + b"\n")
+
+        self.journal.append(record)
+        self.state = new_state
+
+        if len(self.journal) >= self.SEGMENT_SIZE:
+            self.seal()
+
+        return True
+
+    def seal(self) -> None:
+        body = zlib.compress(b"\n".join(self.codec.dumps(record) for record in self.journal), self.LEVEL)
+        file_name = f"segment-{int(self.journal[0]["t"] * 1000)}.zlib"
+
+        self.write_atomic(file_name, body)
+        self.index.append([self.journal[0]["t"], self.journal[-1]["t"], file_name, len(self.journal), len(body)])
+
+        self.trim()
+        self.write_atomic("index.json", self.codec.dumps(self.index))
+
+        os.remove(self.path("journal.jsonl"))
+        self.journal = []
+
+    def trim(self) -> None:
+        now = time.time()
+
+        while self.index and (
+            (self.retention is not None and self.index[0][1] < now - self.retention)
+            or (self.max_bytes is not None and sum(entry[4] for entry in self.index) > self.max_bytes)
+        ):
+            if os.path.exists(segment_path := self.path(self.index.pop(0)[2])):
+                os.remove(segment_path)
+
+    def records(self, entry: list) -> Iterator[dict]:
+        # Records are only decoded as far as they are replayed.
+        with open(self.path(entry[2]), mode="rb") as f:
+            body = zlib.decompress(f.read())
+
+        return (self.codec.loads(line) for line in body.split(b"\n"))
+
+    def sample(self, timestamps: list[float], extract: Callable[[dict[str, Any]], Any]) -> list[Any]:
+        """Returns `extract(state)` of the latest record at or before each timestamp, or None where nothing was archived yet."""
+        if not self.loaded:
+            self.load()
+
+        # Every segment starts from nothing, so each timestamp only replays the segment it falls in, up to itself.
+        # Segments without a requested timestamp are never decompressed.
+        starts = [entry[0] for entry in self.index] + ([self.journal[0]["t"]] if self.journal else [])
+        segments: dict[int, list[float]] = {}
+
+        for timestamp in sorted(set(timestamps)):
+            segments.setdefault(bisect.bisect_right(starts, timestamp) - 1, []).append(timestamp)
+
+        results: dict[float, Any] = {}
+
+        for segment, segment_timestamps in segments.items():
+            if segment < 0:
+                continue
+
+            state: dict[str, Any] = {}
+            records = self.records(self.index[segment]) if segment < len(self.index) else iter(self.journal)
+
+            for record in records:
+                while segment_timestamps and record["t"] > segment_timestamps[0]:
+                    results[segment_timestamps.pop(0)] = extract(state)
+
+                if not segment_timestamps:
+                    break
+
+                state = self.patch(state, record["d"])
+
+            for timestamp in segment_timestamps:
+                results[timestamp] = extract(state)
+
+        return [results.get(timestamp) for timestamp in timestamps]
+
+    def replay(self) -> Iterator[tuple[float, dict[str, Any]]]:
+        """Yields (timestamp, state) for every archived record, oldest first."""
+        if not self.loaded:
+            self.load()
+
+        for records in [*map(self.records, list(self.index)), iter(list(self.journal))]:
+            state: dict[str, Any] = {}
+
+            for record in records:
+                state = self.patch(state, record["d"])
+                yield record["t"], state
+
+    def oldest(self) -> float | None:
+        if self.index:
+            return self.index[0][0]
+
+        return self.journal[0]["t"] if self.journal else None
+
+    def size(self) -> int:
+        return sum(entry[4] for entry in self.index) + (os.path.getsize(self.path("journal.jsonl")) if self.journal else 0)
+
+    async def record(self, payload: str, data: Any) -> bool:
+        async with self.lock:
+            return await asyncio.to_thread(self.append, utils.utcnow().timestamp(), payload, data)
+
+    async def read(self, timestamps: list[float], extract: Callable[[dict[str, Any]], Any]) -> list[Any]:
+        async with self.lock:
+            return await asyncio.to_thread(self.sample, timestamps, extract)
+
+class CacheBuffer:
+    def __init__(self, fit_pool: Executor | None = None, war_id: int | None = None) -> None:
+        # war_id (int | None): The war (season) this buffer holds. Every season gets its own buffer.
+        self.war_id = war_id
+
+        # front (Cache): The published snapshot. Commands read from this and it is never modified while pinned.
+        self.front: Cache = Cache()
+
+        # back (Cache): The snapshot that the next refresh is built into before it is swapped to the front.
+        self.back: Cache = Cache()
+
+        # payloads (dict[str, Any]): The latest raw payload for every value, applied to the back snapshot on publish.
+        self.payloads: dict[str, Any] = {}
+
+        # history (PlanetHistory): The health samples shared by every snapshot. Unused when fit_pool is set.
+        self.history: PlanetHistory = PlanetHistory()
+
+        # fit_pool (Executor | None): A process pool that runs the liberation math, holding the history in its worker.
+        self.fit_pool: Executor | None = fit_pool
+
+        # version (int): Incremented every time a snapshot is published.
+        self.version: int = 0
+
+        # refresh_time (float): How long the last refresh took to build, in seconds.
+        self.refresh_time: float = 0.0
+
+        self.lock = asyncio.Lock()
+
+        self.__recorded_war_status: Any = None
+
+    # Bumped whenever what dump_state writes changes, so older snapshot files are ignored instead of misread.
+    STATE_FORMAT = 1
+
+    def stage(self, name: str, payload: Any) -> None:
+        self.payloads[name] = payload
+
+    def dump_state(self) -> bytes:
+        """Serializes the raw payloads (WarInfo included) and the liberation history into one pickle (protocol 5).
+
+        The linked Cache itself isn't pickled: its object graph recurses too deeply for pickle on long supply line chains,
+        and unpickling it is slower than relinking from the raw payloads anyway.
+        """
+        return pickle.dumps({
+            "format": self.STATE_FORMAT,
+            "saved": time.time(),
+            "payloads": dict(self.payloads),
+            "history": self.history if self.fit_pool is None else None,
+        }, protocol=5)
+
+    def restore_state(self, body: bytes) -> float | None:
+        """Stages everything dump_state saved. Returns when it was saved, or None if it can't be used."""
+        state = pickle.loads(body)
+
+        if type(state) != dict or state.get("format") != self.STATE_FORMAT:
+            return None
+
+        for name, payload in state["payloads"].items():
+            self.stage(name, payload)
+
+        if state["history"] is not None and self.fit_pool is None:
+            self.history = state["history"]
+
+        return state["saved"]
+
+    def pin(self) -> Cache:
+        snapshot = self.front
+        snapshot.pins += 1
+
+        return snapshot
+
+    @staticmethod
+    def unpin(snapshot: Cache) -> None:
+        snapshot.pins -= 1
+
+    def refresh(self, payloads: dict[str, Any]) -> Cache:
+        """Builds the next snapshot from the given payloads. Safe to run off the event loop; nothing published is touched."""
+        started = time.perf_counter()
+
+        # A back snapshot that a slow command still has pinned is left alone and replaced by a fresh one.
+        snapshot = self.back if self.back.pins == 0 else Cache()
+        snapshot.sync(payloads)
+
+        if snapshot.ready:
+            now = utils.utcnow()
+
+            record = (war_status := payloads.get("WarStatus")) is not self.__recorded_war_status
+            self.__recorded_war_status = war_status
+
+            if self.fit_pool:
+                snapshot.planet_table.assign_calculated(self.fit_pool.submit(PlanetHistory.fit, snapshot.planet_table, now, record).result())
+            else:
+                if self.history.owner.size != snapshot.planet_table.size:
+                    self.history = PlanetHistory(snapshot.planet_table.size)
+
+                if record:
+                    self.history.record(now.timestamp(), snapshot.planet_table)
+
+                snapshot.recalculate_lib_estimate(self.history, now)
+
+        # The front is still the previous snapshot here. Refreshes are serialized, so this one becomes the next version.
+        snapshot.events = WarEvents.diff(self.front, snapshot, self.war_id, self.version + 1)
+
+        self.refresh_time = time.perf_counter() - started
+
+        return snapshot
+
+    async def save_state(self) -> bytes:
+        # Under the lock, so a refresh can't modify the history while it is being pickled.
+        async with self.lock:
+            return await asyncio.to_thread(self.dump_state)
+
+    async def publish(self, executor: Executor | None = None) -> Cache:
+        # Refreshes are serialized, since every one of them builds into the same back snapshot.
+        async with self.lock:
+            payloads = dict(self.payloads)
+
+            if executor:
+                snapshot = await asyncio.get_running_loop().run_in_executor(executor, self.refresh, payloads)
+            else:
+                snapshot = self.refresh(payloads)
+
+            self.version += 1
+            snapshot.version = self.version
+
+            self.back, self.front = self.front, snapshot
+
+            return snapshot
+
 class Cache:
+    # The values a snapshot can't be linked without. Everything else is optional.
+    REQUIRED = ["WarInfo", "WarStatus", "WarStats", "MajorOrders"]
+
     def __init__(self) -> None:
         self.CurrentWarID: int | None
         self.WarStatus: HD2.Schemas.WarStatus
@@ -27,138 +1979,396 @@ class Cache:
         
         self.GameClientConfiguration: HD2.Schemas.GameClientConfiguration
 
-        self.cached_health: dict[int, int | float | None] = {}
+        # Liberation math for every planet. Rebuilt with the WarInfo indexes, so it is sized by planet id.
+        self.planet_table: PlanetTable = PlanetTable()
+
+        # The last raw payload applied for each diffed value, used by apply_diff.
+        self.raw_payloads: dict[str, Any] = {}
+
+        # WarInfo indexes. Only rebuilt when a new WarInfo is cached.
+        self.indexed_war_info: HD2.Schemas.WarInfo | None = None
+        self.planets_by_id: dict[int, HD2.Objects.Planet] = {}
+        self.factions_by_id: dict[int, HD2.Objects.Faction] = {}
+        self.sector_by_planet: dict[int, HD2.Objects.Sector] = {}
+        self.home_world_of_by_planet: dict[int, HD2.Objects.Faction] = {}
+        self.planets_by_name: dict[str, HD2.Objects.Planet] = {}
+        self.planet_search: SearchIndex = SearchIndex()
+        self.supply_lines: SupplyGraph = SupplyGraph()
+
+        # Group-by indexes over the planet statuses. Only the planets whose owner or players changed are moved per refresh.
+        self.territory: TerritoryIndex = TerritoryIndex()
+        self.contested_by_sector: dict[str, HD2.Objects.ContestedSectorFaction] = {}
+
+        # WarStatus/WarStats indexes. Rebuilt whenever the underlying lists change.
+        self.status_by_planet: dict[int, HD2.Objects.PlanetStatus] = {}
+        self.attacks_by_source: dict[int, list[HD2.Objects.PlanetAttack]] = {}
+        self.attacks_by_target: dict[int, list[HD2.Objects.PlanetAttack]] = {}
+        self.campaigns_by_id: dict[int, HD2.Objects.WarCampaign] = {}
+        self.campaigns_by_planet: dict[int, list[HD2.Objects.WarCampaign]] = {}
+        self.joint_operations_by_id: dict[int, HD2.Objects.JointOperation] = {}
+        self.joint_operations_by_planet: dict[int, list[HD2.Objects.JointOperation]] = {}
+        self.events_by_planet: dict[int, list[HD2.Objects.PlanetEvent]] = {}
+        self.global_events_by_planet: dict[int, list[HD2.Objects.GlobalEvent]] = {}
+        self.stats_by_planet: dict[int, HD2.Objects.PlanetStats] = {}
 
         self.ready: bool = False
 
-    def remap(self) -> None:
+        # The amount of commands currently reading from this snapshot.
+        self.pins: int = 0
+
+        # The CacheBuffer version this snapshot was published as.
+        self.version: int = 0
+
+        # What changed since the snapshot published before this one. Computed once per refresh, off the event loop.
+        self.events: list[WarEvents.Event] = []
+
+    @staticmethod
+    def group_by(items: list[Any], key: str) -> dict[int, list[Any]]:
+        groups: dict[int, list[Any]] = {}
+
+        for item in items:
+            groups.setdefault(getattr(item, key), []).append(item)
+
+        return groups
+
+    def index_war_info(self) -> None:
         WI = self.WarInfo
+
+        self.planets_by_id = {planet.id: planet for planet in WI.planets}
+        self.factions_by_id = {cast(int, faction.id): faction for faction in WI.factions}
+        self.sector_by_planet = {planet_id: sector for sector in WI.sectors for planet_id in sector.raw_planets}
+        self.home_world_of_by_planet = {}
+
+        for home_world_payload in WI.raw_home_worlds:
+            faction = self.factions_by_id.get(home_world_payload.get("race", 0))
+
+            for planet_id in home_world_payload.get("planetIndices", []):
+                self.home_world_of_by_planet.setdefault(planet_id, faction)
+
+        self.planets_by_name = {planet.name: planet for planet in WI.planets}
+        self.planet_search = SearchIndex([planet.name for planet in WI.planets])
+
+        self.territory = TerritoryIndex()
+
+        for sector in WI.sectors:
+            sector.planets = [self.planets_by_id[planet_id] for planet_id in sector.raw_planets if planet_id in self.planets_by_id]
+            sector.territory = self.territory
+
+        for faction in WI.factions:
+            faction.territory = self.territory
+
+        self.planet_table = PlanetTable.from_planets(WI.planets)
+        self.supply_lines = SupplyGraph.from_planets(WI.planets, self.planet_table.size)
+
+        self.indexed_war_info = WI
+
+    def index_war_status(self) -> None:
         WSU = self.WarStatus
-        WS = self.WarStats
-        MO = self.MajorOrders
 
-        # Mapped to WarStatus
-        for planet_status in WSU.planet_status:
-            planet_status.current_faction = next(faction for faction in WI.factions if faction.id == planet_status.raw_current_faction)
-            planet_status.planet = next(planet for planet in WI.planets if planet.id == planet_status.raw_planet)
+        self.status_by_planet = {planet_status.raw_planet: planet_status for planet_status in WSU.planet_status}
+        self.attacks_by_source = self.group_by(WSU.planet_attacks, "raw_source")
+        self.attacks_by_target = self.group_by(WSU.planet_attacks, "raw_target")
+        self.campaigns_by_id = {campaign.id: campaign for campaign in WSU.campaigns}
+        self.campaigns_by_planet = self.group_by(WSU.campaigns, "raw_planet")
+        self.joint_operations_by_id = {joint_operation.id: joint_operation for joint_operation in WSU.joint_operations}
+        self.joint_operations_by_planet = self.group_by(WSU.joint_operations, "raw_planet")
+        self.events_by_planet = self.group_by(WSU.planet_events, "raw_planet")
+        self.global_events_by_planet = {}
+
+        for global_event in WSU.global_events:
+            for planet_id in global_event.raw_planets:
+                self.global_events_by_planet.setdefault(planet_id, []).append(global_event)
+
+    def index_war_stats(self) -> None:
+        self.stats_by_planet = {planet_stats.raw_planet: planet_stats for planet_stats in self.WarStats.planet_stats}
+
+    def link_planet_status(self, planet_status: HD2.Objects.PlanetStatus) -> None:
+        planet_status.current_faction = self.factions_by_id[planet_status.raw_current_faction]
+        planet_status.planet = self.planets_by_id[planet_status.raw_planet]
+        planet_status.table = self.planet_table
+
+    def link_war_status_entities(self) -> None:
+        WSU = self.WarStatus
+        planets_by_id = self.planets_by_id
+        factions_by_id = self.factions_by_id
 
-            for attr, val in planet_status.__dict__.items():
-                if attr not in ["raw_planet", "planet"]:
-                    setattr(planet_status.planet, attr, val)
-        
         for planet_attack in WSU.planet_attacks:
-            planet_attack.source = next(planet for planet in WI.planets if planet.id == planet_attack.raw_source)
-            planet_attack.target = next(planet for planet in WI.planets if planet.id == planet_attack.raw_target)
+            planet_attack.source = planets_by_id[planet_attack.raw_source]
+            planet_attack.target = planets_by_id[planet_attack.raw_target]
         
         for campaign in WSU.campaigns:
-            campaign.planet = next(planet for planet in WI.planets if planet.id == campaign.raw_planet)
+            campaign.planet = planets_by_id[campaign.raw_planet]
         
         for joint_operation in WSU.joint_operations:
-            joint_operation.planet = next(planet for planet in WI.planets if planet.id == joint_operation.raw_planet)
+            joint_operation.planet = planets_by_id[joint_operation.raw_planet]
         
         for planet_event in WSU.planet_events:
-            planet_event.planet = next(planet for planet in WI.planets if planet.id == planet_event.raw_planet)
-            planet_event.faction = next(faction for faction in WI.factions if faction.id == planet_event.raw_faction)
-            planet_event.campaign = next(campaign for campaign in WSU.campaigns if campaign.id == planet_event.raw_campaign)
-            planet_event.joint_operations = [joint_operation for joint_operation in WSU.joint_operations if joint_operation.id in planet_event.raw_joint_operations]
+            planet_event.planet = planets_by_id[planet_event.raw_planet]
+            planet_event.faction = factions_by_id[planet_event.raw_faction]
+            planet_event.campaign = self.campaigns_by_id[planet_event.raw_campaign]
+            planet_event.joint_operations = [self.joint_operations_by_id[jo_id] for jo_id in planet_event.raw_joint_operations if jo_id in self.joint_operations_by_id]
         
         for global_event in WSU.global_events:
-            global_event.planets = [planet for planet in WI.planets if planet.id in global_event.raw_planets]
-            global_event.sectors = [sector for sector in WI.sectors if any(map(lambda v: v in sector.raw_planets, [pl.id for pl in global_event.planets]))]
-            global_event.faction = next(faction for faction in WI.factions if faction.id == global_event.raw_faction)
+            global_event.planets = [planets_by_id[planet_id] for planet_id in global_event.raw_planets if planet_id in planets_by_id]
+            global_event.sectors = list(dict.fromkeys(self.sector_by_planet[planet.id] for planet in global_event.planets if planet.id in self.sector_by_planet))
+            global_event.faction = factions_by_id[global_event.raw_faction]
+
+    def link_planet(self, planet: HD2.Objects.Planet) -> None:
+        planet.status = self.status_by_planet[planet.id]
+        planet.conflicts = {
+            "to": self.attacks_by_source.get(planet.id, []),
+            "from": self.attacks_by_target.get(planet.id, [])
+        }
+        planet.involved_campaigns = self.campaigns_by_planet.get(planet.id, [])
+        planet.playable = len(planet.involved_campaigns) > 0
+        planet.involved_joint_operations = self.joint_operations_by_planet.get(planet.id, [])
+        planet.events = self.events_by_planet.get(planet.id, [])
+        planet.involved_global_events = self.global_events_by_planet.get(planet.id, [])
+
+    def link_war_stats(self) -> None:
+        for planet_stat in self.WarStats.planet_stats:
+            planet_stat.planet = self.planets_by_id[planet_stat.raw_planet]
+
+        for planet in self.WarInfo.planets:
+            planet.stats = self.stats_by_planet.get(planet.id) or HD2.Objects.PlanetStats({"planetIndex": planet.id})
+
+    def link_major_orders(self) -> None:
+        for order in self.MajorOrders.orders:
+            for task in order.tasks:
+                task.target_faction = self.factions_by_id[task.raw_target_faction]
+                task.target_planet = self.planets_by_id.get(task.raw_target_planet)
+
+    def link_territory(self) -> None:
+        WI = self.WarInfo
+
+        self.territory.build(self.WarStatus.planet_status)
+        self.contested_by_sector = {}
+
+        for sector in WI.sectors:
+            self.link_sector(sector)
+
+        WI.contested_factions = list(self.contested_by_sector.values())
+
+    def link_sector(self, sector: HD2.Objects.Sector) -> None:
+        factions_by_id = self.factions_by_id
+        raw_faction = sector.raw_faction
+
+        sector.faction = factions_by_id[raw_faction[0]] if len(raw_faction) == 1 else HD2.Objects.ContestedSectorFaction(sector, [factions_by_id[faction_id] for faction_id in raw_faction])
+
+        if isinstance(sector.faction, HD2.Objects.ContestedSectorFaction):
+            self.contested_by_sector[sector.name] = sector.faction
+        else:
+            self.contested_by_sector.pop(sector.name, None)
+
+    def remap(self) -> None:
+        WI = self.WarInfo
+        WSU = self.WarStatus
+
+        if self.indexed_war_info is not WI:
+            self.index_war_info()
+
+        self.index_war_status()
+        self.index_war_stats()
+
+        self.planet_table.load(WSU.planet_status)
+
+        planets_by_id = self.planets_by_id
+        factions_by_id = self.factions_by_id
+
+        # Mapped to WarStatus
+        for planet_status in WSU.planet_status:
+            self.link_planet_status(planet_status)
+
+        self.link_war_status_entities()
         
         # Mapped to WarInfo
-        __temp_home_world_mapping = dict.fromkeys([faction.id for faction in WI.factions], [])
+        home_worlds_by_faction: dict[int, list[HD2.Objects.Planet]] = {faction_id: [] for faction_id in factions_by_id}
+        initial_planets_by_faction: dict[int, list[HD2.Objects.Planet]] = {faction_id: [] for faction_id in factions_by_id}
 
         for planet in WI.planets:
-            planet.waypoints = [o_planet for o_planet in WI.planets if planet.id in planet.raw_waypoints]
-            planet.sector = next(sector for sector in WI.sectors if planet.id in sector.raw_planets)
-            planet.initial_faction = next(faction for faction in WI.factions if faction.id == planet.raw_initial_faction)
-            planet.status = next(planet_status for planet_status in WSU.planet_status if planet.id == planet_status.raw_planet)
-            planet.conflicts = {
-                "to": [atk for atk in WSU.planet_attacks if atk.raw_source == planet.id],
-                "from": [_def for _def in WSU.planet_attacks if _def.raw_target == planet.id]
-            }
-            planet.attacks = planet.conflicts
-            planet.involved_campaigns = [campaign for campaign in WSU.campaigns if planet.id == campaign.raw_planet]
-            planet.playable = len(planet.involved_campaigns) > 0
-            planet.involved_joint_operations = [joint_op for joint_op in WSU.joint_operations if planet.id == joint_operation.raw_planet]
-            planet.events = [event for event in WSU.planet_events if event.raw_planet == planet.id]
-            planet.involved_global_events = [gevent for gevent in WSU.global_events if planet.id in gevent.raw_planets]
-            
-            for home_world_payload in WI.raw_home_worlds:
-                pi: list[int] = home_world_payload.get("planetIndices", [])
-                fi = home_world_payload.get("race", 0)
-
-                if planet.id in pi:
-                    planet.home_world_of = next(faction for faction in WI.factions if fi == faction.id)
-                    break
-            else:
-                planet.home_world_of = None
-            
-            planet.stats = next((pstats for pstats in WS.planet_stats if pstats.raw_planet == planet.id), HD2.Objects.PlanetStats({"planetIndex": planet.id}))
+            planet.waypoints = [planets_by_id[planet_id] for planet_id in planet.raw_waypoints if planet_id in planets_by_id]
+            planet.sector = self.sector_by_planet[planet.id]
+            planet.initial_faction = factions_by_id[planet.raw_initial_faction]
+            planet.home_world_of = self.home_world_of_by_planet.get(planet.id)
 
-            planet.status.liberation = 1 - (planet.status.current_health / planet.max_health)
+            self.link_planet(planet)
 
             if planet.home_world_of:
-                __temp_home_world_mapping[planet.home_world_of.id].append(planet)
-        
-        for fi, ps in __temp_home_world_mapping.items():
-            WI.home_worlds.append({"faction": next((f for f in WI.factions if f.id == fi)), "planets": ps})
+                home_worlds_by_faction[cast(int, planet.home_world_of.id)].append(planet)
 
-        del __temp_home_world_mapping
+            initial_planets_by_faction[planet.raw_initial_faction].append(planet)
+        
+        WI.home_worlds = [{"faction": factions_by_id[faction_id], "planets": planets} for faction_id, planets in home_worlds_by_faction.items()]
 
         for faction in WI.factions:
-            faction.current_planets = [planet for planet in WI.planets if planet.status.raw_current_faction == faction.id]
-            faction.initial_planets = [planet for planet in WI.planets if planet.raw_initial_faction == faction.id]
-            faction.home_worlds = [planet for planet in WI.planets if planet.home_world_of and planet.home_world_of.id == faction.id]
-            faction.sectors = [sector for sector in WI.sectors if any(map(lambda v: v in sector.raw_planets, [pl.id for pl in faction.current_planets]))]
+            faction.initial_planets = initial_planets_by_faction[cast(int, faction.id)]
+            faction.home_worlds = home_worlds_by_faction[cast(int, faction.id)]
 
-        for sector in WI.sectors:
-            sector.planets = [planet for planet in WI.planets if planet.id in sector.raw_planets]
-            sector.raw_faction = list(set([planet.status.raw_current_faction for planet in WI.planets]))
-            sector.faction = next(faction for faction in WI.factions if faction.id == sector.raw_faction[0]) if len(sector.raw_faction) == 1 else HD2.Objects.ContestedSectorFaction(sector, [faction for faction in WI.factions if faction.id in sector.raw_faction])
-            if isinstance(sector.faction, HD2.Objects.ContestedSectorFaction):
-                WI.contested_factions.append(sector.faction)
+        self.link_territory()
 
         # Mapped to WarStats
-        for planet_stat in WS.planet_stats:
-            planet_stat.planet = next(planet for planet in WI.planets if planet.id == planet_stat.raw_planet)
-
-        for order in MO.orders:
-            for task in order.tasks:
-                task.target_faction = next(faction for faction in WI.factions if faction.id == task.raw_target_faction)
-                task.target_planet = next((planet for planet in WI.planets if planet.id == task.raw_target_planet), None)
+        self.link_war_stats()
+        self.link_major_orders()
 
         self.ready = True
 
-    def recalculate_lib_estimate(self, time_delta: float | int) -> None:
-        # figure out how to calculate a defense mission
+    @staticmethod
+    def memory_report(payloads: dict[str, Any], top: int | None = 5) -> str:
+        """Builds and links a throwaway cache from the given payloads under tracemalloc and describes its footprint."""
+        top = cast(int, top)
 
-        for planet in self.WarInfo.planets:
-            if not getattr(planet, "status", None):
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+
+        before = tracemalloc.take_snapshot()
+
+        snapshot = Cache()
+        for name, payload in payloads.items():
+            setattr(snapshot, name, getattr(HD2.Schemas, name)(payload))
+        snapshot.remap()
+
+        after = tracemalloc.take_snapshot()
+
+        if not was_tracing:
+            tracemalloc.stop()
+
+        ignored = [tracemalloc.Filter(False, tracemalloc.__file__)]
+        differences = after.filter_traces(ignored).compare_to(before.filter_traces(ignored), "lineno")
+
+        total_size = sum(difference.size_diff for difference in differences)
+        total_count = sum(difference.count_diff for difference in differences)
+
+        lines = [
+            "# 🧠 Cache Memory",
+            f"- **Snapshot Footprint:** `{total_size / 1024:.1f} KiB` in `{total_count}` allocations",
+            f"- **Planets:** `{len(snapshot.WarInfo.planets)}`, **Statuses:** `{len(snapshot.WarStatus.planet_status)}`, **Planet Stats:** `{len(snapshot.WarStats.planet_stats)}`",
+            "- **Largest Allocations:**",
+            *[f" - `{difference.traceback[0].filename.split(os.sep)[-1]}:{difference.traceback[0].lineno}` {difference.size_diff / 1024:.1f} KiB ({difference.count_diff} blocks)" for difference in differences[:top]],
+        ]
+
+        return "\n".join(lines)
+
+    def sync(self, payloads: dict[str, Any]) -> None:
+        """Brings this snapshot up to date with the given raw payloads, diffing where possible."""
+        relinked: set[str] = set()
+
+        for name, payload in payloads.items():
+            if self.raw_payloads.get(name) is payload or self.apply_diff(name, payload):
                 continue
 
-            current_health = planet.status.current_health
-            max_health = planet.max_health
-            planet.status.liberation = 1-(current_health/max_health)
+            if name == "CurrentWarID":
+                self.CurrentWarID = payload
+            else:
+                setattr(self, name, getattr(HD2.Schemas, name)(payload))
+
+            relinked.add(name)
+
+        if not all(name in self.raw_payloads for name in self.REQUIRED):
+            return
+
+        if not self.ready or len(relinked & {"WarInfo", "WarStatus", "WarStats"}) > 0:
+            self.remap()
+        elif "MajorOrders" in relinked:
+            self.link_major_orders()
+
+    def apply_diff(self, name: str, payload: Any) -> bool:
+        """Applies a newly fetched payload onto the already linked cache in place.
+
+        Returns False when the payload can't be diffed (nothing cached yet, a new WarInfo, a different war, etc.),
+        in which case the caller should rebuild the schema and run a full remap instead.
+        """
+        previous = self.raw_payloads.get(name)
+        self.raw_payloads[name] = payload
+
+        if previous is None or not self.ready or self.indexed_war_info is not self.WarInfo:
+            return False
+
+        match name:
+            case "WarStatus":
+                return self.diff_war_status(previous, payload)
+            case "WarStats":
+                return self.diff_war_stats(previous, payload)
+            case _:
+                return False
+
+    def diff_war_status(self, previous: dict[str, Any], payload: dict[str, Any]) -> bool:
+        WSU = self.WarStatus
+
+        if payload.get("warId", 0) != WSU.war_id:
+            return False
+
+        WSU.elapsed_time = payload.get("time", 0)
+        WSU.start_time = utils.utcnow() - timedelta(seconds=WSU.elapsed_time)
+        WSU.impact_multiplier = payload.get("impactMultiplier", 0.0)
+        WSU.story_beat_id_32 = payload.get("storyBeatId32", 0)
 
-            if not (cached_health := self.cached_health.get(planet.id)):
-                self.cached_health[planet.id] = current_health
+        changed_sectors: set[HD2.Objects.Sector] = set()
+
+        if (planet_status_payloads := payload.get("planetStatus", [])) != (previous_payloads := previous.get("planetStatus", [])):
+            if len(planet_status_payloads) != len(previous_payloads):
+                return False
+
+            for planet_status_payload, previous_payload in zip(planet_status_payloads, previous_payloads):
+                if planet_status_payload == previous_payload:
+                    continue
+
+                if (planet_status := self.status_by_planet.get(planet_status_payload.get("index", 0))) is None or planet_status_payload.get("index", 0) != previous_payload.get("index", 0):
+                    return False
+
+                planet_status.update(planet_status_payload)
+                self.link_planet_status(planet_status)
+                self.planet_table.update_row(planet_status)
+
+                if sector := self.territory.update(planet_status):
+                    changed_sectors.add(sector)
+
+        relinked_planets: set[int] = set()
+
+        for key, attr, object_type in [
+            ("planetAttacks", "planet_attacks", HD2.Objects.PlanetAttack),
+            ("campaigns", "campaigns", HD2.Objects.WarCampaign),
+            ("jointOperations", "joint_operations", HD2.Objects.JointOperation),
+            ("planetEvents", "planet_events", HD2.Objects.PlanetEvent),
+            ("globalEvents", "global_events", HD2.Objects.GlobalEvent),
+        ]:
+            if (new_payloads := payload.get(key, [])) == (old_payloads := previous.get(key, [])):
                 continue
 
-            raw_delta = (current_health - cached_health)
-            raw_rate = raw_delta/time_delta
+            setattr(WSU, attr, [object_type(entry_payload) for entry_payload in new_payloads])
 
-            planet.status.raw_rate = raw_rate
-            planet.status.net_rate = (raw_delta/max_health)/time_delta
-            planet.status.rate = planet.status.net_rate + planet.status.regen_per_hour
+            for entry_payload in [*old_payloads, *new_payloads]:
+                relinked_planets.update(entry_payload.get("planetIndices", []))
+                relinked_planets.update(entry_payload[planet_key] for planet_key in ["planetIndex", "source", "target"] if planet_key in entry_payload)
 
-            try:
-                finish_timedelta = timedelta(seconds=(planet.max_health - planet.status.current_health)/raw_rate)
-                planet.status.estimated_liberation_time = utils.utcnow() + finish_timedelta
-            except:
-                planet.status.estimated_liberation_time = None
+        if len(relinked_planets) > 0:
+            self.index_war_status()
+            self.link_war_status_entities()
+
+            for planet_id in relinked_planets:
+                if planet := self.planets_by_id.get(planet_id):
+                    self.link_planet(planet)
+
+        for sector in changed_sectors:
+            self.link_sector(sector)
+
+        if len(changed_sectors) > 0:
+            self.WarInfo.contested_factions = list(self.contested_by_sector.values())
+
+        return True
+
+    def diff_war_stats(self, previous: dict[str, Any], payload: dict[str, Any]) -> bool:
+        if payload != previous:
+            self.WarStats = HD2.Schemas.WarStats(payload)
+            self.index_war_stats()
+            self.link_war_stats()
+
+        return True
+
+    def recalculate_lib_estimate(self, history: PlanetHistory, now: datetime) -> None:
+        # figure out how to calculate a defense mission
+
+        self.planet_table.recalculate(history, now)
 
 class HD2:
     class Schemas:
@@ -366,6 +2576,9 @@ class HD2:
 
                 # entries (list[LeaderboardEntry]): A list of leaderboard entries. The amount and rankings will vary based on page number and page size.
                 self.entries: list[HD2.Objects.LeaderboardEntry] = [HD2.Objects.LeaderboardEntry(leaderboard_entry_payload) for leaderboard_entry_payload in leaderboard_payload.get("entries", [])]
+
+                # by_name (dict[str, LeaderboardEntry]): The entries of this page, by normalized name.
+                self.by_name: dict[str, HD2.Objects.LeaderboardEntry] = {SearchIndex.normalize(entry.name): entry for entry in self.entries}
     
         # Parsed from Endpoints.GameClientConfiguration
         class GameClientConfiguration:
@@ -382,6 +2595,8 @@ class HD2:
     class Objects:
         # For Endpoints.Status
         class PlanetStatus:
+            __slots__ = ("raw_planet", "raw_current_faction", "current_health", "regen_per_second", "regen_per_minute", "regen_per_hour", "players", "current_faction", "planet", "table")
+
             def __init__(self, planet_status_payload: dict[str, Any]) -> None:
                 # raw_planet (int): The index of the planet this status belongs to.
                 self.raw_planet: int = planet_status_payload.get("index", 0)
@@ -410,22 +2625,51 @@ class HD2:
                 # planet (Planet): The planet that this status belongs to.
                 self.planet: HD2.Objects.Planet
 
-                # rate (float): The current rate of liberation change, per hour. Defaults to 0 if not enough data was collected.
-                self.rate: float = 0.0
+                # table (PlanetTable | None): The table that holds the liberation math for this planet. Set once the status is linked.
+                self.table: PlanetTable | None = None
 
+                # rate (float): The current rate of liberation change, per hour. Defaults to 0 if not enough data was collected.
                 # net_rate (float): The net rate of liberation change, per hour. Defaults to 0 if not enough data was collected.
-                self.net_rate: float = 0.0
-
                 # raw_rate (float | None): The raw health that is removed from planets, per hour. Defaults to 0 if not enough data was collected.
-                self.raw_rate: float = 0.0
-
                 # liberation (float): The liberation percentage as represented by a float between 0.0 and 1.0.
-                self.liberation: float = 0.0
-
                 # estimated_liberation_time (datetime | None): The time at which planet liberation will occur. Could be None if it's too far in time.
-                self.estimated_liberation_time: datetime | None = None
+                # All of these are read from the table.
+
+            def update(self, planet_status_payload: dict[str, Any]) -> None:
+                """Applies a newer payload for the same planet in place, keeping links and calculated rates."""
+                self.raw_current_faction = planet_status_payload.get("owner", 0)
+                self.current_health = planet_status_payload.get("health", 1_000_000)
+                self.regen_per_second = planet_status_payload.get("regenPerSecond", 0.0)
+                self.regen_per_minute = self.regen_per_second * 60.0
+                self.regen_per_hour = self.regen_per_second * 3600.0
+                self.players = planet_status_payload.get("players", 0)
+
+            @property
+            def rate(self) -> float:
+                return float(self.table.rate[self.raw_planet]) if self.table else 0.0
+
+            @property
+            def net_rate(self) -> float:
+                return float(self.table.net_rate[self.raw_planet]) if self.table else 0.0
+
+            @property
+            def raw_rate(self) -> float:
+                return float(self.table.raw_rate[self.raw_planet]) if self.table else 0.0
+
+            @property
+            def liberation(self) -> float:
+                return float(self.table.liberation[self.raw_planet]) if self.table else 0.0
+
+            @property
+            def estimated_liberation_time(self) -> datetime | None:
+                if not self.table or np.isnan(timestamp := self.table.estimated_liberation_timestamp[self.raw_planet]):
+                    return None
+
+                return datetime.fromtimestamp(float(timestamp), timezone.utc)
 
         class PlanetAttack:
+            __slots__ = ("raw_source", "raw_target", "source", "target")
+
             def __init__(self, planet_attack_payload: dict[str, int]) -> None:
                 # raw_source (int): The index of the planet where the attack is coming from.
                 self.raw_source: int = planet_attack_payload.get("source", 0)
@@ -440,6 +2684,8 @@ class HD2:
                 self.target: HD2.Objects.Planet
 
         class WarCampaign:
+            __slots__ = ("id", "raw_planet", "type", "count", "planet")
+
             def __init__(self, war_campaign_payload: dict[str, int]) -> None:
                 # id (int): The ID of the campaign.
                 self.id: int = war_campaign_payload.get("id", 0)
@@ -460,10 +2706,14 @@ class HD2:
                 self.planet: HD2.Objects.Planet
 
         class CommunityTarget: # NEEDS MAPPING
+            __slots__ = ()
+
             def __init__(self, community_target_payload: Any) -> None:
                 pass
 
         class JointOperation:
+            __slots__ = ("id", "raw_planet", "hq_node_index", "planet")
+
             def __init__(
                 self, joint_operation_payload: dict[str, int]
             ) -> None:
@@ -480,6 +2730,8 @@ class HD2:
                 self.planet: HD2.Objects.Planet
 
         class PlanetEvent:
+            __slots__ = ("id", "raw_planet", "type", "raw_faction", "event_health", "event_max_health", "elapsed_start_time", "elapsed_end_time", "raw_campaign", "raw_joint_operations", "planet", "faction", "campaign", "joint_operations")
+
             def __init__(self, planet_event_payload: dict[str, Any]) -> None:
                 # id (int): The id for this planet event.
                 self.id: int = planet_event_payload.get("id", 0)
@@ -526,24 +2778,34 @@ class HD2:
                 self.joint_operations: list[HD2.Objects.JointOperation]
 
         class PlanetActiveEffect: # NEEDS MAPPING
+            __slots__ = ()
+
             def __init__(self, planet_active_effect_payload: Any) -> None:
                 pass
 
         class Capital: # NEEDS MAPPING
+            __slots__ = ()
+
             def __init__(self, capital_payload: Any) -> None:
                 pass
 
         class PlanetPermanentEffect: # NEEDS MAPPING
+            __slots__ = ()
+
             def __init__(self, planet_permanent_effect_payload: Any) -> None:
                 pass
 
         class ActiveElectionPolicyEffect: # NEEDS MAPPING
+            __slots__ = ()
+
             def __init__(
                 self, active_election_policy_effect_payload: Any
             ) -> None:
                 pass
 
         class GlobalEvent:
+            __slots__ = ("id", "id_32", "portrait_id_32", "title", "title_id_32", "description", "message_id_32", "raw_faction", "flag", "assignment_id_32", "raw_effects", "raw_planets", "planets", "sectors", "faction")
+
             def __init__(self, global_event_payload: dict[str, Any]) -> None:
                 # id (int): The id for this event.
                 self.id: int = global_event_payload.get("eventId", 0)
@@ -563,7 +2825,6 @@ class HD2:
                 # description (str): The description of the event.
                 # message (str): ALias of description.
                 self.description: str = global_event_payload.get("message", "")
-                self.message = self.description
 
                 # message_id_32 (int): The id of the description of the event. Usage unknown.
                 self.message_id_32: int = global_event_payload.get("messageId32", 0)
@@ -578,10 +2839,8 @@ class HD2:
                 self.assignment_id_32: int = global_event_payload.get("assignmentId32", 0)
 
                 # raw_effects (list[int]): A list of effect ids.
-                self.raw_effects: list[int] = global_event_payload.get("efffectIds", [])
-
                 # effects (list[GlobalEffect]): Currently an alias of raw_effects until these are mapped.
-                self.effects: list[int] = self.raw_effects
+                self.raw_effects: list[int] = global_event_payload.get("efffectIds", [])
 
                 # raw_planets (list[int]): A list of indices for planets involved in this event.
                 self.raw_planets: list[int] = global_event_payload.get("planetIndices", [])
@@ -595,7 +2854,17 @@ class HD2:
                 # faction (Faction): The faction that this event applies to.
                 self.faction: HD2.Objects.Faction
 
+            @property
+            def message(self) -> str:
+                return self.description
+
+            @property
+            def effects(self) -> list[int]:
+                return self.raw_effects
+
         class SuperEarthWarResult: # NEEDS MAPPING
+            __slots__ = ()
+
             def __init__(
                 self, super_earth_war_result_payload: Any
             ) -> None:
@@ -603,11 +2872,12 @@ class HD2:
 
         # For Endpoints.WarInfo
         class Planet:
+            __slots__ = ("index", "name", "settings_hash", "position", "raw_waypoints", "raw_sector", "max_health", "disabled", "raw_initial_faction", "waypoints", "sector", "initial_faction", "playable", "status", "conflicts", "involved_campaigns", "involved_joint_operations", "events", "active_effects", "involved_global_events", "home_world_of", "permanent_effects", "stats")
+
             def __init__(self, planet_payload: dict[str, Any]) -> None:
                 # index (int): The index of the planet.
                 # id (int): Alias of index.
                 self.index: int = planet_payload.get("index", 0)
-                self.id = self.index
 
                 # name (str): The name of the planet.
                 self.name: str = HD2.Mappings.Planets.get(self.id, "Planet")
@@ -676,8 +2946,25 @@ class HD2:
 
                 # stats (PlanetStats): The stats for this planet.
                 self.stats: HD2.Objects.PlanetStats
+
+            @property
+            def id(self) -> int:
+                return self.index
+
+            @property
+            def attacks(self) -> dict[str, list[HD2.Objects.PlanetAttack]]:
+                return self.conflicts
+
+            def __getattr__(self, attr: str) -> Any:
+                # The values of the planet's status (current_health, players, liberation, etc.) are also readable from the planet.
+                if not attr.startswith("_") and attr not in ["raw_planet", "planet", "table", "update"] and hasattr(HD2.Objects.PlanetStatus, attr):
+                    return getattr(self.status, attr)
+
+                raise AttributeError(f"'{type(self).__name__}' object has no attribute '{attr}'")
   
         class PlanetPosition:
+            __slots__ = ("x", "y", "dict")
+
             def __init__(self, planet_position_payload: dict[str, float]) -> None:
                 # x (float): The x-coordinate of the planet, relative to the origin 0.
                 self.x: float = planet_position_payload.get("x", 0.0)
@@ -689,6 +2976,8 @@ class HD2:
                 self.dict: dict[str, float] = planet_position_payload
 
         class Sector:
+            __slots__ = ("name", "__raw_mapping_payload", "index", "raw_planets", "planets", "faction", "territory")
+
             def __init__(
                 self, sector_name: str
             ) -> None:
@@ -700,13 +2989,14 @@ class HD2:
                 # index (int): The index of the sector. This has been mapped as best as possible from the API, but due to inconsistencies this is unreliable.
                 # id (int): Alias of index.
                 self.index: int = self.__raw_mapping_payload.get("index", 0)
-                self.id = self.index
 
                 # raw_planets (list[int]): A list of indices of planets in this sector.
                 self.raw_planets: list[int] = self.__raw_mapping_payload.get("planets", [])
 
                 # raw_faction (list[int]): A list of faction indices that currently control this sector. This does not signify if the sector is contested.
-                self.raw_faction: list[int]
+                # owner_counts (dict[int, int]): The amount of planets each faction currently holds in this sector.
+                # players (int): The amount of Helldivers active across this sector.
+                # contested (bool): Whether more than one faction holds planets in this sector.
 
                 # planets (list[Planet]): A list of planets in this sector.
                 self.planets: list[HD2.Objects.Planet]
@@ -714,12 +3004,36 @@ class HD2:
                 # faction (Faction | ContestedSectorFaction): The faction that currently controls this sector. If multiple factions are present, a "Contested" faction is returned instead.
                 self.faction: HD2.Objects.Faction | HD2.Objects.ContestedSectorFaction
 
+                # territory (TerritoryIndex): The group-by indexes the aggregates above are read from.
+                self.territory: TerritoryIndex
+
+            @property
+            def id(self) -> int:
+                return self.index
+
+            @property
+            def owner_counts(self) -> dict[int, int]:
+                return self.territory.owner_counts_by_sector.get(self.name, {})
+
+            @property
+            def raw_faction(self) -> list[int]:
+                return list(self.owner_counts)
+
+            @property
+            def players(self) -> int:
+                return self.territory.players_by_sector.get(self.name, 0)
+
+            @property
+            def contested(self) -> bool:
+                return len(self.owner_counts) > 1
+
         class BaseFaction:
+            __slots__ = ("index", "__raw_mapping_payload", "name", "icon")
+
             def __init__(self, faction_index: int | str) -> None:
                 # index (int | str): The index of the mapping that this faction correlates to.
                 # id (int | str): Alias of index.
                 self.index: int | str = faction_index
-                self.id = self.index
 
                 self.__raw_mapping_payload: dict[str, str] = HD2.Mappings.Factions.get(self.id, {})
 
@@ -729,9 +3043,18 @@ class HD2:
                 # icon (str): The icon/emoji that represents this faction. May change to be an image later on.
                 # emoji (str): Alias for icon. May replace icon soon.
                 self.icon: str = self.__raw_mapping_payload.get("emoji", "❓")
-                self.emoji = self.icon
+
+            @property
+            def id(self) -> int | str:
+                return self.index
+
+            @property
+            def emoji(self) -> str:
+                return self.icon
 
         class Faction(BaseFaction):
+            __slots__ = ("initial_planets", "home_worlds", "territory")
+
             def __init__(
                 self,
                 faction_index: int,
@@ -740,7 +3063,6 @@ class HD2:
 
                 # current_planets (list[Planet]): A list of planets under control by this faction.
                 # planets (list[Planet]): Alias for current_planets.
-                self.current_planets: list[HD2.Objects.Planet]
 
                 # initial_planets (list[Planet] | None): A list of planets that were under control of this faction at the start of the war.
                 self.initial_planets: list[HD2.Objects.Planet]
@@ -749,9 +3071,30 @@ class HD2:
                 self.home_worlds: list[HD2.Objects.Planet]
 
                 # sectors (list[Sector]): A list of sectors under control by this faction.
-                self.sectors: list[HD2.Objects.Sector]
+                # players (int): The amount of Helldivers active across the planets of this faction.
+
+                # territory (TerritoryIndex): The group-by indexes the aggregates above are read from.
+                self.territory: TerritoryIndex
+
+            @property
+            def current_planets(self) -> list[HD2.Objects.Planet]:
+                return list(self.territory.planets_by_faction.get(cast(int, self.id), {}).values())
+
+            @property
+            def planets(self) -> list[HD2.Objects.Planet]:
+                return self.current_planets
+
+            @property
+            def sectors(self) -> list[HD2.Objects.Sector]:
+                return list(self.territory.sectors_by_faction.get(cast(int, self.id), {}).values())
+
+            @property
+            def players(self) -> int:
+                return self.territory.players_by_faction.get(cast(int, self.id), 0)
 
         class ContestedSectorFaction(BaseFaction):
+            __slots__ = ("contesters", "home_worlds", "sector", "planets")
+
             def __init__(self, sector: HD2.Objects.Sector, factions_involved: list[HD2.Objects.Faction]) -> None:
                 super().__init__("C")
 
@@ -764,16 +3107,24 @@ class HD2:
                 # sector (Sector): The sector involved.
                 # sectors (Sector): To keep consistency with Faction, this is an alias to sector.
                 self.sector: HD2.Objects.Sector = sector
-                self.sectors = self.sector
 
                 # planets (list[Planet]]): A list of planets in this sector.
                 # current_planets (list[Planet]): To keep consistency with Faction, this is an alias to planets.
                 # initial_planets (list[Planet]): To keep consistency with Faction, this is an alias to planets.
                 self.planets: list[HD2.Objects.Planet] = self.sector.planets
-                self.current_planets = self.planets
+
+            @property
+            def sectors(self) -> HD2.Objects.Sector:
+                return self.sector
+
+            @property
+            def current_planets(self) -> list[HD2.Objects.Planet]:
+                return self.planets
 
         # For Endpoints.NewsFeed
         class NewsPost:
+            __slots__ = ("id", "elapsed_published", "type", "tag_ids", "message")
+
             def __init__(self, news_post_payload: dict[str, Any]) -> None:
                 # id (int): The id of the news post.
                 self.id: int = news_post_payload.get("id", 0)
@@ -796,6 +3147,8 @@ class HD2:
 
         # For Endpoints.MajorOrder
         class MajorOrder:
+            __slots__ = ("__raw_content", "__raw_progress", "id", "expires_in", "expires_at", "type", "title", "message", "task_title", "reward", "flags", "tasks", "progress")
+
             def __init__(self, major_order_payload: dict[str, Any]) -> None:
                 self.__raw_content: dict[str, Any]  = major_order_payload.get("setting", {})
                 self.__raw_progress: list[int] = major_order_payload.get("progress", [])
@@ -803,7 +3156,6 @@ class HD2:
                 # id (int): The id of the major order.
                 # id_32 (int): Alias of id.
                 self.id: int = major_order_payload.get("id32", 0)
-                self.id_32 = self.id
 
                 # expires_in (int): The amount of seconds left in this major order.
                 self.expires_in: int = major_order_payload.get("expiresIn", 0)
@@ -843,8 +3195,14 @@ class HD2:
 
                 # progress (float): The overall percentage (represented as a decimal) of completion of this major order. For specific progress, check each task.
                 self.progress: float = __current_progress/__max_progress
+
+            @property
+            def id_32(self) -> int:
+                return self.id
             
         class MajorOrderTask:
+            __slots__ = ("type", "raw_target_faction", "total_count", "target_faction", "liberation_needed", "raw_target_planet", "target_planet", "unknowns", "raw_total_count", "raw_liberation_needed")
+
             def __init__(
                 self, major_order_task_payload: dict[str, Any]
             ) -> None:
@@ -890,6 +3248,8 @@ class HD2:
                 self.unknowns = unknowns
                     
         class MajorOrderReward:
+            __slots__ = ("type", "id", "amount", "flags")
+
             def __init__(
                 self, major_order_reward_payload: dict[str, int]
             ) -> None:
@@ -897,8 +3257,6 @@ class HD2:
                 # name (str): Alias of type.
                 # object (str): Alias of type.
                 self.type: str = HD2.Types.MajorOrderReward.get(major_order_reward_payload.get("type", 0), "Unknown")
-                self.name = self.type
-                self.object = self.type
 
                 # id (int): The id of the reward.
                 self.id: int = major_order_reward_payload.get("id32", 0)
@@ -909,8 +3267,18 @@ class HD2:
                 # flags (int): Value with unknown usage.
                 self.flags: int = HD2.Types.MajorOrderRewardFlag.get((raw_flag := major_order_reward_payload.get("flags", 0)), raw_flag)
 
+            @property
+            def name(self) -> str:
+                return self.type
+
+            @property
+            def object(self) -> str:
+                return self.type
+
         # For Endpoints.WarStats
         class BaseStats:
+            __slots__ = ("missions_won", "missions_lost", "mission_time_played", "total_missions", "mission_success_rate", "success_rate", "terminid_kills", "automaton_kills", "illuminate_kills", "shots_fired", "shots_hit", "raw_accuracy", "accuracy", "time_played", "mission_time_proportion", "deaths", "friendly_kills", "friendly_fire_rate", "revives")
+
             def __init__(self, stats_payload: dict[str, int]) -> None:
                 # missions_won (int): The amount of missions that were successful (i.e. the main objectives were completed).
                 self.missions_won: int = stats_payload.get("missionsWon", 1)
@@ -933,32 +3301,26 @@ class HD2:
                 # terminid_kills (int): The amount of Terminid killed.
                 # bug_kills (int): Alias for terminid_kills.
                 self.terminid_kills: int = stats_payload.get("bugKills", 0)
-                self.bug_kills = self.terminid_kills
 
                 # automaton_kills (int): The amount of Automaton killed.
                 # bot_kills (int): Alias for automaton_kills.
                 self.automaton_kills: int = stats_payload.get("automatonKills", 0)
-                self.bot_kills = self.automaton_kills
 
                 # illuminate_kills (int): The amount of Illuminate killed.
                 # droid_kills (int): Alias for illuminate_kills.
                 self.illuminate_kills: int = stats_payload.get("illuminateKills", 0)
-                self.droid_kills = self.illuminate_kills
 
                 # shots_fired (int): The amount of shots that were fired.
                 # bullets_fired (int): Alias for shots_fired.
                 self.shots_fired: int = stats_payload.get("bulletsFired", 0)
-                self.bullets_fired = self.shots_fired
 
                 # shots_hit (int): The amount of shots that have hit characters. Includes friendly fire. Some weapons may fire more than one bullet per shot so therefore, this value may be above shots_fired.
                 # bullets_hit (int): Alias for shots_hit. 
                 self.shots_hit: int = stats_payload.get("bulletsHit", 0)
-                self.bullets_hit = self.shots_hit
 
                 # given_accuracy (int): The percentage of shots hitting over shots firing, rounded to the tenths place and multiplied by 100. This is highly inaccurate to the true accuracy.
                 # accurracy (int): Intentionally mispelled alias of given_accuracy.
                 self.raw_accuracy: int = stats_payload.get("accurracy", 0)
-                self.accurracy = self.raw_accuracy
 
                 # accuracy (float): The percentage of shots hitting over shots firing, represented as a decimal.
                 self.accuracy: float = self.shots_hit / (self.shots_fired if self.shots_fired > 0 else 1)
@@ -981,11 +3343,39 @@ class HD2:
                 # revives (int): The number of revives that were performed.
                 self.revives: int = stats_payload.get("revives", 0)
 
+            @property
+            def bug_kills(self) -> int:
+                return self.terminid_kills
+
+            @property
+            def bot_kills(self) -> int:
+                return self.automaton_kills
+
+            @property
+            def droid_kills(self) -> int:
+                return self.illuminate_kills
+
+            @property
+            def bullets_fired(self) -> int:
+                return self.shots_fired
+
+            @property
+            def bullets_hit(self) -> int:
+                return self.shots_hit
+
+            @property
+            def accurracy(self) -> int:
+                return self.raw_accuracy
+
         class GalaxyStats(BaseStats):
+            __slots__ = ()
+
             def __init__(self, galaxy_stats_payload: dict[str, int]) -> None:
                 super().__init__(galaxy_stats_payload)
 
         class PlanetStats(BaseStats):
+            __slots__ = ("raw_planet", "planet")
+
             def __init__(self, planet_stats_payload: dict[str, int]) -> None:
                 super().__init__(planet_stats_payload)
 
@@ -997,25 +3387,23 @@ class HD2:
 
         # For Endpoints.Leaderboard
         class LeaderboardEntry:
+            __slots__ = ("rank", "ranking", "experience", "banner", "name", "is_self", "score")
+
             SUFFIXES = {1: "st", 2: "nd", 3: "rd"}
 
             def __init__(self, leaderboard_entry_payload: dict[str, Any]) -> None:
                 # rank (int): The rank of the player.
                 # placement (int): Alias to rank.
                 self.rank: int = leaderboard_entry_payload.get("rank", 0)
-                self.placement = self.rank
 
                 # ranking (str): Similar to rank, but with a generated suffix.
                 # placed (str): Alias to ranking.
                 self.ranking: str = self.__generate_ranking(self.rank)
-                self.placed = self.ranking
 
                 # experience (int): How much experience this player has. Speculated to be only for the current level.
                 # exp (int): Alias for experience.
                 # xp (int): Alias for experieence.
                 self.experience: int = leaderboard_entry_payload.get("experience", 0)
-                self.exp = self.experience
-                self.xp = self.experience
 
                 # banner (int): Speculated to be a reference to in-game banners. Current usage is still unknown.
                 self.banner: int = leaderboard_entry_payload.get("banner", 0)
@@ -1023,7 +3411,6 @@ class HD2:
                 # name (str): The name of the player.
                 # username (str): Alias to name.
                 self.name: str = leaderboard_entry_payload.get("name", "Unknown")
-                self.username = self.name
 
                 # is_self (bool): Whether or not the player is you. Because there is no authentication procedure at the moment, this will always be false.
                 self.is_self: Literal[False] = leaderboard_entry_payload.get("isSelf", False) # bool
@@ -1031,7 +3418,30 @@ class HD2:
                 # score (int): The score of the player. Calculation for score is unknown.
                 # points (int): Alias for score.
                 self.score: int = leaderboard_entry_payload.get("score", 0)
-                self.points = self.score
+
+            @property
+            def placement(self) -> int:
+                return self.rank
+
+            @property
+            def placed(self) -> str:
+                return self.ranking
+
+            @property
+            def exp(self) -> int:
+                return self.experience
+
+            @property
+            def xp(self) -> int:
+                return self.experience
+
+            @property
+            def username(self) -> str:
+                return self.name
+
+            @property
+            def points(self) -> int:
+                return self.score
 
             @classmethod
             def __generate_ranking(cls, placement: int) -> str:
@@ -1044,6 +3454,8 @@ class HD2:
     
         # For Endpoints.GameClientConfiguration
         class PollingConfiguration:
+            __slots__ = ("id_32", "interval")
+
             def __init__(self, polling_configuration_payload: dict[str, int]) -> None:
                 # id_32 (int): The internal id of the value to poll.
                 self.id_32: int = polling_configuration_payload.get("id32", 0)
@@ -1052,6 +3464,8 @@ class HD2:
                 self.interval: int = polling_configuration_payload.get("interval", 60)
 
         class FeatureConfiguration:
+            __slots__ = ("id_32", "enabled")
+
             def __init__(self, feature_configuration: dict[str, int | bool]) -> None:
                 # id_32 (int): The internal id of the feature.
                 self.id_32: int = feature_configuration.get("id32", 0)
@@ -1060,11 +3474,15 @@ class HD2:
                 self.enabled = feature_configuration.get("enabled", True)
 
         class MatchmakingConfiguration:
+            __slots__ = ("values",)
+
             def __init__(self, match_making_configuration_payload: list[dict[str, int]]) -> None:
                 # values (list[MatchmakingConfigValue]): A list of values for the configuration.
                 self.values = [HD2.Objects.MatchmakingConfigValue(match_making_config_value_payload) for match_making_config_value_payload in match_making_configuration_payload]
 
         class MatchmakingConfigValue:
+            __slots__ = ("weight", "value")
+
             def __init__(self, match_making_config_value_payload: dict[str, int]) -> None:
                 # weight (int): Unknown value.
                 self.weight = match_making_config_value_payload.get("weight", 1)
@@ -1117,16 +3535,9 @@ class HD2:
             self.Leaderboard = {"main": f"{self.__raw_leaderboard.get("main")}/{war_id}", "params": self.__raw_leaderboard.get("params")}
 
         ## Utils
-        def make_query_url(self, url: str, params: dict[str, str]) -> str:
-            raw_combined_url = "?".join(
-                [
-                    url,
-                    "&".join(
-                        [f"{param}={value}" for param, value in list(params.items())]
-                    ),
-                ]
-            )
-            return urllib.parse.quote(raw_combined_url)
+        def make_query_url(self, url: str, params: dict[str, Any]) -> str:
+            # Only the parameters are quoted. Quoting the whole URL would escape its scheme and "?" as well.
+            return f"{url}?{urllib.parse.urlencode(params)}"
     
     class Mappings:
         Planets = {
@@ -1468,6 +3879,7 @@ class HD2:
         MajorOrderTaskValue = {1: "target_faction", 3: "total_count", 11: "liberation_needed", 12: "target_planet"}
         MajorOrderReward = {1: "Medals"}
         MajorOrderRewardFlag = {}
+        PollingValue = {}
 
 class Converter:
     DT_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
@@ -1497,62 +3909,183 @@ class Converter:
         return f"{label} {value}" if is_num else f"{value} {label}"
         
 class Utilities:
-    def __init__(self, bot: objects.Bot) -> None:
+    # The most requests in flight at once.
+    MAX_REQUESTS = 4
+
+    # The default timeout of a single request, in seconds. Callers can pass their own per endpoint.
+    TIMEOUT = 10.0
+
+    # Failed requests (timeouts, connection errors, 429s and 5xxs) are retried up to RETRIES times, after a full-jitter
+    # exponential delay of up to RETRY_BASE * 2^attempt seconds, capped at RETRY_CAP. A Retry-After header is honored.
+    RETRIES = 2
+    RETRY_BASE = 0.5
+    RETRY_CAP = 8.0
+
+    # The most time one fetch can take across all of its attempts and delays, in seconds. Fetches with a longer
+    # timeout of their own get exactly that, without retries.
+    DEADLINE = 25.0
+
+    # How long a successful unconditional fetch is reused for identical fetches, in seconds.
+    TTL = 2.0
+
+    def __init__(self, bot: objects.Bot, codec: JSONCodec | None = None) -> None:
         self.bot = bot
+        self.codec = codec or JSONCodec.get()
+        self.requests = asyncio.Semaphore(self.MAX_REQUESTS)
+
+        # validators (dict): The (ETag, Last-Modified, body digest) of the last response per URL fetched conditionally.
+        self.validators: dict[str, tuple[str | None, str | None, bytes]] = {}
+
+        # conditional_requests (int): How many conditional fetches were made.
+        self.conditional_requests = 0
+
+        # not_modified (int): How many of them the server answered with a 304.
+        self.not_modified = 0
+
+        # same_digest (int): How many of them returned a body identical to the last one, and were never decoded.
+        self.same_digest = 0
+
+        # breaker (CircuitBreaker): Keeps dead endpoints from being requested every poll.
+        self.breaker = CircuitBreaker()
+
+        # retries (int): How many requests were retried.
+        self.retries = 0
+
+        # in_flight (dict): The fetch currently running per (URL, headers, conditional). Concurrent identical fetches share it.
+        self.in_flight: dict[tuple, asyncio.Future] = {}
+
+        # recent (dict): The (expiry, result) of the last successful unconditional fetch per key, reused for TTL seconds.
+        self.recent: dict[tuple, tuple[float, tuple[dict[str, Any] | list[Any], bytes]]] = {}
+
+        # coalesced (int) / reused (int): How many fetches joined one in flight, and how many were answered from recent.
+        self.coalesced = 0
+        self.reused = 0
 
     @staticmethod
     def auto_complete(raw_query: str, iterable: list) -> tuple[str, bool]:
-        query = raw_query.title()
-        substrings = [
-            planet for planet in iterable if query.lower() in planet.lower()
-        ]
+        # For one-off lists. Planet names have a prebuilt index on the cache (planet_search).
+        return SearchIndex(iterable).search(raw_query)
+
+    async def fetch(self, to_fetch: str = "", headers: dict[str, str] | None = None, conditional: bool = False, timeout: float | None = None) -> tuple[dict[str, Any] | list[Any], bytes] | str | None:
+        # Returns the decoded payload along with the raw response body, so it can be dumped without re-encoding.
+        # Conditional fetches return None when nothing changed since the last one, either because the server answered
+        # with a 304 or because the body hashes the same. Either way, the body is never decoded.
+        # Concurrent identical fetches share one request, and the payload they get back is the same object. Don't modify it.
+        key = (to_fetch, tuple(sorted((headers or {}).items())), conditional)
+        now = time.monotonic()
+
+        if not conditional and (recent := self.recent.get(key)) and recent[0] > now:
+            self.reused += 1
+            return recent[1]
+
+        def __done(future: asyncio.Future) -> None:
+            self.in_flight.pop(key, None)
+
+            if not conditional and not future.cancelled() and type(res := future.result()) == tuple:
+                self.recent = {recent_key: recent for recent_key, recent in self.recent.items() if recent[0] > now}
+                self.recent[key] = (time.monotonic() + self.TTL, res)
+
+        if future := self.in_flight.get(key):
+            self.coalesced += 1
+        else:
+            future = self.in_flight[key] = asyncio.ensure_future(self.fetch_with_retries(to_fetch, headers, conditional, timeout))
+            future.add_done_callback(__done)
 
-        best_match_direct = query if query in iterable else None
-        best_match_substring = rfp.extractOne(query, substrings, score_cutoff=75)
-        best_match_full = rfp.extractOne(query, iterable, score_cutoff=75)
+        # Shielded, so a cancelled caller doesn't cancel the request for the others.
+        return await asyncio.shield(future)
 
-        if best_match_direct:
-            return best_match_direct, True
+    async def fetch_with_retries(self, to_fetch: str, headers: dict[str, str] | None, conditional: bool, timeout: float | None) -> tuple[dict[str, Any] | list[Any], bytes] | str | None:
+        # Failures are retried, then returned as an error string. Endpoints that keep failing are skipped by the breaker.
+        key = to_fetch.split("?")[0]
 
-        if best_match_substring is None and best_match_full is None:
-            top_3 = rfp.extract(query, substrings, limit=3)
-            top_3_full = rfp.extract(query, iterable, limit=3)
+        if not self.breaker.allow(key):
+            return f"503 Circuit open for {key}"
 
-            top_3.extend(top_3_full)
+        timeout = timeout or self.TIMEOUT
+        deadline = time.monotonic() + max(self.DEADLINE, timeout)
 
-            final = [x[0] for x in top_3[:3]]
+        for attempt in range(self.RETRIES + 1):
+            res, retry_after = await self.request(to_fetch, headers, conditional, min(timeout, deadline - time.monotonic()))
 
-            starter = " Did you mean:"
+            if retry_after is None:
+                break
 
-            if len(final) > 0:
-                match (len(final)):
-                    case 1:
-                        help_str = f"{starter} {final[0]}?"
-                    case 2:
-                        help_str = f"{starter} {final[0]} or {final[1]}?"
-                    case _:
-                        help_str = f"{starter} {", ".join(final[:-1])}, or {final[-1]}"
-            else:
-                help_str = "Check your spelling!", False
+            delay = max(retry_after, random.uniform(0, min(self.RETRY_CAP, self.RETRY_BASE * 2 ** attempt)))
 
-            return f"Your entry {raw_query.title()} did not match with anything.{help_str}", False
+            # Retrying is only worth it if the next attempt gets a reasonable share of its timeout before the deadline.
+            if attempt == self.RETRIES or deadline - time.monotonic() - delay < min(timeout, self.TIMEOUT) / 2:
+                break
 
-        elif best_match_substring is None:
-            return best_match_full[0], True
+            self.retries += 1
+            await asyncio.sleep(delay)
+
+        if type(res) == str and retry_after is not None:
+            self.breaker.failure(key)
         else:
-            return best_match_substring[0], True
+            self.breaker.success(key)
+
+        return res
 
-    async def parse(self, to_parse: str = "", headers: dict[str, str] | None = None) -> dict[str, Any] | list[Any] | str:
+    async def request(self, to_fetch: str, headers: dict[str, str] | None, conditional: bool, timeout: float) -> tuple[tuple[dict[str, Any] | list[Any], bytes] | str | None, float | None]:
+        # A single attempt of fetch. Also returns the minimum delay before retrying, or None if it shouldn't be retried.
         try:
             craft_this: client = self.bot.craft_this
 
-            async with craft_this.session.get(to_parse, headers=headers
+            etag, last_modified, digest = self.validators.get(to_fetch, (None, None, b""))
+
+            if conditional:
+                self.conditional_requests += 1
+
+                headers = dict(headers or {})
+
+                if etag:
+                    headers["If-None-Match"] = etag
+                if last_modified:
+                    headers["If-Modified-Since"] = last_modified
+
+            async with self.requests, asyncio.timeout(timeout), craft_this.session.get(to_fetch, headers=headers
             ) as resp:
+                if conditional and resp.status == 304 and digest:
+                    self.not_modified += 1
+                    return None, None
+
                 if resp.status == 200:
-                    return await resp.json()
-                return f"{resp.status} {resp.reason}"
+                    body = await resp.read()
+
+                    if conditional:
+                        new_digest = hashlib.blake2b(body, digest_size=16).digest()
+                        self.validators[to_fetch] = (resp.headers.get("ETag"), resp.headers.get("Last-Modified"), new_digest)
+
+                        if new_digest == digest:
+                            self.same_digest += 1
+                            return None, None
+
+                    return (self.codec.loads(body), body), None
+
+                if resp.status == 429 or resp.status >= 500:
+                    try:
+                        retry_after = min(float(resp.headers.get("Retry-After", 0)), self.RETRY_CAP)
+                    except ValueError:
+                        retry_after = 0.0
+
+                    return f"{resp.status} {resp.reason}", retry_after
+                return f"{resp.status} {resp.reason}", None
+        except TimeoutError:
+            return f"408 Timed out after {timeout:g}s", 0.0
         except Exception as exc:
-            return f"400 {exc}"
+            return f"400 {exc}", 0.0
+
+    async def parse(self, to_parse: str = "", headers: dict[str, str] | None = None, conditional: bool = False, timeout: float | None = None) -> dict[str, Any] | list[Any] | str | None:
+        res = await self.fetch(to_parse, headers, conditional, timeout)
+
+        return res if res is None or type(res) == str else res[0]
+
+    def forget(self, url: str | None = None) -> None:
+        """Drops the validators of one URL (all of them by default), so the next conditional fetch returns the full body."""
+        if url is None:
+            self.validators.clear()
+        else:
+            self.validators.pop(url, None)
     
     @staticmethod
     def chunk_text(original: str, max_length: int | None = 2000) -> list[str]:
@@ -1595,7 +4128,7 @@ class Utilities:
         return chunks
     
     @classmethod
-    async def send(cls, result_text: str, reference: commands.Context[objects.Bot] | discord.Message) -> None:
+    async def send(cls, result_text: str, reference: commands.Context[objects.Bot] | discord.Message, chunks: list[list[str]] | None = None, footer: str | None = None) -> None:
 
         if isinstance(reference, discord.Message):
             message: discord.Message = reference
@@ -1604,7 +4137,10 @@ class Utilities:
 
         all_messages = []
 
-        for chunk in cls.chunk_text(result_text):
+        chunks = chunks if chunks is not None else cls.chunk_text(result_text)
+
+        # The footer is sent on its own, so cached chunks are never modified.
+        for chunk in chunks + [[footer]] if footer else chunks:
             ref_msg = message if len(all_messages) == 0 else all_messages[-1]
             
             if (joined := "\n".join(chunk)) != "":
@@ -1615,267 +4151,467 @@ class Utilities:
         await message.edit(content=f"Your command has been processed. See all results:\n{"\n".join([msg.jump_url for msg in all_messages])}", allowed_mentions=discord.AllowedMentions.all())
            
 class Cog(commands.Cog, name=name, description="Commands related to Helldivers 2"):
+    # How long to wait before retrying the startup CurrentWarID fetch, in seconds.
+    SEASON_RETRY = 30.0
+
     def __init__(self, bot: objects.Bot):
         self.latest_keywords = ["current", "latest", "now"]
 
         self.bot = bot
         
+        settings = self.bot.extension_settings.get(name, {})
+
+        # orjson or msgspec when installed, the stdlib otherwise. A specific one can be preferred with the "codec" setting.
+        self.codec = JSONCodec.get(settings.get("codec"))
+
         self.convert = Converter()
-        self.util = Utilities(self.bot)
+        self.util = Utilities(self.bot, self.codec)
+
+        # The refresh runs on a worker thread by default. "process" also moves the liberation math into a worker process,
+        # and "inline" keeps everything on the event loop.
+        self.executor_mode: str = settings.get("executor", "thread")
+
+        self.refresh_pool: ThreadPoolExecutor | None = ThreadPoolExecutor(max_workers=1, thread_name_prefix="hd2-refresh") if self.executor_mode in ["thread", "process"] else None
+        self.fit_pool: ProcessPoolExecutor | None = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) if self.executor_mode == "process" else None
 
-        self.cache = Cache()
+        self.cache = CacheBuffer(self.fit_pool)
+
+        # seasons (dict[int | None, CacheBuffer]): Every season still in memory, oldest first. self.cache is the current one
+        # and the only one that is polled; the others are kept read-only until there are more than "seasons" of them.
+        self.seasons: dict[int | None, CacheBuffer] = {}
+
+        # season_retry (asyncio.TimerHandle | None): The next attempt at the startup CurrentWarID fetch, if it failed.
+        self.season_retry: asyncio.TimerHandle | None = None
+        self.max_seasons: int = settings.get("seasons", 2)
+        self.rollover_task: asyncio.Task | None = None
+        self.renders = RenderCache()
+        self.loop_lag = LoopLag()
         self.endpoints: HD2.Endpoints = HD2.Endpoints()
+        self.leaderboard = LeaderboardStream(self.util, self.endpoints)
 
-        self.last_liberation_invoke: float | int = -1
+        # events (EventBus): What changed on every refresh, for other cogs. bot.get_cog("helldivers").events.listen(...)
+        self.events = EventBus(self.event_error)
+
+        # Major order, news and liberation alerts for every guild that opted in with `hd2 alerts`.
+        self.broadcasts = Broadcaster(self.bot, self.events, os.path.join(self.bot.DIRS.JSON, "hd2_broadcasts.json"), self.codec, self.event_error)
 
         self.DUMP_PATH = os.path.join(self.bot.DIRS.JSON, "hd2_dumps/")
 
+        # Dumps are written behind the polls by a background worker. The "fsync_interval" setting controls how often
+        # they are fsynced, in seconds (0 for every flush, null to leave it to the OS).
+        self.dumps = DumpWriter(self.DUMP_PATH, self.codec, self.dump_error, settings.get("fsync_interval", 60.0))
+
+        # Every WarStatus and WarStats is archived, for `hd2 history`. The "history_retention_days" and "history_max_megabytes"
+        # settings bound how much is kept.
+        self.history = HistoryArchive(
+            os.path.join(self.bot.DIRS.JSON, "hd2_history/"),
+            self.codec,
+            settings.get("history_retention_days", 7.0),
+            settings.get("history_max_megabytes", 256.0)
+        )
+
         self.war_info_initialized = asyncio.Event()
-        self.ready_900 = asyncio.Event()
-        self.ready_300 = asyncio.Event()
-        self.ready_60 = asyncio.Event()
 
-        self.get_latest_900s.start()
-        self.get_latest_300s.start()
-        self.get_latest_60s.start()
-        self.get_latest_10s.start()
+        # The payloads and liberation history are also saved together in one binary snapshot, at most every
+        # "snapshot_interval" seconds. On load it is restored before anything is fetched, so commands work right away.
+        self.snapshot_interval: float = settings.get("snapshot_interval", 60.0)
+        self.snapshot_saved: float = 0.0
+        self.snapshot_task: asyncio.Task | None = None
+
+        # Request timeouts for the slower endpoints, in seconds. Everything else uses Utilities.TIMEOUT. Retries included, a
+        # fetch never takes longer than Utilities.DEADLINE (or its own timeout, if that is longer).
+        self.timeouts: dict[str, float] = {"WarInfo": 30, "NewsFeed": 15}
+
+        # Default intervals, in seconds. GameClientConfiguration overrides them once it is fetched.
+        self.scheduler = PollScheduler(self.after_poll, self.poll_error, self.poll_scheduled, self.events_active)
+
+        # The polling id32s aren't documented, so more can be mapped with the "polling_ids" setting ({"<id32>": "<job name>"}).
+        self.scheduler.value_ids.update({int(id_32): job_name for id_32, job_name in settings.get("polling_ids", {}).items()})
+
+        for job in [
+            PollJob("GameClientConfiguration", lambda: self.poll("GameClientConfiguration"), 900),
+            PollJob("MajorOrders", lambda: self.poll("MajorOrders"), 300),
+            PollJob("WarTime", self.poll_war_time, 300),
+            PollJob("NewsFeed", lambda: self.poll("NewsFeed"), 60),
+            PollJob("CurrentWarID", self.poll_current_war_id, 60),
+            PollJob("WarStats", lambda: self.poll("WarStats"), 10, boost=True),
+            PollJob("WarStatus", lambda: self.poll("WarStatus"), 10, boost=True),
+        ]:
+            self.scheduler.add(job)
+
+        self.scheduler_task: asyncio.Task | None = None
+
+        # next_runs (dict[str, float]): When every job is next due, kept across restarts in the "schedule" dump.
+        self.next_runs: dict[str, float] = {}
 
     async def cog_load(self) -> None:
         def __war_info_initialized(task: asyncio.Task) -> None:
-            if type(res := task.result()) == dict:
-                self.cache.WarInfo = HD2.Schemas.WarInfo(res)
+            if type(res := task.result()) == tuple and type(res[0]) == dict:
+                self.dump("WarInfo", *res)
+
+                self.cache.stage("WarInfo", res[0])
                 self.war_info_initialized.set()
             else:
                 asyncio.create_task(self.bot.owner.send("Something went wrong with initializing Helldivers 2."))
 
+        def __fetch_war_season() -> None:
+            get_war_season_task = asyncio.create_task(self.util.parse(self.endpoints.CurrentWarID))
+            get_war_season_task.add_done_callback(__war_season_received)
+
         def __war_season_received(task: asyncio.Task) -> None:
             war_id = None
             if type(res := task.result()) == dict:
                 war_id = res.get("id")
 
-            self.cache.CurrentWarID = war_id
+            restored_war_id = self.cache.payloads.get("CurrentWarID")
+
+            if war_id is None:
+                # A restored season keeps being served and polled; the CurrentWarID job rolls it over if the war has
+                # changed. Without one there is nothing to poll yet, so the fetch is retried.
+                if restored_war_id is None:
+                    self.season_retry = asyncio.get_running_loop().call_later(self.SEASON_RETRY, __fetch_war_season)
+
+                return
+
+            # The restored snapshot is from a war that has since ended.
+            if restored_war_id is not None and war_id != restored_war_id:
+                self.start_rollover(war_id)
+                return
+
+            self.cache.stage("CurrentWarID", war_id)
+            self.cache.war_id = war_id
+            self.seasons[war_id] = self.cache
             self.endpoints.set_season_endpoints(war_id)
 
-            get_war_info_task = asyncio.create_task(self.util.parse(self.endpoints.WarInfo))
+            get_war_info_task = asyncio.create_task(self.util.fetch(self.endpoints.WarInfo, timeout=self.timeouts["WarInfo"]))
             get_war_info_task.add_done_callback(__war_info_initialized)
 
-        get_war_season_task = asyncio.create_task(self.util.parse(self.endpoints.CurrentWarID))
-        get_war_season_task.add_done_callback(__war_season_received)
+        self.loop_lag.start()
+        self.dumps.start()
+        self.broadcasts.start()
+
+        await self.restore_snapshot()
+
+        __fetch_war_season()
+
+        self.scheduler_task = asyncio.create_task(self.run_scheduler())
           
     async def cog_unload(self) -> None:
-        self.get_latest_900s.cancel()
-        self.get_latest_300s.cancel()
-        self.get_latest_60s.cancel()
-        self.get_latest_10s.cancel()
+        if self.scheduler_task:
+            self.scheduler_task.cancel()
+
+        if self.season_retry:
+            self.season_retry.cancel()
+
+        self.loop_lag.stop()
+
+        if self.cache.front.ready:
+            await self.save_snapshot()
+
+        await self.dumps.stop()
+
+        self.broadcasts.stop()
+
+        # Ends every subscriber's `async for`, so other cogs aren't left waiting on a bus that no longer publishes.
+        self.events.close()
+
+        for pool in [self.refresh_pool, self.fit_pool]:
+            if pool:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def dump(self, payload: str, data: Any, body: bytes | None = None) -> None:
+        self.dumps.put(payload, data, body)
+
+    def load_dump(self, payload: str) -> Any:
+        return self.dumps.get(payload)
+
+    async def dump_error(self, exception: BaseException) -> None:
+        await self.bot.base_error_handler("helldivers2.dumps", exception)
+
+    async def event_error(self, exception: BaseException) -> None:
+        await self.bot.base_error_handler("helldivers2.events", exception)
 
     async def cog_check(self, ctx) -> bool:
-        return self.cache.ready
+        return self.cache.front.ready
+
+    async def cog_before_invoke(self, ctx: commands.Context) -> None:
+        setattr(ctx, "hd2_snapshot", self.cache.pin())
+
+    async def cog_after_invoke(self, ctx: commands.Context) -> None:
+        if snapshot := getattr(ctx, "hd2_snapshot", None):
+            self.cache.unpin(snapshot)
+
+    def snapshot(self, ctx: commands.Context) -> Cache:
+        # The snapshot pinned when the command was invoked. Refreshes never modify it while the command runs.
+        return getattr(ctx, "hd2_snapshot", self.cache.front)
+
+    async def publish(self) -> None:
+        # Nothing is published until the values a snapshot needs have been staged, so one failing optional endpoint
+        # (NewsFeed, WarTime, etc.) doesn't hold back the rest.
+        if not all(payload in self.cache.payloads for payload in Cache.REQUIRED):
+            return
+
+        self.loop_lag.refreshes += 1
+        self.loop_lag.refreshing = True
+
+        try:
+            snapshot = await self.cache.publish(self.refresh_pool)
+            self.renders.invalidate(self.cache.version)
+            self.events.publish(snapshot.events)
+        finally:
+            self.loop_lag.refreshing = False
     
     async def cog_command_error(self, ctx: commands.Context, error: Exception) -> None:
         if isinstance(error, commands.CheckFailure):
             setattr(ctx, "error_handled", True)
             await ctx.reply("# Helldivers 2 is not ready!\nThe bot either just started or it has restarted the Helldivers 2 feature-set for updates. As a result, the commands are not yet available for usage. This shouldn't take long - please wait about a minute. If the bot continues to error, please notify @issu immediately.")
 
-    @tasks.loop(seconds=900)
-    async def get_latest_900s(self):        
-        payloads = {
-            "GameClientConfiguration": await self.util.parse(self.endpoints.GameClientConfiguration)
-        }
+    async def run_scheduler(self) -> None:
+        try:
+            await self.bot.wait_until_ready()
+            await self.war_info_initialized.wait()
 
-        next_iter = self.get_latest_900s.next_iteration.timestamp() if self.get_latest_900s.next_iteration else None
+            now = utils.utcnow().timestamp()
 
-        for val, data in payloads.items():
-            if type(data) == str:
-                raise ValueError(f"Invalid data type for payload (str): {data}")
+            try:
+                self.next_runs = self.load_dump("schedule") if os.path.exists(self.dumps.path("schedule")) else {}
+            except Exception:
+                self.next_runs = {}
 
-            with open(os.path.join(self.DUMP_PATH, f"{val}.json"), mode="w") as f:
-                json.dump(data, f)
-        
-            setattr(self.cache, val, getattr(HD2.Schemas, val)(data))
+            # Values whose next poll is still in the future are warm-started from their dumps instead of being fetched now.
+            for job in self.scheduler.jobs.values():
+                next_run = self.next_runs.get(job.name, 0.0)
 
-        self.bot.timer_cache("helldivers.get_latest_900s", "set", next_iter)
+                if warm := next_run > now and os.path.exists(dump_path := self.dumps.path(job.name)):
+                    try:
+                        self.cache.stage(job.name, self.load_dump(job.name))
+                        job.last_success = max(job.last_success, os.path.getmtime(dump_path))
+                    except Exception:
+                        # An unreadable dump is fetched again instead of keeping the scheduler from starting.
+                        warm = False
 
-        if not self.ready_900.is_set():
-            self.ready_900.set()
+                self.scheduler.schedule(job, next_run if warm else now)
 
-    @tasks.loop(seconds=300)
-    async def get_latest_300s(self):
-        payloads = {
-            "MajorOrders": await self.util.parse(self.endpoints.MajorOrders),
-            "WarTime": {"WarTime": await self.util.parse(self.endpoints.WarTime), "TimeSinceStart": await self.util.parse(self.endpoints.TimeSinceStart)},
-            "Leaderboard": await self.util.parse(self.endpoints.Leaderboard.get("main", ""))
-        }
+            if "GameClientConfiguration" in self.cache.payloads:
+                self.scheduler.configure(HD2.Schemas.GameClientConfiguration(self.cache.payloads["GameClientConfiguration"]).polling_configuration)
 
-        for val, data in payloads.items():
-            if type(data) == str:
-                raise ValueError(f"Invalid data type for payload (str): {data}")
+            # Publishes right away if every value was warm-started.
+            await self.after_poll(True)
 
-            with open(os.path.join(self.DUMP_PATH, f"{val}.json"), mode="w") as f:
-                json.dump(data, f)
-        
-            setattr(self.cache, val, getattr(HD2.Schemas, val)(data))
+            await self.scheduler.run()
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:
+            await self.bot.base_error_handler("helldivers2.scheduler", exc)
 
-        next_iter = self.get_latest_300s.next_iteration.timestamp() if self.get_latest_300s.next_iteration else None
+    def receive(self, payload: str, res: tuple[Any, bytes | None] | str | None, season: CacheBuffer | None = None) -> bool:
+        if type(res) == str:
+            raise ValueError(f"Invalid data type for payload (str): {res}")
 
-        self.bot.timer_cache("helldivers.get_latest_300s", "set", next_iter)
+        # Unchanged since the last poll. Nothing was decoded, and nothing is dumped, staged or published.
+        if res is None:
+            return False
 
-        if not self.ready_300.is_set():
-            self.ready_300.set()
+        # Fetched for a season that was rolled over while the request was in flight. Previous seasons are read-only.
+        if season is not None and season is not self.cache:
+            return False
 
-    @tasks.loop(seconds=60)
-    async def get_latest_60s(self):
-        payloads = {
-            "NewsFeed": await self.util.parse(self.endpoints.NewsFeed)
-        }
+        data, body = cast(tuple[Any, bytes | None], res)
 
-        for val, data in payloads.items():
-            if type(data) == str:
-                raise ValueError(f"Invalid data type for payload (str): {data}")
+        self.dump(payload, data, body)
+        self.cache.stage(payload, data)
 
-            with open(os.path.join(self.DUMP_PATH, f"{val}.json"), mode="w") as f:
-                json.dump(data, f)
+        return True
 
-            setattr(self.cache, val, getattr(HD2.Schemas, val)(data))
+    async def poll(self, payload: str, url: str | None = None) -> bool:
+        url = url or getattr(self.endpoints, payload)
+        season = self.cache
 
-        war_id = None
-        if type(res := await self.util.parse(self.endpoints.CurrentWarID)) == dict:
-            war_id = res.get("id")
+        try:
+            changed = self.receive(payload, await self.util.fetch(url, conditional=True, timeout=self.timeouts.get(payload)), season)
+        except Exception:
+            # The body was hashed but never staged, so the next poll must not be skipped as unchanged.
+            self.util.forget(url)
+            raise
 
-        old_id = self.cache.CurrentWarID
+        if changed and payload == "GameClientConfiguration":
+            self.scheduler.configure(HD2.Schemas.GameClientConfiguration(self.cache.payloads[payload]).polling_configuration)
 
-        if old_id != war_id:
-            self.cache.CurrentWarID = war_id
-            self.endpoints.set_season_endpoints(war_id)
+        if changed and payload in HistoryArchive.PAYLOADS:
+            try:
+                await self.history.record(payload, self.cache.payloads[payload])
+            except Exception as exc:
+                await self.bot.base_error_handler("helldivers2.history", exc)
 
-        next_iter = self.get_latest_60s.next_iteration.timestamp() if self.get_latest_60s.next_iteration else None
+        return changed
 
-        self.bot.timer_cache("helldivers.get_latest_60s", "set", next_iter)
+    async def poll_war_time(self) -> bool:
+        season = self.cache
 
-        current_invoke = utils.utcnow().timestamp()
-        last_invoke = self.last_liberation_invoke
-        self.last_liberation_invoke = utils.utcnow().timestamp()
+        war_time, time_since_start = await asyncio.gather(
+            self.util.parse(self.endpoints.WarTime, conditional=True),
+            self.util.parse(self.endpoints.TimeSinceStart, conditional=True),
+        )
 
-        if last_invoke != -1 and current_invoke > (last_invoke + 300):
-            self.cache.recalculate_lib_estimate(current_invoke - last_invoke)
+        for res in [war_time, time_since_start]:
+            if type(res) == str:
+                raise ValueError(f"Invalid data type for payload (str): {res}")
 
-        if not self.ready_60.is_set():
-            self.ready_60.set()
+        if war_time is None and time_since_start is None:
+            return False
 
-    @tasks.loop(seconds=10)
-    async def get_latest_10s(self):
-        payloads = {
-            "WarStats": await self.util.parse(self.endpoints.WarStats),
-            "WarStatus": await self.util.parse(self.endpoints.WarStatus)
-        }
+        # Only one of the two changed. The other one is carried over from the last poll.
+        previous = self.cache.payloads.get("WarTime")
 
-        for val, data in payloads.items():
-            if type(data) == str:
-                raise ValueError(f"Invalid data type for payload (str): {data}")
+        if previous is None and (war_time is None or time_since_start is None):
+            self.util.forget(self.endpoints.WarTime)
+            self.util.forget(self.endpoints.TimeSinceStart)
+            raise ValueError("WarTime has no previous value to carry over")
 
-            with open(os.path.join(self.DUMP_PATH, f"{val}.json"), mode="w") as f:
-                json.dump(data, f)
+        return self.receive("WarTime", ({
+            "WarTime": previous["WarTime"] if war_time is None else war_time,
+            "TimeSinceStart": previous["TimeSinceStart"] if time_since_start is None else time_since_start
+        }, None), season)
 
-            setattr(self.cache, val, getattr(HD2.Schemas, val)(data))
+    async def poll_current_war_id(self) -> bool:
+        # Not conditional: an unchanged body must still retry a rollover that failed.
+        if type(res := await self.util.parse(self.endpoints.CurrentWarID)) != dict:
+            raise ValueError(f"Invalid data type for payload (str): {res}")
 
-        next_iter = self.get_latest_10s.next_iteration.timestamp() if self.get_latest_10s.next_iteration else None
+        if (war_id := res.get("id")) is None or war_id == self.cache.war_id:
+            return False
 
-        self.bot.timer_cache("helldivers.get_latest_10s", "set", next_iter)
+        self.start_rollover(war_id)
 
-        if self.ready_900.is_set() and self.ready_300.is_set() and self.ready_60.is_set():
-            self.cache.remap()
-        
-    @get_latest_900s.before_loop
-    async def before_loop_900s(self):
-        await self.before_loop("900s")
+        return False
 
-        payloads = ["GameClientConfiguration"]
+    def start_rollover(self, war_id: int) -> None:
+        if self.rollover_task is not None and not self.rollover_task.done():
+            return
 
-        if (
-            (next_invoke := self.bot.timer_cache("helldivers.get_latest_900s")) is not None 
-            and (duration := (next_invoke - utils.utcnow().timestamp())) > 0
-            ):
-            for payload in payloads:
-                with open(os.path.join(self.DUMP_PATH, f"{payload}.json"), mode="r") as f:
-                    setattr(self.cache, payload, getattr(HD2.Schemas, payload)(json.load(f)))
+        self.rollover_task = asyncio.create_task(self.rollover(war_id))
 
-            self.ready_900.set()
+    async def rollover(self, war_id: int) -> None:
+        """Builds the new season in the background, then switches every command and poll over to it at once."""
+        try:
+            endpoints = HD2.Endpoints()
+            endpoints.set_season_endpoints(war_id)
+
+            # Versions carry on from the current season, so the render cache never mistakes one season's renders for the other's.
+            season = CacheBuffer(self.fit_pool, war_id)
+            season.version = self.cache.version
+            season.stage("CurrentWarID", war_id)
 
-            await do.sleep_async(duration)
+            results = await asyncio.gather(*[self.util.fetch(getattr(endpoints, payload), timeout=self.timeouts.get(payload)) for payload in Cache.REQUIRED])
 
-    @get_latest_300s.before_loop
-    async def before_loop_300s(self):
-        await self.before_loop("300s")
+            for payload, res in zip(Cache.REQUIRED, results):
+                if type(res) != tuple:
+                    raise ValueError(f"Invalid data type for payload (str): {res}")
 
-        payloads = ["MajorOrders", "WarTime", "Leaderboard"]
+                season.stage(payload, res[0])
 
-        if (
-            (next_invoke := self.bot.timer_cache("helldivers.get_latest_300s")) is not None 
-            and (duration := (next_invoke - utils.utcnow().timestamp())) > 0
-            ):
-            for payload in payloads:
-                with open(os.path.join(self.DUMP_PATH, f"{payload}.json"), mode="r") as f:
-                    setattr(self.cache, payload, getattr(HD2.Schemas, payload)(json.load(f)))
+            await season.publish(self.refresh_pool)
 
-                self.ready_300.set()
+            if not season.front.ready:
+                raise ValueError(f"Season {war_id} could not be built")
 
-            await do.sleep_async(duration)
+            # The switch. Nothing is awaited from here on, so a command sees either season entirely, never a mix.
+            self.seasons.pop(war_id, None)
+            self.seasons[war_id] = season
+            self.cache = season
 
-    @get_latest_60s.before_loop
-    async def before_loop_60s(self):
-        await self.before_loop("60s")
+            self.endpoints.set_season_endpoints(war_id)
+            self.renders.invalidate(season.version)
+            self.war_info_initialized.set()
 
-        payloads = ["NewsFeed"]
+            for payload, res in zip(Cache.REQUIRED, results):
+                self.dump(payload, *cast(tuple, res))
 
-        if (
-            (next_invoke := self.bot.timer_cache("helldivers.get_latest_60s")) is not None 
-            and (duration := (next_invoke - utils.utcnow().timestamp())) > 0
-            ):
-            self.ready_60.set()
+            while len(self.seasons) > self.max_seasons:
+                self.seasons.pop(next(iter(self.seasons)))
 
-            for payload in payloads:
-                with open(os.path.join(self.DUMP_PATH, f"{payload}.json"), mode="r") as f:
-                    setattr(self.cache, payload, getattr(HD2.Schemas, payload)(json.load(f)))
+            # The snapshot file still holds the previous season, so the next publish replaces it.
+            self.snapshot_saved = 0.0
 
-            await do.sleep_async(duration)
+            # Everything else (NewsFeed, WarTime, etc.) is refetched for the new season right away.
+            for job in self.scheduler.jobs.values():
+                if job.name not in season.payloads:
+                    self.scheduler.run_now(job)
+        except Exception as exc:
+            await self.bot.base_error_handler("helldivers2.rollover", exc)
 
-    @get_latest_10s.before_loop
-    async def before_loop_10s(self):
-        await self.before_loop("10s")
+    async def after_poll(self, changed: bool) -> None:
+        if not changed:
+            return
 
-        payloads = ["WarStats", "WarStatus"]
+        try:
+            await self.publish()
+        except Exception as exc:
+            await self.bot.base_error_handler("helldivers2.publish", exc)
 
-        if (
-            (next_invoke := self.bot.timer_cache("helldivers.get_latest_10s")) is not None 
-            and (duration := (next_invoke - utils.utcnow().timestamp())) > 0
-            ):
-            for payload in payloads:
-                with open(os.path.join(self.DUMP_PATH, f"{payload}.json"), mode="r") as f:
-                    setattr(self.cache, payload, getattr(HD2.Schemas, payload)(json.load(f)))
+        if self.cache.front.ready and time.time() - self.snapshot_saved >= self.snapshot_interval and (self.snapshot_task is None or self.snapshot_task.done()):
+            self.snapshot_task = asyncio.create_task(self.save_snapshot())
 
-            await do.sleep_async(duration)
-        
-    @get_latest_900s.error
-    async def loop_error_900s(self, exc: BaseException):
-        await self.loop_error("900s", exc)
+    async def save_snapshot(self) -> None:
+        try:
+            # Written through the dump writer, so it is off the loop and atomic like every other dump.
+            self.dump("snapshot.pickle", None, await self.cache.save_state())
+            self.snapshot_saved = time.time()
+        except Exception as exc:
+            await self.bot.base_error_handler("helldivers2.snapshot", exc)
+
+    async def restore_snapshot(self) -> bool:
+        if not os.path.exists(snapshot_path := self.dumps.path("snapshot.pickle")):
+            return False
+
+        try:
+            with open(snapshot_path, mode="rb") as f:
+                saved = self.cache.restore_state(f.read())
+        except Exception as exc:
+            await self.bot.base_error_handler("helldivers2.snapshot", exc)
+            return False
+
+        if saved is None or "WarInfo" not in self.cache.payloads:
+            return False
+
+        # The leaderboard used to be polled whole. It is only ever read page by page through LeaderboardStream now.
+        self.cache.payloads.pop("Leaderboard", None)
+
+        self.snapshot_saved = saved
 
-    @get_latest_300s.error
-    async def loop_error_300s(self, exc: BaseException):
-        await self.loop_error("300s", exc)
+        # The restored values are as fresh as the snapshot, which is what the stale notice should report until a poll succeeds.
+        for job in self.scheduler.jobs.values():
+            job.last_success = max(job.last_success, saved)
 
-    @get_latest_60s.error
-    async def loop_error_60s(self, exc: BaseException):
-        await self.loop_error("60s", exc)
+        if (war_id := self.cache.payloads.get("CurrentWarID")) is not None:
+            self.endpoints.set_season_endpoints(war_id)
+
+            self.cache.war_id = war_id
+            self.seasons[war_id] = self.cache
+
+        self.war_info_initialized.set()
+
+        await self.after_poll(True)
 
-    @get_latest_10s.error
-    async def loop_error_10s(self, exc: BaseException):
-        await self.loop_error("10s", exc)
+        return self.cache.front.ready
 
-    async def before_loop(self, loop: str):
-        await self.bot.wait_until_ready()
-        await self.war_info_initialized.wait()
+    async def poll_error(self, job: PollJob, exception: BaseException) -> None:
+        await self.bot.base_error_handler(f"helldivers2.poll.{job.name}", exception)
 
-    async def loop_error(self, loop: str, exception: BaseException):
-        await self.bot.base_error_handler(f"helldivers2.loop.{loop}", exception)
+    def poll_scheduled(self, job: PollJob) -> None:
+        # Written behind the polls like every other dump, so it is atomic and never touches the disk on the event loop.
+        self.next_runs[job.name] = job.next_run
+        self.dump("schedule", dict(self.next_runs))
+
+    def events_active(self) -> bool:
+        return self.cache.front.ready and len(self.cache.front.WarStatus.planet_events) > 0
+
+    def stale_notice(self) -> str | None:
+        # Commands keep answering from the last good snapshot while the API is down, but say how old it is.
+        if (stale_since := self.scheduler.stale_since(Cache.REQUIRED)) is None:
+            return None
+
+        return f"-# ⚠️ The Helldivers 2 API hasn't answered since {self.convert.to_discord(datetime.fromtimestamp(stale_since, timezone.utc))}. This data may be out of date."
 
     @commands.group(aliases=["hd", "hd2", "helldivers"], invoke_without_command=True)
     async def helldivers2(self, ctx):
@@ -1896,49 +4632,22 @@ class Cog(commands.Cog, name=name, description="Commands related to Helldivers 2
         entry = cast(str, entry)
 
         force_load = (entry := entry.lower()) == "force"
+
+        cache = self.snapshot(ctx)
         
         message = await ctx.reply(f"Getting {"all planets..." if force_load else f"info on planet {" ".join([s.capitalize() for s in str(entry).split()])}"}...", mention_author=False)
 
         if force_load:
-            title = "# 🌐 All Planets"
-
-            all_texts = []
-
-            planets_by_sector_by_faction = cast(dict[str, dict[int, list[str]]], dict.fromkeys([s.name for s in self.cache.WarInfo.sectors]))
-
-            for planet in self.cache.WarInfo.planets:
-                sector_dict = planets_by_sector_by_faction.get(planet.sector.name) or {}
-                faction_list = sector_dict.get(int(planet.status.current_faction.id)) or []
-
-                faction_list.append(planet.name)
-                sector_dict[int(planet.status.current_faction.id)] = faction_list
-                planets_by_sector_by_faction[planet.sector.name] = sector_dict
-                
-            planets_by_sector_by_faction = dict(sorted(planets_by_sector_by_faction.items()))
-
-            for init_sector, init_factions in planets_by_sector_by_faction.items():
-                planets_by_sector_by_faction[init_sector] = dict(sorted(init_factions.items()))
-
-                for init_faction, init_planets in planets_by_sector_by_faction[init_sector].items():
-                    planets_by_sector_by_faction[init_sector][init_faction] = sorted(init_planets)
-                
-            for sorted_sector, sorted_factions in planets_by_sector_by_faction.items():
-                all_texts.append(f"- {self.convert.label(sorted_sector)}" if sorted_sector != "Sol" else "- Sol System")
-
-                for sorted_faction, sorted_planets in sorted_factions.items():
-                    planet_text = "None!" if len(sorted_planets) == 0 else sorted_planets[0] if len(sorted_planets) == 1 else f"{sorted_planets[0]} and {sorted_planets[1]}" if len(sorted_planets) == 2 else f"{", ".join([p for p in sorted_planets][:-1])}, and {sorted_planets[-1]}"
-                    all_texts.append(f" - {next(f.emoji for f in self.cache.WarInfo.factions if f.id == sorted_faction)} {planet_text}")
-
-            parsed_message = f"{title}\n{"\n".join(all_texts)}"
+            parsed_message, chunks = self.renders.get("planet force", cache.version, lambda: self.render_all_planets(cache))
         else:
-            parsed_entry, success = self.util.auto_complete(entry, [planet.name for planet in self.cache.WarInfo.planets])
+            chunks = None
+
+            parsed_entry, success = cache.planet_search.search(entry)
                     
             if not success:
                 return await self.util.send(f"# The planet \"{" ".join([s.capitalize() for s in entry.split()])}\" could not be found! Check your spelling!", message)
 
-            try:
-                planet = next((planet for planet in self.cache.WarInfo.planets if planet.name == parsed_entry))
-            except:
+            if (planet := cache.planets_by_name.get(parsed_entry)) is None:
                 return await self.util.send("An error occurred while trying to get planet info.", message)
             
             current_owner = planet.status.current_faction
@@ -1977,8 +4686,8 @@ class Cog(commands.Cog, name=name, description="Commands related to Helldivers 2
                 f" - {progress_bar}",
                 f" - {progress_text}" if progress_text else None,
                 f" - **Liberation** {self.convert.to_discord(planet.status.estimated_liberation_time) if planet.status.estimated_liberation_time else "`Unfeasable right now`"}" if not is_liberated else None,
-                f" - **Liberation Rate:** `~{(planet.status.rate or 0):.6f}%/hr` ({planet.status.raw_rate or 0} HP/hr)" if not is_liberated else None,
-                f" - **Planet Regen Rate:** `-{(planet.status.regen_per_hour*100):.6f}%/hr`" if not is_liberated else None,
+                f" - **Liberation Rate:** `~{((planet.status.rate or 0)*100):.6f}%/hr` ({(planet.status.raw_rate or 0):.0f} HP/hr)" if not is_liberated else None,
+                f" - **Planet Regen Rate:** `-{(planet.status.regen_per_hour/planet.max_health*100):.6f}%/hr`" if not is_liberated else None,
                 f" - **Net Liberation Rate:** `~{(planet.status.net_rate*100):.6f}%/hr`" if not is_liberated else None,
                 f"\n> 🏹 **Attacks**",
                 f"- __Attacking__\n - {"\n - ".join([f"{atk.target.status.current_faction.emoji} {atk.target.name}" for atk in planet.conflicts.get("to", [])]) if len(planet.conflicts.get("to", [])) > 0 else "None!"}",
@@ -1988,18 +4697,321 @@ class Cog(commands.Cog, name=name, description="Commands related to Helldivers 2
 
             parsed_message = "\n".join(lines)
 
-        return await self.util.send(parsed_message, message)
+        return await self.util.send(parsed_message, message, chunks, self.stale_notice())
 
     @helldivers2.command(aliases=["campaigns"])
     async def campaign(self, ctx):
         message = await ctx.reply(f"Getting all campaigns...", mention_author=False)
-    
+
+        cache = self.snapshot(ctx)
+
+        parsed_message, chunks = self.renders.get("campaign", cache.version, lambda: self.render_campaigns(cache))
+        return await self.util.send(parsed_message, message, chunks, self.stale_notice())
+
+    def render_all_planets(self, cache: Cache) -> str:
+        title = "# 🌐 All Planets"
+
+        all_texts = []
+
+        planets_by_sector_by_faction = cast(dict[str, dict[int, list[str]]], dict.fromkeys([s.name for s in cache.WarInfo.sectors]))
+
+        for planet in cache.WarInfo.planets:
+            sector_dict = planets_by_sector_by_faction.get(planet.sector.name) or {}
+            faction_list = sector_dict.get(int(planet.status.current_faction.id)) or []
+
+            faction_list.append(planet.name)
+            sector_dict[int(planet.status.current_faction.id)] = faction_list
+            planets_by_sector_by_faction[planet.sector.name] = sector_dict
+            
+        planets_by_sector_by_faction = dict(sorted(planets_by_sector_by_faction.items()))
+
+        for init_sector, init_factions in planets_by_sector_by_faction.items():
+            planets_by_sector_by_faction[init_sector] = dict(sorted(init_factions.items()))
+
+            for init_faction, init_planets in planets_by_sector_by_faction[init_sector].items():
+                planets_by_sector_by_faction[init_sector][init_faction] = sorted(init_planets)
+            
+        for sorted_sector, sorted_factions in planets_by_sector_by_faction.items():
+            all_texts.append(f"- {self.convert.label(sorted_sector)}" if sorted_sector != "Sol" else "- Sol System")
+
+            for sorted_faction, sorted_planets in sorted_factions.items():
+                planet_text = "None!" if len(sorted_planets) == 0 else sorted_planets[0] if len(sorted_planets) == 1 else f"{sorted_planets[0]} and {sorted_planets[1]}" if len(sorted_planets) == 2 else f"{", ".join([p for p in sorted_planets][:-1])}, and {sorted_planets[-1]}"
+                all_texts.append(f" - {next(f.emoji for f in cache.WarInfo.factions if f.id == sorted_faction)} {planet_text}")
+
+        return f"{title}\n{"\n".join(all_texts)}"
+
+    def render_campaigns(self, cache: Cache) -> str:
         title = f"# All Campaigns"
-        text = "\n".join([f"- {self.convert.label(campaign.type.get(campaign.planet.status.current_faction.id == 1, "Unknown") if type(campaign.type) == dict else str(campaign.type), "Campaign")} on {campaign.planet.status.current_faction.emoji} {campaign.planet.name}" for campaign in self.cache.WarStatus.campaigns])
+        text = "\n".join([f"- {self.convert.label(campaign.type.get(campaign.planet.status.current_faction.id == 1, "Unknown") if type(campaign.type) == dict else str(campaign.type), "Campaign")} on {campaign.planet.status.current_faction.emoji} {campaign.planet.name}" for campaign in cache.WarStatus.campaigns])
 
-        parsed_message = f"{title}\n{text}"
-        return await self.util.send(parsed_message, message)
+        return f"{title}\n{text}"
     
+    @helldivers2.command(aliases=["seasons", "war", "wars"])
+    async def season(self, ctx, war_id: int | None = None):
+        if war_id is None:
+            lines = [
+                "# 🌌 Seasons",
+                *[
+                    f"- War `{season_war_id}` ({"current" if season is self.cache else "read-only"}) • snapshot `v{season.version}`{f" • `{len(season.front.WarInfo.planets)}` planets" if season.front.ready else ""}"
+                    for season_war_id, season in reversed(self.seasons.items())
+                ],
+            ]
+
+            return await ctx.reply("\n".join(lines), mention_author=False)
+
+        if (season := self.seasons.get(war_id)) is None or not season.front.ready:
+            return await ctx.reply(f"# War {war_id} isn't in memory!\nOnly the last `{self.max_seasons}` seasons are kept. See them with `hd2 seasons`.")
+
+        # Previous seasons are never published to again, so their front snapshot can be read without pinning it.
+        snapshot = season.front
+
+        lines = [
+            f"# 🌌 War {war_id}{" (current)" if season is self.cache else " (read-only)"}",
+            f"- **Planets:** `{len(snapshot.WarInfo.planets)}` • **Campaigns:** `{len(snapshot.WarStatus.campaigns)}`",
+            *[f"- {faction.emoji} **{faction.name}:** `{len(faction.current_planets)}` planets • `{faction.players:,}` players" for faction in snapshot.WarInfo.factions],
+        ]
+
+        await ctx.reply("\n".join(lines), mention_author=False)
+
+    @helldivers2.command(aliases=["lb", "rank", "ranks"])
+    async def leaderboard(self, ctx, *, entry: str | None = None):
+        if entry is None:
+            message = await ctx.reply("Getting the top of the leaderboard...", mention_author=False)
+
+            page = await self.leaderboard.fetch_page(LeaderboardStream.FIRST_PAGE)
+
+            if not page.entries:
+                return await self.util.send("# The leaderboard is empty!", message)
+
+            lines = [
+                "# 🏆 Leaderboard",
+                f"-# `{page.total_records:,}` players",
+                *[f"- **{leaderboard_entry.ranking}** {leaderboard_entry.name} • `{leaderboard_entry.score:,}` points" for leaderboard_entry in page.entries[:25]],
+            ]
+
+            return await self.util.send("\n".join(lines), message, footer=self.stale_notice())
+
+        message = await ctx.reply(f"Looking for {entry} on the leaderboard...", mention_author=False)
+
+        found, pages_read = await self.leaderboard.find(entry)
+
+        if found is None:
+            return await self.util.send(f"# \"{entry}\" isn't in the top {pages_read * self.leaderboard.page_size:,}!\n-# Searched `{pages_read}` pages.", message)
+
+        return await self.util.send("\n".join([
+            f"# 🏆 {found.name}",
+            f"- **Rank:** {found.ranking}",
+            f"- **Score:** `{found.score:,}`",
+            f"- **Experience:** `{found.experience:,}`",
+            f"-# Found after searching `{pages_read}` pages.",
+        ]), message)
+
+    @helldivers2.command(aliases=["hist", "past"])
+    async def history(self, ctx, *, entry: str | None = None):
+        if entry is None:
+            return await ctx.reply("# Which planet?\nGive a planet, like `history Malevelon Creek`.")
+
+        cache = self.snapshot(ctx)
+
+        parsed_entry, success = cache.planet_search.search(entry)
+
+        if not success:
+            return await ctx.reply(f"# Unknown planet!\n{parsed_entry}")
+
+        planet = cache.planets_by_name[parsed_entry]
+
+        message = await ctx.reply(f"Digging through the archive for {planet.name}...", mention_author=False)
+
+        def __extract(state: dict[str, Any]) -> tuple[int, int, int] | None:
+            statuses = state.get("WarStatus", {}).get("planetStatus", [])
+
+            # Statuses are ordered by planet index, but that isn't guaranteed.
+            if planet.id < len(statuses) and statuses[planet.id].get("index") == planet.id:
+                status = statuses[planet.id]
+            elif (status := next((status for status in statuses if status.get("index") == planet.id), None)) is None:
+                return None
+
+            return status.get("owner", 0), status.get("health", planet.max_health), status.get("players", 0)
+
+        # The last 24 hours, every 2 hours.
+        now = utils.utcnow().timestamp()
+        timestamps = [now - hours * 3600 for hours in range(24, -1, -2)]
+
+        samples = await self.history.read(timestamps, __extract)
+
+        lines = [
+            f"# 📜 {planet.name}: The Last 24 Hours",
+            f"-# Archive: `{self.history.size() / 2**20:.1f} MiB` since {self.convert.to_discord(datetime.fromtimestamp(oldest, timezone.utc)) if (oldest := self.history.oldest()) else "now"}",
+        ]
+
+        for timestamp, sample in zip(timestamps, samples):
+            stamp = self.convert.to_discord(datetime.fromtimestamp(timestamp, timezone.utc), "f")
+
+            if sample is None:
+                lines.append(f"- {stamp}: No data!")
+                continue
+
+            owner, health, players = sample
+            faction = cache.factions_by_id.get(owner)
+
+            lines.append(f"- {stamp}: {f"{faction.emoji} {faction.name}" if faction else "Unknown"} • `{(1 - health / planet.max_health) * 100:.4f}%` liberated • `{players:,}` players")
+
+        return await self.util.send("\n".join(lines), message, footer=self.stale_notice())
+
+    @helldivers2.command(aliases=["path", "supply"])
+    async def route(self, ctx, *, entry: str | None = None):
+        entry = cast(str, entry or "")
+        names = entry.split(" to ", 1) if " to " in entry else entry.split(None, 1)
+
+        if len(names) != 2:
+            return await ctx.reply("# Where to?\nGive two planets, like `route Super Earth to Malevelon Creek` (or `route Meridia Erata` for single-word names).")
+
+        cache = self.snapshot(ctx)
+
+        message = await ctx.reply(f"Plotting a route from {names[0].strip().title()} to {names[1].strip().title()}...", mention_author=False)
+
+        planets = []
+
+        for name in names:
+            parsed_entry, success = cache.planet_search.search(name)
+
+            if not success:
+                return await self.util.send(f"# Unknown planet!\n{parsed_entry}", message)
+
+            planets.append(cache.planets_by_name[parsed_entry])
+
+        source, target = planets
+
+        started = time.perf_counter()
+        path = cache.supply_lines.shortest_path(source.id, target.id)
+        frontline = cache.supply_lines.frontline(cache.planet_table.owner, cache.planet_table.has_status)
+        neighbors = cache.supply_lines.neighbors(target.id)
+        elapsed = (time.perf_counter() - started) * 1000
+
+        def describe(planet: HD2.Objects.Planet) -> str:
+            return f"{planet.status.current_faction.emoji} {planet.name}{" ⚔️" if frontline[planet.id] else ""}"
+
+        lines = [
+            f"# 🛰️ {source.name} → {target.name}",
+            f"- **Supply Route:** {f"`{len(path) - 1}` jumps" if path else "No supply lines connect these planets!"}",
+            *([f" {i}. {describe(cache.planets_by_id[planet_id])}" for i, planet_id in enumerate(path, start=1)] if path else []),
+            f"- **Supply Lines From {target.name}:** {", ".join([describe(cache.planets_by_id[planet_id]) for planet_id in neighbors if planet_id in cache.planets_by_id]) or "None!"}",
+            f"-# ⚔️ Frontline planet (borders another faction) • Answered in {elapsed:.2f} ms",
+        ]
+
+        return await self.util.send("\n".join(lines), message, footer=self.stale_notice())
+
+    @helldivers2.command(aliases=["polls", "scheduler"])
+    @commands.is_owner()
+    async def schedule(self, ctx):
+        lines = [
+            "# 🗓️ Polling Schedule",
+            f"- **Events Active:** {self.events_active()}",
+            f"- **Last Batch:** {", ".join(f"`{job_name}`" for job_name in self.scheduler.last_batch) or "None!"} (longest took `{self.scheduler.last_batch_duration * 1000:.0f} ms`) • **Running:** {", ".join(f"`{job_name}`" for job_name in self.scheduler.running) or "None!"}",
+            f"- **Short-Circuited:** `{self.util.not_modified + self.util.same_digest}` of `{self.util.conditional_requests}` polls (`{self.util.not_modified}` not modified, `{self.util.same_digest}` identical bodies)",
+            f"- **Retries:** `{self.util.retries}` • **Rejected By Open Circuits:** `{self.util.breaker.rejected}`",
+            f"- **Dumps:** `{self.dumps.writes}` written in `{self.dumps.flushes}` flushes, `{self.dumps.coalesced}` coalesced, `{len(self.dumps.pending)}` pending",
+            f"- **Shared Fetches:** `{self.util.coalesced}` joined one in flight, `{self.util.reused}` reused within `{self.util.TTL:g}s`",
+            *self.events.report(),
+            *self.broadcasts.report(),
+            f"- **Open Circuits:** {"None!" if not self.util.breaker.open_until else ""}",
+            *self.util.breaker.report(),
+            *[
+                f"- `{job.name}` every `{job.interval:.1f}s` (base `{job.base_interval:.0f}s`) • next {self.convert.to_discord(datetime.fromtimestamp(job.next_run, timezone.utc))} • last took `{job.last_duration * 1000:.0f} ms` • `{job.runs}` runs, `{job.unchanged}` unchanged in a row, `{job.errors}` errors"
+                for job in sorted(self.scheduler.jobs.values(), key=lambda job: job.next_run)
+            ],
+        ]
+
+        await ctx.reply("\n".join(lines), mention_author=False)
+
+    @helldivers2.command(aliases=["mem"])
+    @commands.is_owner()
+    async def memory(self, ctx):
+        message = await ctx.reply("Measuring the cache...", mention_author=False)
+
+        payloads = {}
+
+        for payload in ["WarInfo", "WarStatus", "WarStats", "MajorOrders"]:
+            payloads[payload] = self.load_dump(payload)
+
+        return await self.util.send(Cache.memory_report(payloads), message)
+
+    @helldivers2.command(aliases=["loop"])
+    @commands.is_owner()
+    async def lag(self, ctx):
+        lines = [
+            "# ⏱️ Event Loop",
+            f"- **Refresh Executor:** `{self.executor_mode}`",
+            f"- **Last Refresh:** `{self.cache.refresh_time * 1000:.2f} ms` (snapshot `v{self.cache.version}`)",
+            f"- **Render Cache:** `{self.renders.hits}` hits, `{self.renders.misses}` misses",
+            *self.loop_lag.report(),
+        ]
+
+        await ctx.reply("\n".join(lines), mention_author=False)
+
+    @helldivers2.command(aliases=["json"])
+    @commands.is_owner()
+    async def codecs(self, ctx):
+        message = await ctx.reply("Benchmarking the JSON codecs...", mention_author=False)
+
+        payloads = {}
+
+        for payload in ["WarInfo", "WarStatus"]:
+            with open(os.path.join(self.DUMP_PATH, f"{payload}.json"), mode="rb") as f:
+                payloads[payload] = f.read()
+
+        results = await asyncio.to_thread(JSONCodec.benchmark, payloads)
+
+        lines = [
+            "# 🧮 JSON Codecs",
+            f"- **In Use:** `{self.codec.name}`",
+            *[f"- `{codec_name}` {payload_name} ({len(payloads[payload_name]) / 1024:.0f} KiB): decode `{decode_time:.3f} ms`, encode `{encode_time:.3f} ms`" for codec_name, payload_name, decode_time, encode_time in results],
+        ]
+
+        return await self.util.send("\n".join(lines), message)
+
+    @helldivers2.command(aliases=["alert", "broadcast", "broadcasts"])
+    @commands.guild_only()
+    async def alerts(self, ctx, channel: discord.TextChannel | None = None, *alerts: str):
+        target = self.broadcasts.targets.get(ctx.guild.id)
+        wanted = [alert.lower() for alert in alerts]
+
+        if channel is None and not alerts:
+            if target is None:
+                return await ctx.reply(f"# Alerts are off!\nTurn them on with `hd2 alerts #channel`, optionally followed by any of {", ".join(f"`{alert}`" for alert in Broadcaster.ALERTS)}.", mention_author=False)
+
+            stats = self.broadcasts.stats.get(target.channel_id)
+
+            return await ctx.reply("\n".join([
+                "# 📣 Alerts",
+                f"- **Channel:** <#{target.channel_id}>{" (webhook)" if target.webhook_url else ""}",
+                f"- **Alerts:** {", ".join(f"`{alert}`" for alert in target.alerts)}",
+                f"- **Deliveries:** {stats.report() if stats else "None yet!"}",
+            ]), mention_author=False)
+
+        if not ctx.author.guild_permissions.manage_guild:
+            return await ctx.reply("# You can't do that!\nChanging alerts needs the Manage Server permission.")
+
+        if channel is None:
+            if wanted != ["off"]:
+                return await ctx.reply("# Which channel?\nGive a channel, like `hd2 alerts #war-room news`, or `hd2 alerts off`.")
+
+            await self.broadcasts.set_target(ctx.guild.id, None)
+
+            return await ctx.reply("# Alerts are off!", mention_author=False)
+
+        if unknown := [alert for alert in wanted if alert not in Broadcaster.ALERTS]:
+            return await ctx.reply(f"# Unknown alerts: {", ".join(f"`{alert}`" for alert in unknown)}\nPick from {", ".join(f"`{alert}`" for alert in Broadcaster.ALERTS)}.")
+
+        # A webhook gives alerts their own rate limit bucket, apart from the bot's. Channel sends are used without the permission.
+        webhook_url = target.webhook_url if target and target.channel_id == channel.id else None
+        if webhook_url is None and channel.permissions_for(ctx.guild.me).manage_webhooks:
+            webhook_url = (await channel.create_webhook(name="Helldivers 2 Alerts")).url
+
+        await self.broadcasts.set_target(ctx.guild.id, BroadcastTarget(ctx.guild.id, channel.id, [alert for alert in Broadcaster.ALERTS if not wanted or alert in wanted], webhook_url))
+
+        await ctx.reply(f"# Alerts are on!\n{", ".join(f"`{alert}`" for alert in self.broadcasts.targets[ctx.guild.id].alerts)} will be sent to {channel.mention}.", mention_author=False)
+
     @helldivers2.command(aliases=["events"])
     async def event(self, ctx, *, entry: str | None = None):
         await ctx.reply("Coming soon!")
@@ -2010,7 +5022,7 @@ class Cog(commands.Cog, name=name, description="Commands related to Helldivers 2
 
     @helldivers2.command(aliases=["statuses"])
     async def status(self, ctx, *, entry: str | None = None):
-        await ctx.reply("Hi")
+        await ctx.reply("\n".join(filter(None, ["Hi", self.stale_notice()])))
 
 async def setup(bot):
     await bot.add_cog(Cog(bot), override=True)
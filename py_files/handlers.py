@@ -112,7 +112,8 @@ class bot_handler:
             case_insensitive=bot_settings.get("case_insensitive"),
             owner_id = cls.__get_owner_id(),
             botname=botname,
-            startup_notifs=startup_notifs
+            startup_notifs=startup_notifs,
+            extension_settings=bot_settings.get("extension_settings", {})
         )
 
         cls.__setup_core(bot)
@@ -0,0 +1,374 @@
+# Offline tooling for the helldivers extension. From the repo root:
+#   python py_files/hd2_replay.py serve --speed 10      then run the bot with HELLDIVERS_API=http://127.0.0.1:8080
+#   python py_files/hd2_replay.py bench --rates 1 10 100 --ticks 12
+import os, sys, re, time, asyncio, argparse, hashlib, tracemalloc
+import aiohttp, numpy as np
+from aiohttp import web
+from datetime import datetime, timezone
+from typing import Any, Iterator
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "extensions", "disabled"))
+
+import helldivers as hd
+from codec import JSONCodec
+
+JSON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "json_files")
+
+class ReplayServer:
+    """A local stand-in for HELLDIVERS_API.
+
+    WarStatus and WarStats follow the history archive (hd2_history) at `speed` times the real rate, starting over once it
+    runs out. Everything else is served as-is from the dumps (hd2_dumps). Responses carry an ETag and honor If-None-Match.
+    """
+
+    # The payload served for each request path.
+    ROUTES = [
+        (re.compile(r"/WarSeason/Current/WarID$"), "CurrentWarID"),
+        (re.compile(r"/WarSeason/\d+/Status$"), "WarStatus"),
+        (re.compile(r"/WarSeason/\d+/WarInfo$"), "WarInfo"),
+        (re.compile(r"/WarSeason/\d+/WarTime$"), "WarTime"),
+        (re.compile(r"/WarSeason/\d+/TimeSinceStart$"), "TimeSinceStart"),
+        (re.compile(r"/Stats/War/\d+/Summary$"), "WarStats"),
+        (re.compile(r"/NewsFeed/\d+$"), "NewsFeed"),
+        (re.compile(r"/v2/Assignment/War/\d+$"), "MajorOrders"),
+        (re.compile(r"/Configuration/GameClient$"), "GameClientConfiguration"),
+        (re.compile(r"/Leaderboard/"), "Leaderboard"),
+    ]
+
+    def __init__(self, json_dir: str = JSON_DIR, speed: float = 1.0, codec: JSONCodec | None = None) -> None:
+        self.codec = codec or JSONCodec.get()
+        self.speed = speed
+
+        self.dump_dir = os.path.join(json_dir, "hd2_dumps")
+        self.archive = hd.HistoryArchive(os.path.join(json_dir, "hd2_history"), self.codec, None, None)
+
+        # static (dict[str, bytes]): The bodies that never change during a replay.
+        self.static: dict[str, bytes] = {}
+
+        # frames (Iterator): The archived (timestamp, state) records still to be replayed.
+        # frame / next_frame: The record being served, and the one after it.
+        self.frames: Iterator[tuple[float, dict[str, Any]]] = iter([])
+        self.frame: tuple[float, dict[str, Any]] | None = None
+        self.next_frame: tuple[float, dict[str, Any]] | None = None
+
+        # interval (float): How long the frame before the current one was served for, in recorded seconds.
+        self.interval: float = 0.0
+
+        # bodies (dict[str, tuple[bytes, str]]): The encoded body and ETag of every replayed payload for the current frame.
+        self.bodies: dict[str, tuple[bytes, str]] = {}
+
+        # origin (float) / started (float): The archived timestamp the replay started from, and when it started.
+        self.origin: float = 0.0
+        self.started: float = 0.0
+
+        self.runner: web.AppRunner | None = None
+
+        self.requests: int = 0
+        self.not_modified: int = 0
+        self.frames_served: int = 0
+
+    def load(self) -> None:
+        for payload in ["WarInfo", "NewsFeed", "MajorOrders", "GameClientConfiguration", "Leaderboard", "WarStatus", "WarStats"]:
+            if os.path.exists(dump_path := os.path.join(self.dump_dir, f"{payload}.json")):
+                with open(dump_path, mode="rb") as f:
+                    self.static[payload] = f.read()
+
+        if os.path.exists(dump_path := os.path.join(self.dump_dir, "WarTime.json")):
+            war_time = self.codec.load(dump_path)
+
+            for payload in ["WarTime", "TimeSinceStart"]:
+                self.static[payload] = self.codec.dumps(war_time.get(payload))
+
+        war_id = self.codec.loads(self.static["WarInfo"]).get("warId", 801) if "WarInfo" in self.static else 801
+        self.static["CurrentWarID"] = self.codec.dumps({"id": war_id})
+
+        self.restart()
+
+    def restart(self) -> None:
+        self.frames = self.archive.replay()
+        self.frame = next(self.frames, None)
+        self.next_frame = next(self.frames, None)
+        self.interval = 0.0
+        self.bodies = {}
+        self.origin = self.frame[0] if self.frame else 0.0
+        self.started = time.monotonic()
+
+    def recorded_time(self) -> float:
+        return self.origin + (time.monotonic() - self.started) * self.speed
+
+    def advance(self) -> None:
+        if self.frame is None:
+            return
+
+        now = self.recorded_time()
+
+        while self.next_frame is not None and self.next_frame[0] <= now:
+            self.interval = self.next_frame[0] - self.frame[0]
+            self.frame, self.next_frame = self.next_frame, next(self.frames, None)
+            self.bodies = {}
+            self.frames_served += 1
+
+        # The last frame has no recorded end, so it is served for as long as the one before it was before starting over.
+        if self.next_frame is None and self.interval > 0 and now >= self.frame[0] + self.interval:
+            self.restart()
+
+    def body(self, payload: str) -> tuple[bytes, str] | None:
+        self.advance()
+
+        if payload in self.bodies:
+            return self.bodies[payload]
+
+        if self.frame is not None and payload in self.frame[1]:
+            body = self.codec.dumps(self.frame[1][payload])
+        elif payload in self.static:
+            body = self.static[payload]
+        else:
+            return None
+
+        self.bodies[payload] = (body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"')
+
+        return self.bodies[payload]
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+
+        payload = next((payload for pattern, payload in self.ROUTES if pattern.search(request.path)), None)
+
+        if payload is None or (served := self.body(payload)) is None:
+            return web.Response(status=404)
+
+        body, etag = served
+
+        if request.headers.get("If-None-Match") == etag:
+            self.not_modified += 1
+            return web.Response(status=304, headers={"ETag": etag})
+
+        return web.Response(body=body, content_type="application/json", headers={"ETag": etag})
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Starts serving, and returns the URL to use as HELLDIVERS_API."""
+        self.load()
+
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self.handle)
+
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+
+        site = web.TCPSite(self.runner, host, port)
+        await site.start()
+
+        # Port 0 binds any free port.
+        return f"http://{host}:{self.runner.addresses[0][1]}"
+
+    async def stop(self) -> None:
+        if self.runner:
+            await self.runner.cleanup()
+
+class IngestBenchmark:
+    """Replays the recording through the same steps CacheBuffer.refresh takes, and times each of them per tick."""
+
+    # The live WarStatus/WarStats interval, in seconds. Ticks come every TICK / rate seconds.
+    TICK = 10.0
+
+    def __init__(self, server: ReplayServer, url: str, ticks: int = 12) -> None:
+        if ticks < 1:
+            raise ValueError(f"At least one tick is needed, got {ticks}")
+
+        self.server = server
+        self.codec = server.codec
+        self.ticks = ticks
+        self.url = url
+
+    def urls(self) -> dict[str, str]:
+        war_id = self.codec.loads(self.server.static["CurrentWarID"])["id"]
+
+        return {
+            "WarInfo": f"{self.url}/WarSeason/{war_id}/WarInfo",
+            "MajorOrders": f"{self.url}/v2/Assignment/War/{war_id}",
+            "WarStatus": f"{self.url}/WarSeason/{war_id}/Status",
+            "WarStats": f"{self.url}/Stats/War/{war_id}/Summary",
+        }
+
+    @staticmethod
+    def liberation(snapshot: hd.Cache, history: hd.PlanetHistory, now: datetime) -> hd.PlanetHistory:
+        if history.owner.size != snapshot.planet_table.size:
+            history = hd.PlanetHistory(snapshot.planet_table.size)
+
+        history.record(now.timestamp(), snapshot.planet_table)
+        snapshot.recalculate_lib_estimate(history, now)
+
+        return history
+
+    async def run(self, rate: float) -> dict[str, Any]:
+        self.server.speed = rate
+        self.server.restart()
+        frames_served = self.server.frames_served
+
+        urls = self.urls()
+        payloads: dict[str, Any] = {}
+        ticks: list[tuple[dict[str, Any], datetime]] = []
+
+        timings: dict[str, list[float]] = {"fetch": [], "parse": [], "remap": [], "liberation": [], "total": []}
+        late = 0
+        cold = 0.0
+
+        snapshot = hd.Cache()
+        history = hd.PlanetHistory()
+        loop_lag = hd.LoopLag()
+
+        async with aiohttp.ClientSession() as session:
+            for payload in ["WarInfo", "MajorOrders"]:
+                async with session.get(urls[payload]) as resp:
+                    payloads[payload] = self.codec.loads(await resp.read())
+
+            loop_lag.start()
+            started = time.perf_counter()
+
+            for tick in range(self.ticks):
+                if (delay := started + tick * self.TICK / rate - time.perf_counter()) > 0:
+                    await asyncio.sleep(delay)
+
+                tick_started = time.perf_counter()
+
+                bodies = []
+                for payload in ["WarStatus", "WarStats"]:
+                    async with session.get(urls[payload]) as resp:
+                        bodies.append((payload, await resp.read()))
+
+                fetched = time.perf_counter()
+
+                for payload, body in bodies:
+                    payloads[payload] = self.codec.loads(body)
+
+                parsed = time.perf_counter()
+
+                snapshot.sync(dict(payloads))
+                remapped = time.perf_counter()
+
+                now = datetime.fromtimestamp(self.server.frame[0], timezone.utc) if self.server.frame else datetime.now(timezone.utc)
+                history = self.liberation(snapshot, history, now)
+
+                finished = time.perf_counter()
+
+                # The first tick builds everything from scratch, so it is reported on its own.
+                if tick > 0:
+                    timings["fetch"].append(fetched - tick_started)
+                    timings["parse"].append(parsed - fetched)
+                    timings["remap"].append(remapped - parsed)
+                    timings["liberation"].append(finished - remapped)
+                    timings["total"].append(finished - tick_started)
+
+                if finished - tick_started > self.TICK / rate:
+                    late += 1
+
+                ticks.append((dict(payloads), now))
+
+                if tick == 0:
+                    cold = finished - tick_started
+
+            loop_lag.stop()
+
+        return {
+            "rate": rate,
+            "cold": cold,
+            "timings": timings,
+            "late": late,
+            "memory": self.memory(ticks),
+            "loop_lag": loop_lag,
+            "frames": self.server.frames_served - frames_served,
+        }
+
+    def memory(self, ticks: list[tuple[dict[str, Any], datetime]]) -> list[int]:
+        # The same ticks are replayed again with tracemalloc on, so the tracing overhead doesn't skew the timings.
+        snapshot = hd.Cache()
+        history = hd.PlanetHistory()
+        peaks = []
+
+        tracemalloc.start()
+
+        for payloads, now in ticks:
+            tracemalloc.reset_peak()
+            current = tracemalloc.get_traced_memory()[0]
+
+            snapshot.sync(payloads)
+            history = self.liberation(snapshot, history, now)
+
+            peaks.append(tracemalloc.get_traced_memory()[1] - current)
+
+        tracemalloc.stop()
+
+        return peaks[1:]
+
+    @staticmethod
+    def report(result: dict[str, Any]) -> list[str]:
+        def describe(values: list[float]) -> str:
+            if not values:
+                return "n/a"
+
+            array = np.array(values) * 1000
+            return f"mean {array.mean():7.2f} ms | p95 {np.percentile(array, 95):7.2f} ms | max {array.max():7.2f} ms"
+
+        memory = np.array(result["memory"] or [0]) / 1024
+
+        return [
+            f"== {result["rate"]:g}x real rate: {len(result["timings"]["total"]) + 1} ticks, {result["frames"]} archived frames advanced ==",
+            f"  cold build  {result["cold"] * 1000:7.2f} ms",
+            *[f"  {step:<11} {describe(values)}" for step, values in result["timings"].items()],
+            f"  memory      mean {memory.mean():7.0f} KiB | max {memory.max():7.0f} KiB allocated at peak per tick",
+            f"  late ticks  {result["late"]}",
+            # Everything runs on the event loop here, so the lag is that of an inline refresh.
+            f"  {result["loop_lag"].report()[0].lstrip("- ").replace("*", "").replace("`", "")}",
+        ]
+
+async def serve(args: argparse.Namespace) -> None:
+    server = ReplayServer(args.json_dir, args.speed)
+    url = await server.start(args.host, args.port)
+
+    print(f"Replaying at {args.speed:g}x on {url}. Run the bot with HELLDIVERS_API={url} to use it.")
+
+    try:
+        while True:
+            await asyncio.sleep(60)
+            print(f"{server.requests} requests, {server.not_modified} not modified, {server.frames_served} frames")
+    finally:
+        await server.stop()
+
+async def bench(args: argparse.Namespace) -> None:
+    server = ReplayServer(args.json_dir)
+    url = await server.start()
+
+    if server.frame is None:
+        print("The history archive is empty, so WarStatus and WarStats are served from the dumps and never change.")
+
+    benchmark = IngestBenchmark(server, url, args.ticks)
+
+    try:
+        for rate in args.rates:
+            print("\n".join(IngestBenchmark.report(await benchmark.run(rate))))
+    finally:
+        await server.stop()
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description="Replay recorded Helldivers 2 payloads, or benchmark ingesting them.")
+    parser.add_argument("--json-dir", default=JSON_DIR, help="The directory holding hd2_dumps and hd2_history.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="Serve the recording as a stand-in HELLDIVERS_API.")
+    serve_parser.add_argument("--speed", type=float, default=1.0)
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8080)
+
+    bench_parser = subparsers.add_parser("bench", help="Time parse, remap, liberation math and memory per tick.")
+    bench_parser.add_argument("--rates", type=float, nargs="+", default=[1.0, 10.0, 100.0])
+    bench_parser.add_argument("--ticks", type=int, default=12)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "bench" and args.ticks < 1:
+        parser.error("--ticks must be at least 1")
+
+    asyncio.run(serve(args) if args.command == "serve" else bench(args))
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,7 @@ class Bot(commands.Bot):
         
         self.all_activities: list[discord.Activity] = kwargs.get("all_activities", [])
         self.startup_notifs: dict[str, str] = kwargs.get("startup_notifs", {})
+        self.extension_settings: dict[str, dict[str, Any]] = kwargs.get("extension_settings", {})
         self.DIRS: directories.DJISSU | directories.ISSUBOT = directories.ISSUBOT() if kwargs.get("botname") == "issubot" else directories.DJISSU()
 
         # rbxtoken = os.getenv("ROBLOX_TOKEN", "").replace('"', "")
@@ -0,0 +1,46 @@
+import os, sys, unittest
+
+sys.path[:0] = [os.path.join(os.path.dirname(__file__), "..", "py_files"), os.path.join(os.path.dirname(__file__), "..", "py_files", "extensions", "disabled")]
+
+import helldivers as hd
+
+async def poll() -> bool:
+    return False
+
+async def on_batch(changed: bool) -> None:
+    pass
+
+async def on_error(job: hd.PollJob, exception: BaseException) -> None:
+    pass
+
+class ConfigureTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.scheduler = hd.PollScheduler(on_batch, on_error, lambda job: None, lambda: False)
+
+        for job in [hd.PollJob("WarStatus", poll, 10), hd.PollJob("NewsFeed", poll, 60), hd.PollJob("MajorOrders", poll, 300)]:
+            self.scheduler.add(job)
+
+    def configuration(self, intervals: dict[int, int]) -> list[hd.HD2.Objects.PollingConfiguration]:
+        return [hd.HD2.Objects.PollingConfiguration({"id32": id_32, "interval": interval}) for id_32, interval in intervals.items()]
+
+    def test_mapped_interval_overrides_default(self) -> None:
+        self.scheduler.value_ids[1234] = "WarStatus"
+        self.scheduler.configure(self.configuration({1234: 20}))
+
+        self.assertEqual(self.scheduler.jobs["WarStatus"].base_interval, 20)
+
+    def test_unmapped_jobs_take_the_closest_configured_interval(self) -> None:
+        self.scheduler.configure(self.configuration({1: 15, 2: 120, 3: 600}))
+
+        self.assertEqual(self.scheduler.jobs["WarStatus"].base_interval, 15)
+        self.assertEqual(self.scheduler.jobs["NewsFeed"].base_interval, 120)
+        self.assertEqual(self.scheduler.jobs["MajorOrders"].base_interval, 600)
+
+    def test_empty_configuration_restores_defaults(self) -> None:
+        self.scheduler.configure(self.configuration({1: 15}))
+        self.scheduler.configure([])
+
+        self.assertEqual(self.scheduler.jobs["NewsFeed"].base_interval, 60)
+
+if __name__ == "__main__":
+    unittest.main()